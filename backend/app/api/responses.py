@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core import json_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with orjson/msgspec when installed (stdlib otherwise).
+
+    Return it directly from a route, rather than setting it as the
+    response_class, so FastAPI's jsonable_encoder pass is skipped as well.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
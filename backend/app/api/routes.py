@@ -1,6 +1,11 @@
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+import asyncio
 import logging
 
+from app.core.metrics import metrics
+from app.services.outbox import registration_outbox
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["Vendor API"])
@@ -9,4 +14,20 @@ router = APIRouter(prefix="/api", tags=["Vendor API"])
 @router.get("/health")
 async def health_check():
     """Basic API health check."""
-    return {"status": "ok", "message": "Vendor API is running"}
\ No newline at end of file
+    return {"status": "ok", "message": "Vendor API is running"}
+
+
+# Registration outbox metrics
+@router.get("/health/outbox")
+async def outbox_health():
+    """Queue depth and lag of vendor registrations waiting to reach Pub/Sub."""
+    return await asyncio.to_thread(registration_outbox.stats)
+
+
+# Prometheus-style metrics
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Latency histograms, in-flight gauges and cache/outbox stats in the Prometheus text format."""
+    # Collectors may query the database, so render off the event loop
+    body = await asyncio.to_thread(metrics.render)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
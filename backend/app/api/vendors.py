@@ -1,7 +1,16 @@
 
-from app.services.dashboard_service import DashboardService
+from app.services.dashboard_service import DashboardService, OrderScanLimitError
+from app.services.bucketing import normalize_period
+from app.services.cache import dashboard_cache
+from app.services.outbox import registration_outbox
+from app.core import json_codec
+from app.core.config import settings
+from app.api.responses import FastJSONResponse
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+import asyncio
 import logging
+from datetime import date, datetime, time
 from app.models.vendor import VendorRequestCreate
 
 logger = logging.getLogger(__name__)
@@ -12,15 +21,23 @@ router = APIRouter(prefix="/api/vendor", tags=["Vendor Registration"])
 dashboard_service = DashboardService()
 
 # Dashboard endpoint - single call to get all dashboard data
-@router.get("/dashboard")
+@router.get("/dashboard", response_class=FastJSONResponse)
 async def get_dashboard_data(period: str = "daily"):
     """
     Get all dashboard data in a single optimized call.
-    Accepts 'period' query param: 'daily', 'weekly', 'monthly'.
+    Accepts 'period' query param: 'daily', 'weekly', 'monthly' (anything
+    else is served as 'daily'). Responses are cached per period (see
+    dashboard_cache settings).
     """
+    # Normalized before it becomes a cache key, so arbitrary values can't fill the cache
+    period = normalize_period(period)
     try:
-        dashboard_data = await dashboard_service.get_dashboard_data(period)
-        return dashboard_data
+        if not settings.dashboard_cache_enabled:
+            return FastJSONResponse(await dashboard_service.get_dashboard_data(period))
+        dashboard_data = await dashboard_cache.get_or_load(
+            period, lambda: dashboard_service.get_dashboard_data(period)
+        )
+        return FastJSONResponse(dashboard_data)
     except Exception as e:
         logger.error(f"Dashboard endpoint failed: {str(e)}")
         # Return error response - let frontend handle fallbacks
@@ -29,6 +46,70 @@ async def get_dashboard_data(period: str = "daily"):
             detail=f"Unable to connect to Jumpseller API: {str(e)}"
         )
 
+@router.get("/dashboard/stream")
+async def stream_dashboard_data(period: str = "daily", format: str = "ndjson"):
+    """
+    Same data as /dashboard, sent section by section as each one resolves so
+    the page can render store info and stats before the slowest call returns.
+    'format' is 'ndjson' (one {"section", "data"} object per line) or 'sse'
+    (one event per section). The last message is the 'done' section.
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    period = normalize_period(period)
+
+    async def ndjson():
+        async for section, data in dashboard_service.iter_dashboard_sections(period):
+            yield json_codec.dumps({"section": section, "data": data}) + b"\n"
+
+    async def sse():
+        async for section, data in dashboard_service.iter_dashboard_sections(period):
+            yield f"event: {section}\ndata: {json_codec.dumps(data).decode()}\n\n"
+
+    if format == "sse":
+        return StreamingResponse(sse(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+@router.get("/sales-chart", response_class=FastJSONResponse)
+async def get_sales_chart(start: date, end: date, unit: str = "day", width: int = 1):
+    """
+    Dense, zero-filled sales series for an arbitrary date range.
+    'start' and 'end' are inclusive dates in the store timezone; buckets are
+    'width' units of 'hour', 'day', 'week' or 'month'.
+    """
+    try:
+        return FastJSONResponse(await dashboard_service.get_sales_series(
+            datetime.combine(start, time()),
+            datetime.combine(end, time(23, 59, 59)),
+            unit=unit,
+            width=width
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except OrderScanLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Sales chart endpoint failed: {str(e)}")
+        raise HTTPException(
+            status_code=503, 
+            detail=f"Unable to connect to Jumpseller API: {str(e)}"
+        )
+
+@router.get("/products/low-stock", response_class=FastJSONResponse)
+async def get_low_stock_products(limit: int = 20):
+    """
+    Products that are low on or out of stock, lowest stock first.
+    Served from the in-memory product index (loaded on first use).
+    """
+    try:
+        return FastJSONResponse(await dashboard_service.get_low_stock_products(limit))
+    except Exception as e:
+        logger.error(f"Low stock endpoint failed: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Unable to connect to Jumpseller API: {str(e)}"
+        )
+
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register_vendor(vendor_data: VendorRequestCreate):
     """
@@ -58,13 +139,23 @@ async def register_vendor(vendor_data: VendorRequestCreate):
 
     print("A ENVIAR PARA O PUBSUB:", payload)  # <--- Adiciona isto para veres no terminal!
 
-    # Publish to Google Cloud Pub/Sub instead of direct API call
-    from app.clients.pubsub_client import publish_vendor_registration
-    try:
-        publish_vendor_registration(payload)
-    except Exception as e:
-        logger.error(f"Failed to publish vendor registration: {e}")
-        raise HTTPException(status_code=500, detail="Failed to process registration request.")
+    if settings.outbox_enabled:
+        # Stored locally and published to Pub/Sub by the outbox worker, so a
+        # slow or unavailable Pub/Sub doesn't fail (or lose) the registration
+        try:
+            await asyncio.to_thread(registration_outbox.enqueue, payload)
+        except Exception as e:
+            logger.error(f"Failed to store vendor registration: {e}")
+            raise HTTPException(status_code=500, detail="Failed to process registration request.")
+        registration_outbox.notify()
+    else:
+        # Publish to Google Cloud Pub/Sub instead of direct API call
+        from app.clients.pubsub_client import publish_vendor_registration_async
+        try:
+            await publish_vendor_registration_async(payload)
+        except Exception as e:
+            logger.error(f"Failed to publish vendor registration: {e}")
+            raise HTTPException(status_code=500, detail="Failed to process registration request.")
     # Removed all code related to CREATE_SELLER_URL API call. Now only publishes to Pub/Sub.
 
     return {
@@ -0,0 +1,52 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException, Request
+
+from app.core.config import settings
+from app.services.order_store import order_store
+from app.services.webhooks import (
+    ORDER_EVENTS, event_fingerprint, event_record, verify_signature, webhook_processor
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/webhooks", tags=["Webhooks"])
+
+SIGNATURE_HEADER = "Jumpseller-Hmac-Sha256"
+EVENT_HEADER = "Jumpseller-Event"
+EVENT_ID_HEADER = "Jumpseller-Event-Id"
+
+
+@router.post("/jumpseller")
+async def receive_jumpseller_webhook(request: Request):
+    """
+    Receive a signed Jumpseller webhook (order created/updated, product
+    updated) and apply it to the cached dashboard data.
+    The body must be signed with JUMPSELLER_WEBHOOK_SECRET (base64 HMAC-SHA256).
+    """
+    body = await request.body()
+    if not verify_signature(body, request.headers.get(SIGNATURE_HEADER), settings.jumpseller_webhook_secret):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Webhook body must be JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Webhook body must be a JSON object")
+
+    event = request.headers.get(EVENT_HEADER) or data.get("event") or ""
+    event_id = request.headers.get(EVENT_ID_HEADER) or event_fingerprint(event, body)
+
+    result = webhook_processor.handle(event, event_id, data)
+    if result == "processed" and event in ORDER_EVENTS and settings.order_store_enabled:
+        # Keep the local order mirror current too (upserts are idempotent)
+        try:
+            await asyncio.to_thread(order_store.upsert, [event_record(data, "order")])
+        except Exception as e:
+            logger.error(f"Failed to store webhook order: {e}")
+
+    logger.info(f"Webhook {event} ({event_id}): {result}")
+    return {"status": result}
@@ -0,0 +1,101 @@
+import time
+from typing import Callable, Dict, Hashable, Iterable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Per-key circuit breaker (one circuit per API endpoint).
+
+    After `failure_threshold` consecutive failures a circuit opens and calls
+    are rejected immediately. Once `reset_timeout` seconds have passed, a
+    single probe call is let through (half-open): success closes the circuit,
+    failure opens it for another `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._circuits: Dict[Hashable, _Circuit] = {}
+        self.rejected = 0
+
+    def _circuit(self, key: Hashable) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def state(self, key: Hashable) -> str:
+        circuit = self._circuits.get(key)
+        return circuit.state if circuit is not None else CLOSED
+
+    def is_open(self, key: Hashable) -> bool:
+        """True while calls to `key` are being rejected (open, or half-open with a probe running)."""
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state == CLOSED:
+            return False
+        if circuit.state == OPEN:
+            return self._clock() - circuit.opened_at < self.reset_timeout
+        return circuit.probing
+
+    def any_open(self, keys: Iterable[Hashable]) -> bool:
+        return any(self.is_open(key) for key in keys)
+
+    def before_call(self, key: Hashable) -> None:
+        """Raise CircuitOpenError unless a call to `key` may go ahead."""
+        circuit = self._circuit(key)
+        if circuit.state == CLOSED:
+            return
+        if circuit.state == OPEN and self._clock() - circuit.opened_at >= self.reset_timeout:
+            circuit.state = HALF_OPEN
+        if circuit.state == HALF_OPEN and not circuit.probing:
+            circuit.probing = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(f"Circuit open for '{key}'")
+
+    def record_success(self, key: Hashable) -> None:
+        circuit = self._circuit(key)
+        circuit.state = CLOSED
+        circuit.failures = 0
+        circuit.probing = False
+
+    def record_failure(self, key: Hashable) -> None:
+        circuit = self._circuit(key)
+        circuit.failures += 1
+        circuit.probing = False
+        if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+            circuit.state = OPEN
+            circuit.opened_at = self._clock()
+
+    def release(self, key: Hashable) -> None:
+        """Forget a call that ended without an outcome (e.g. cancelled), freeing the probe slot."""
+        circuit = self._circuits.get(key)
+        if circuit is not None:
+            circuit.probing = False
+
+    def snapshot(self) -> Dict[Hashable, str]:
+        return {key: circuit.state for key, circuit in self._circuits.items()}
@@ -1,25 +1,76 @@
 import httpx
+import asyncio
 import base64
-from typing import Dict, Any, Optional, List
+import random
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Awaitable, Callable
+from app.clients.circuit_breaker import CircuitBreaker
+from app.clients.rate_limit import get_store_bucket, parse_retry_after
+from app.clients.records import OrderRecord, ProductRecord, decode_orders, decode_products
+from app.core import json_codec
 from app.core.config import settings
+from app.core.metrics import metrics, track_time
+from app.core.timestamps import parse_order_date
 import logging
 
 logger = logging.getLogger(__name__)
 
+REQUEST_DURATION = metrics.histogram(
+    "jumpseller_request_duration_seconds", "Jumpseller API request latency", ["method", "endpoint"]
+)
+REQUESTS_TOTAL = metrics.counter(
+    "jumpseller_requests_total", "Jumpseller API requests by response status", ["method", "endpoint", "status"]
+)
+REQUESTS_IN_FLIGHT = metrics.gauge("jumpseller_requests_in_flight", "Jumpseller API requests awaiting a response").labels()
+RETRIES_TOTAL = metrics.counter(
+    "jumpseller_retries_total", "Jumpseller GETs retried, by the status that caused it", ["endpoint", "status"]
+)
+THROTTLE_WAIT = metrics.histogram(
+    "jumpseller_throttle_wait_seconds", "Time requests waited for the client-side rate limiter"
+).labels()
+COALESCED_TOTAL = metrics.counter(
+    "jumpseller_coalesced_requests_total", "GETs served by joining an identical in-flight request", ["endpoint"]
+)
+UNPARSED_DATES_TOTAL = metrics.counter(
+    "jumpseller_unparsed_order_dates_total", "Decoded orders whose creation date couldn't be parsed"
+).labels()
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """Endpoint with numeric ids replaced ('orders/123' -> 'orders/:id') to bound metric labels."""
+    return "/".join(":id" if part.isdigit() else part for part in endpoint.split("/"))
+
 
 class JumpsellerAPIError(Exception):
     """Custom exception for Jumpseller API errors."""
-    def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict] = None,
+        retry_after: Optional[float] = None
+    ):
         self.message = message
         self.status_code = status_code
         self.response_data = response_data
+        # Seconds the API asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
         super().__init__(self.message)
 
+    @property
+    def retryable(self) -> bool:
+        """Throttling, server errors and network failures (no status) may succeed on retry."""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
 
 class JumpsellerClient:
     """
     Jumpseller API client with Basic Authentication.
     
+    A single pooled httpx.AsyncClient is shared by all requests so connections
+    are kept alive between calls instead of re-handshaking every time.
+    
     Usage:
         client = JumpsellerClient()
         products = await client.get_products()
@@ -36,7 +87,60 @@ class JumpsellerClient:
         credentials = f"{self.login}:{self.auth_token}"
         encoded_credentials = base64.b64encode(credentials.encode()).decode()
         self.auth_header = f"Basic {encoded_credentials}"
+
+        # Long-lived pooled HTTP client, opened on app startup (or lazily on first use)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # In-flight GETs keyed by (method, endpoint, params) for request coalescing
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+        # Token bucket shared by every client of this store (None when disabled)
+        self.rate_limiter = get_store_bucket(self.login)
+
+        # Per-endpoint circuit breaker: fail fast while an endpoint keeps failing
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if settings.jumpseller_circuit_enabled:
+            self.circuit_breaker = CircuitBreaker(
+                failure_threshold=settings.jumpseller_circuit_failure_threshold,
+                reset_timeout=settings.jumpseller_circuit_reset_timeout,
+            )
         
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client from the connection settings."""
+        http2 = settings.jumpseller_http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but 'h2' is not installed; falling back to HTTP/1.1")
+                http2 = False
+
+        limits = httpx.Limits(
+            max_connections=settings.jumpseller_max_connections,
+            max_keepalive_connections=settings.jumpseller_max_keepalive_connections,
+            keepalive_expiry=settings.jumpseller_keepalive_expiry,
+        )
+        timeout = httpx.Timeout(self.timeout, connect=settings.jumpseller_connect_timeout)
+        return httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if startup hasn't run yet."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    async def startup(self) -> None:
+        """Open the shared connection pool. Called from the FastAPI startup hook."""
+        self._get_client()
+        logger.info("Jumpseller HTTP client pool opened")
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool. Called from the FastAPI shutdown hook."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("Jumpseller HTTP client pool closed")
+        self._client = None
+
     def _get_headers(self, content_type: str = "application/json") -> Dict[str, str]:
         """Get headers for API requests."""
         return {
@@ -54,6 +158,68 @@ class JumpsellerClient:
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the Jumpseller API.
+
+        GETs are idempotent, so they are retried on throttling, server and
+        network errors. Identical GETs that are already in flight are
+        coalesced: every caller awaits the same upstream request and receives
+        the same response object, so callers must treat responses as read-only.
+        """
+        if method.upper() != "GET":
+            return await self._send_request(method, endpoint, data=data, params=params)
+        if not settings.jumpseller_coalesce_gets:
+            return await self._get_with_retries(endpoint, params=params)
+
+        key = (method.upper(), endpoint, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_with_retries(endpoint, params=params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        else:
+            COALESCED_TOTAL.labels(_endpoint_label(endpoint)).inc()
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: Tuple, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        # Mark the outcome as retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def _retry_delay(self, attempt: int, error: JumpsellerAPIError) -> float:
+        """Retry-After when the API sent one, else full-jitter exponential backoff."""
+        if error.retry_after is not None:
+            return error.retry_after
+        ceiling = min(settings.jumpseller_retry_max_delay, settings.jumpseller_retry_base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    async def _get_with_retries(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Send a GET, retrying retryable failures up to jumpseller_max_retries times."""
+        attempt = 0
+        while True:
+            try:
+                return await self._send_request("GET", endpoint, params=params)
+            except JumpsellerAPIError as e:
+                if not e.retryable or attempt >= settings.jumpseller_max_retries:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                if delay > settings.jumpseller_retry_max_delay:
+                    # Don't hold the caller for longer than we'd ever back off
+                    raise
+                RETRIES_TOTAL.labels(_endpoint_label(endpoint), str(e.status_code or "error")).inc()
+                logger.warning(f"GET {endpoint} failed ({e.message}), retrying in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _send_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a single HTTP request to the Jumpseller API.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -69,9 +235,19 @@ class JumpsellerClient:
         """
         url = f"{self.base_url}/{endpoint}.json"
         headers = self._get_headers()
+        endpoint_label = _endpoint_label(endpoint)
+        status = "error"
+        # Raises CircuitOpenError without touching the network while the endpoint is failing
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_call(endpoint_label)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire()
+                if waited:
+                    THROTTLE_WAIT.observe(waited)
+            client = self._get_client()
+            with track_time(REQUEST_DURATION.labels(method, endpoint_label), REQUESTS_IN_FLIGHT):
                 response = await client.request(
                     method=method,
                     url=url,
@@ -79,46 +255,132 @@ class JumpsellerClient:
                     json=data,
                     params=params
                 )
+            status = str(response.status_code)
+            
+            # Log request for debugging
+            logger.info(f"{method} {url} -> {response.status_code}")
+            
+            # Handle different response status codes
+            if response.status_code == 200:
+                return json_codec.loads(response.content)
+            elif response.status_code == 201:
+                return json_codec.loads(response.content)
+            elif response.status_code == 204:
+                return {"success": True}
+            elif response.status_code == 401:
+                raise JumpsellerAPIError(
+                    "Authentication failed. Check your login and auth token.",
+                    status_code=401
+                )
+            elif response.status_code == 404:
+                raise JumpsellerAPIError(
+                    "Resource not found.",
+                    status_code=404
+                )
+            else:
+                error_data = None
+                try:
+                    error_data = json_codec.loads(response.content)
+                except (ValueError, httpx.DecodingError) as e:
+                    # Failed to parse JSON from response; keep error_data as None and log for debugging
+                    logger.debug("Failed to parse JSON from error response: %s", e)
                 
-                # Log request for debugging
-                logger.info(f"{method} {url} -> {response.status_code}")
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if response.status_code == 429 and self.rate_limiter is not None:
+                    # Hold back every request to this store, not just this one
+                    self.rate_limiter.pause(retry_after if retry_after is not None else settings.jumpseller_retry_base_delay)
                 
-                # Handle different response status codes
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 201:
-                    return response.json()
-                elif response.status_code == 204:
-                    return {"success": True}
-                elif response.status_code == 401:
-                    raise JumpsellerAPIError(
-                        "Authentication failed. Check your login and auth token.",
-                        status_code=401
-                    )
-                elif response.status_code == 404:
-                    raise JumpsellerAPIError(
-                        "Resource not found.",
-                        status_code=404
-                    )
-                else:
-                    error_data = None
-                    try:
-                        error_data = response.json()
-                    except (ValueError, httpx.DecodingError) as e:
-                        # Failed to parse JSON from response; keep error_data as None and log for debugging
-                        logger.debug("Failed to parse JSON from error response: %s", e)
-                    
-                    raise JumpsellerAPIError(
-                        f"API request failed with status {response.status_code}",
-                        status_code=response.status_code,
-                        response_data=error_data
-                    )
+                raise JumpsellerAPIError(
+                    f"API request failed with status {response.status_code}",
+                    status_code=response.status_code,
+                    response_data=error_data,
+                    retry_after=retry_after
+                )
                     
         except httpx.TimeoutException:
+            status = "timeout"
             raise JumpsellerAPIError("Request timeout")
         except httpx.RequestError as e:
             raise JumpsellerAPIError(f"Request error: {str(e)}")
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            REQUESTS_TOTAL.labels(method, endpoint_label, status).inc()
+            if self.circuit_breaker is not None:
+                self._record_outcome(endpoint_label, status)
+
+    def _record_outcome(self, endpoint_label: str, status: str) -> None:
+        """Timeouts, network errors and 5xx count against the endpoint's circuit; any other response closes it."""
+        if status == "cancelled":
+            self.circuit_breaker.release(endpoint_label)
+        elif not status.isdigit() or int(status) >= 500:
+            self.circuit_breaker.record_failure(endpoint_label)
+        else:
+            self.circuit_breaker.record_success(endpoint_label)
+
+    def is_circuit_open(self, *endpoints: str) -> bool:
+        """True if calls to any of these endpoints are currently being rejected."""
+        return self.circuit_breaker is not None and self.circuit_breaker.any_open(endpoints)
     
+    @staticmethod
+    def _normalize_list(response: Any, collection_key: str, item_key: str) -> List[Dict]:
+        """
+        Jumpseller may return either a dict with a collection key ('products')
+        or a plain list where each item is a dict wrapping the record under an
+        item key ('product'). Normalize both forms into a list of record dicts.
+        """
+        if isinstance(response, dict):
+            return response.get(collection_key, [])
+
+        if isinstance(response, list):
+            normalized = []
+            for item in response:
+                if isinstance(item, dict) and item_key in item:
+                    normalized.append(item.get(item_key))
+                else:
+                    normalized.append(item)
+            return normalized
+
+        # Fallback
+        return []
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[List[Dict]]],
+        page_size: int,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Yield successive pages until a short page signals the end.
+
+        Up to `prefetch` pages are requested ahead of the consumer so network
+        time overlaps with aggregation. Pages are always yielded in order.
+        """
+        prefetch = max(1, prefetch or settings.jumpseller_prefetch_pages)
+        pending: "deque[asyncio.Task]" = deque()
+        next_page = 1
+
+        def schedule() -> None:
+            nonlocal next_page
+            pending.append(asyncio.ensure_future(fetch_page(next_page)))
+            next_page += 1
+
+        for _ in range(prefetch):
+            schedule()
+        try:
+            while pending:
+                items = await pending.popleft()
+                if len(items) < page_size:
+                    if items:
+                        yield items
+                    return
+                schedule()
+                yield items
+        finally:
+            for task in pending:
+                task.cancel()
+
     # Product Management Methods
     async def get_products(self, limit: Optional[int] = None, page: Optional[int] = None) -> List[Dict]:
         """Get all products."""
@@ -128,24 +390,33 @@ class JumpsellerClient:
         if page:
             params['page'] = page
         response = await self._make_request("GET", "products", params=params)
+        return self._normalize_list(response, "products", "product")
 
-        # Jumpseller may return either a dict with a 'products' key or a plain list
-        # where each item is a dict containing a 'product' key. Normalize both forms
-        # into a list of product dicts.
-        if isinstance(response, dict):
-            return response.get("products", [])
+    async def iter_product_pages(self, page_size: Optional[int] = None) -> AsyncIterator[List[Dict]]:
+        """Stream the whole catalog page by page."""
+        page_size = page_size or settings.jumpseller_page_size
 
-        if isinstance(response, list):
-            normalized = []
-            for item in response:
-                if isinstance(item, dict) and 'product' in item:
-                    normalized.append(item.get('product'))
-                else:
-                    normalized.append(item)
-            return normalized
+        async def fetch(page: int) -> List[Dict]:
+            return await self.get_products(limit=page_size, page=page)
 
-        # Fallback
-        return []
+        async for items in self._iter_pages(fetch, page_size):
+            yield items
+
+    async def iter_products(self, page_size: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Stream every product in the catalog."""
+        async for items in self.iter_product_pages(page_size=page_size):
+            for product in items:
+                yield product
+
+    async def iter_product_records(self, page_size: Optional[int] = None) -> AsyncIterator[List[ProductRecord]]:
+        """Stream the whole catalog page by page, decoded into ProductRecords."""
+        async for items in self.iter_product_pages(page_size=page_size):
+            yield decode_products(items)
+
+    async def get_products_count(self) -> int:
+        """Get the total number of products in the store."""
+        response = await self._make_request("GET", "products/count")
+        return int(response.get("count", 0))
     
     async def get_product(self, product_id: int) -> Dict:
         """Get a specific product by ID."""
@@ -168,30 +439,87 @@ class JumpsellerClient:
         return True
     
     # Order Management Methods
-    async def get_orders(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+    async def get_orders(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None
+    ) -> List[Dict]:
         """Get orders, optionally filtered by status."""
         params = {}
         if status:
             params['status'] = status
         if limit:
             params['limit'] = limit
+        if page:
+            params['page'] = page
             
         response = await self._make_request("GET", "orders", params=params)
+        return self._normalize_list(response, "orders", "order")
 
-        # Normalize orders similar to products: support dict with 'orders' key or list
-        if isinstance(response, dict):
-            return response.get("orders", [])
+    async def iter_order_pages(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Stream orders page by page, newest first.
 
-        if isinstance(response, list):
-            normalized = []
-            for item in response:
-                if isinstance(item, dict) and 'order' in item:
-                    normalized.append(item.get('order'))
-                else:
-                    normalized.append(item)
-            return normalized
+        With `since` (naive UTC), paging stops after the first page that reaches
+        orders created before it. Pages are yielded whole, so callers still
+        apply their own date windows; the first page is always returned.
+        """
+        page_size = page_size or settings.jumpseller_page_size
 
-        return []
+        async def fetch(page: int) -> List[Dict]:
+            return await self.get_orders(status=status, limit=page_size, page=page)
+
+        pages = self._iter_pages(fetch, page_size)
+        try:
+            async for items in pages:
+                yield items
+                if since is not None:
+                    oldest = parse_order_date(items[-1].get('created_at') or items[-1].get('date'))
+                    if oldest is not None and oldest < since:
+                        break
+        finally:
+            await pages.aclose()
+
+    async def iter_orders(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """Stream orders newest first; see iter_order_pages for `since`."""
+        async for items in self.iter_order_pages(status=status, since=since, page_size=page_size):
+            for order in items:
+                yield order
+
+    async def iter_order_records(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[List[OrderRecord]]:
+        """
+        Stream orders page by page, decoded into OrderRecords; see
+        iter_order_pages for `since`. Orders with unparseable dates keep
+        created_at None and are counted in jumpseller_unparsed_order_dates_total.
+        """
+        async for items in self.iter_order_pages(status=status, since=since, page_size=page_size):
+            records, unparsed = decode_orders(items)
+            if unparsed:
+                UNPARSED_DATES_TOTAL.inc(unparsed)
+                logger.warning(f"{unparsed} of {len(records)} orders in a page had unparseable dates")
+            yield records
+
+    async def get_orders_count(self, status: Optional[str] = None) -> int:
+        """Get the total number of orders, optionally filtered by status."""
+        params = {'status': status} if status else None
+        response = await self._make_request("GET", "orders/count", params=params)
+        return int(response.get("count", 0))
     
     async def get_order(self, order_id: int) -> Dict:
         """Get a specific order by ID."""
@@ -221,13 +549,13 @@ class JumpsellerClient:
             return {
                 "name": "Made in Portugal",
                 "currency": "EUR",
-                "timezone": "Europe/Lisbon"
+                "timezone": settings.store_timezone
             }
         except Exception:
             return {
                 "name": "Made in Portugal",
                 "currency": "EUR", 
-                "timezone": "Europe/Lisbon"
+                "timezone": settings.store_timezone
             }
     
     # Health Check Method
@@ -241,4 +569,16 @@ class JumpsellerClient:
 
 
 # Global client instance
-jumpseller_client = JumpsellerClient()
\ No newline at end of file
+jumpseller_client = JumpsellerClient()
+
+def _collect_circuits():
+    breaker = jumpseller_client.circuit_breaker
+    if breaker is None:
+        return
+    yield "jumpseller_circuit_open", "1 while calls to the endpoint are rejected", "gauge", [
+        ({"endpoint": str(endpoint)}, int(breaker.is_open(endpoint))) for endpoint in breaker.snapshot()
+    ]
+    yield "jumpseller_circuit_rejected_total", "Calls rejected by an open circuit", "counter", [({}, breaker.rejected)]
+
+
+metrics.add_collector(_collect_circuits)
@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Backends selectable with MESSAGE_BUS_BACKEND
+BACKENDS = ("pubsub", "memory", "sqlite")
+
+
+def _to_asyncio_future(future) -> asyncio.Future:
+    """Bridge a Pub/Sub publish future (resolved on a background thread) to asyncio."""
+    loop = asyncio.get_running_loop()
+    result = loop.create_future()
+
+    def _copy(done):
+        if result.cancelled():
+            return
+        error = done.exception()
+        if error is not None:
+            result.set_exception(error)
+        else:
+            result.set_result(done.result())
+
+    future.add_done_callback(lambda done: loop.call_soon_threadsafe(_copy, done))
+    return result
+
+
+class MessageBus:
+    """
+    Publisher interface used for vendor registration messages.
+
+    `publish` sends messages in order and returns their ids once the backend
+    has accepted all of them; `publish_blocking` does the same for
+    synchronous callers.
+    """
+
+    name = "base"
+
+    @property
+    def is_configured(self) -> bool:
+        return True
+
+    async def ensure_configured(self) -> bool:
+        """is_configured for async callers: any blocking setup runs off the event loop."""
+        return self.is_configured
+
+    async def publish(self, messages: List[bytes]) -> List[str]:
+        raise NotImplementedError
+
+    def publish_blocking(self, messages: List[bytes]) -> List[str]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class PubSubMessageBus(MessageBus):
+    """Google Cloud Pub/Sub topic. The client is only created on first use."""
+
+    name = "pubsub"
+
+    def __init__(self):
+        self.publisher = None
+        self.topic_path = None
+        self._connected = False
+        self._lock = threading.Lock()
+
+    def connect(self) -> None:
+        """Inicializa a ligação ao Pub/Sub de forma segura (só uma vez)."""
+        with self._lock:
+            if self._connected:
+                return
+            self._connected = True
+            try:
+                # 1. Carregar caminho das credenciais
+                creds_path = settings.google_application_credentials
+
+                if creds_path and not os.path.isabs(creds_path):
+                    base_dir = os.getcwd()
+                    creds_path = os.path.join(base_dir, creds_path)
+
+                # 2. Validar existência do ficheiro
+                if not creds_path or not os.path.exists(creds_path):
+                    logger.warning(f"⚠️ Google Credentials file not found at: {creds_path}")
+                    logger.warning("Pub/Sub features will be disabled.")
+                    return
+
+                # 3. Configurar Ambiente
+                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds_path
+
+                project_id = settings.gcp_project_id
+                topic_id = settings.gcp_pubsub_topic
+
+                if not project_id or not topic_id:
+                    logger.warning("GCP Project ID or Topic ID missing in .env")
+                    return
+
+                # 4. Criar Cliente (com batching: as mensagens são agrupadas antes de enviar)
+                from google.cloud import pubsub_v1
+
+                batch_settings = pubsub_v1.types.BatchSettings(
+                    max_messages=settings.pubsub_batch_max_messages,
+                    max_bytes=settings.pubsub_batch_max_bytes,
+                    max_latency=settings.pubsub_batch_max_latency,
+                )
+                client = pubsub_v1.PublisherClient(batch_settings=batch_settings)
+                self.topic_path = client.topic_path(project_id, topic_id)
+                self.publisher = client
+
+                logger.info(f"Pub/Sub connected successfully to: {project_id} -> {topic_id}")
+
+            except Exception as e:
+                logger.error(f"Failed to initialize Google Pub/Sub: {e}")
+
+    @property
+    def is_configured(self) -> bool:
+        self.connect()
+        return self.publisher is not None and self.topic_path is not None
+
+    async def ensure_configured(self) -> bool:
+        # Creating the client loads credentials and opens channels, so keep it off the loop
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
+        return self.publisher is not None and self.topic_path is not None
+
+    def _queue(self, messages: List[bytes]) -> list:
+        # Queued back to back so the publisher sends them in the same batch
+        return [self.publisher.publish(self.topic_path, data) for data in messages]
+
+    async def publish(self, messages: List[bytes]) -> List[str]:
+        futures = self._queue(messages)
+        return list(await asyncio.gather(*(_to_asyncio_future(future) for future in futures)))
+
+    def publish_blocking(self, messages: List[bytes]) -> List[str]:
+        return [future.result() for future in self._queue(messages)]
+
+    async def close(self) -> None:
+        if self.publisher is not None:
+            await asyncio.to_thread(self.publisher.stop)
+
+
+class InMemoryMessageBus(MessageBus):
+    """
+    In-process asyncio queue, for running and load-testing without GCP.
+    Consumers read (id, data) pairs from `queue`.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.published = 0
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # Created lazily so it binds to the running event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        return self._queue
+
+    def _next_id(self) -> str:
+        self.published += 1
+        return str(self.published)
+
+    async def publish(self, messages: List[bytes]) -> List[str]:
+        ids = []
+        for data in messages:
+            message_id = self._next_id()
+            await self.queue.put((message_id, data))
+            ids.append(message_id)
+        return ids
+
+    def publish_blocking(self, messages: List[bytes]) -> List[str]:
+        ids = []
+        for data in messages:
+            message_id = self._next_id()
+            self.queue.put_nowait((message_id, data))
+            ids.append(message_id)
+        return ids
+
+
+class SQLiteMessageBus(MessageBus):
+    """
+    Appends messages to a local SQLite file, so they survive restarts and can
+    be inspected or replayed when running without GCP.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._table_ready:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, data BLOB NOT NULL, published_at TEXT NOT NULL)"
+            )
+            self._table_ready = True
+        return connection
+
+    def publish_blocking(self, messages: List[bytes]) -> List[str]:
+        published_at = datetime.utcnow().isoformat()
+        # One transaction per call: either every message is stored or none is
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    ids = [
+                        connection.execute(
+                            "INSERT INTO messages (data, published_at) VALUES (?, ?)", (data, published_at)
+                        ).lastrowid
+                        for data in messages
+                    ]
+            finally:
+                connection.close()
+        return [str(message_id) for message_id in ids]
+
+    async def publish(self, messages: List[bytes]) -> List[str]:
+        return await asyncio.to_thread(self.publish_blocking, messages)
+
+    def read(self, after_id: int = 0, limit: int = 100) -> List[Tuple[int, bytes]]:
+        """Stored messages with an id greater than `after_id`, oldest first."""
+        with self._lock:
+            connection = self._connect()
+            try:
+                return connection.execute(
+                    "SELECT id, data FROM messages WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit)
+                ).fetchall()
+            finally:
+                connection.close()
+
+
+def create_message_bus(backend: Optional[str] = None) -> MessageBus:
+    """Build the message bus named by `backend` (default: settings.message_bus_backend)."""
+    backend = (backend or settings.message_bus_backend).strip().lower()
+    if backend == "memory":
+        return InMemoryMessageBus()
+    if backend == "sqlite":
+        return SQLiteMessageBus(settings.message_bus_sqlite_path)
+    if backend != "pubsub":
+        raise ValueError(f"Unknown message bus backend '{backend}', expected one of {', '.join(BACKENDS)}")
+    return PubSubMessageBus()
+
+
+_message_bus: Optional[MessageBus] = None
+
+
+def get_message_bus() -> MessageBus:
+    """The process-wide message bus, created on first use."""
+    global _message_bus
+    if _message_bus is None:
+        _message_bus = create_message_bus()
+        logger.info(f"Using '{_message_bus.name}' message bus")
+    return _message_bus
+
+
+async def close_message_bus() -> None:
+    """Flush and close the message bus if one was created."""
+    global _message_bus
+    if _message_bus is not None:
+        await _message_bus.close()
+        _message_bus = None
@@ -1,87 +1,71 @@
-import os
 import json
 import logging
-from app.core.config import settings
-from google.cloud import pubsub_v1
+from app.clients.message_bus import get_message_bus
+from app.core.metrics import metrics, track_time
 
 logger = logging.getLogger(__name__)
 
-publisher = None
-topic_path = None
+PUBLISH_DURATION = metrics.histogram(
+    "message_bus_publish_duration_seconds", "Time until a registration's messages are confirmed", ["backend"]
+)
+PUBLISH_FAILURES = metrics.counter(
+    "message_bus_publish_failures_total", "Registration publishes that failed", ["backend"]
+)
 
-def _initialize_pubsub():
-    """Inicializa a ligação ao Pub/Sub de forma segura."""
-    global publisher, topic_path
-    
-    try:
-        # 1. Carregar caminho das credenciais
-        creds_path = settings.google_application_credentials
-        
-        if creds_path and not os.path.isabs(creds_path):
-            base_dir = os.getcwd()
-            creds_path = os.path.join(base_dir, creds_path)
-
-        # 2. Validar existência do ficheiro
-        if not creds_path or not os.path.exists(creds_path):
-            logger.warning(f"⚠️ Google Credentials file not found at: {creds_path}")
-            logger.warning("Pub/Sub features will be disabled.")
-            return
-
-        # 3. Configurar Ambiente
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = creds_path
-        
-        project_id = settings.gcp_project_id
-        topic_id = settings.gcp_pubsub_topic
+ALERT_MESSAGE = "New seller registration!"
 
-        if not project_id or not topic_id:
-            logger.warning("GCP Project ID or Topic ID missing in .env")
-            return
 
-        # 4. Criar Cliente
-        client = pubsub_v1.PublisherClient()
-        topic_path = client.topic_path(project_id, topic_id)
-        publisher = client
-        
-        logger.info(f"Pub/Sub connected successfully to: {project_id} -> {topic_id}")
-
-    except Exception as e:
-        logger.error(f"Failed to initialize Google Pub/Sub: {e}")
+def _registration_messages(data: dict):
+    """The alert and the vendor data, in the order they are published."""
+    return [ALERT_MESSAGE.encode("utf-8"), json.dumps(data).encode("utf-8")]
 
-# Inicializa ao arrancar
-_initialize_pubsub()
 
 def publish_vendor_registration(data: dict):
     """
-    Publica dados de registo de vendedor no tópico configurado.
+    Publica dados de registo de vendedor no message bus configurado
+    (Pub/Sub por omissão, ver MESSAGE_BUS_BACKEND).
     Envia duas mensagens:
     1. Mensagem de alerta: "New seller registration!"
     2. Dados do vendedor em JSON
+    Bloqueia até ambas serem confirmadas; em código async usar
+    publish_vendor_registration_async.
+    """
+    bus = get_message_bus()
+    if not bus.is_configured:
+        logger.error("Cannot publish: Pub/Sub not configured.")
+        return None
+
+    try:
+        with track_time(PUBLISH_DURATION.labels(bus.name)):
+            alert_message_id, data_message_id = bus.publish_blocking(_registration_messages(data))
+
+        logger.info(f"Vendor registration published! Alert ID: {alert_message_id}, data ID: {data_message_id}")
+        return {"alert_id": alert_message_id, "data_id": data_message_id}
+
+    except Exception as e:
+        PUBLISH_FAILURES.labels(bus.name).inc()
+        logger.error(f"Failed to publish messages: {e}")
+        raise e
+
+
+async def publish_vendor_registration_async(data: dict):
+    """
+    Versão async de publish_vendor_registration: as duas mensagens seguem no
+    mesmo batch e as confirmações são aguardadas sem bloquear o event loop.
     """
-    if not publisher or not topic_path:
+    bus = get_message_bus()
+    if not await bus.ensure_configured():
         logger.error("Cannot publish: Pub/Sub not configured.")
         return None
 
     try:
-        # 1. Enviar mensagem de alerta
-        alert_message = "New seller registration!"
-        alert_bytes = alert_message.encode("utf-8")
-        
-        future_alert = publisher.publish(topic_path, alert_bytes)
-        alert_message_id = future_alert.result()
-        
-        logger.info(f"Alert message published! ID: {alert_message_id}")
-        
-        # 2. Enviar dados do vendedor
-        message_json = json.dumps(data)
-        message_bytes = message_json.encode("utf-8")
-        
-        future_data = publisher.publish(topic_path, message_bytes)
-        data_message_id = future_data.result()
-        
-        logger.info(f"Vendor data published! ID: {data_message_id}")
-        
+        with track_time(PUBLISH_DURATION.labels(bus.name)):
+            alert_message_id, data_message_id = await bus.publish(_registration_messages(data))
+
+        logger.info(f"Vendor registration published! Alert ID: {alert_message_id}, data ID: {data_message_id}")
         return {"alert_id": alert_message_id, "data_id": data_message_id}
-            
+
     except Exception as e:
+        PUBLISH_FAILURES.labels(bus.name).inc()
         logger.error(f"Failed to publish messages: {e}")
-        raise e
\ No newline at end of file
+        raise e
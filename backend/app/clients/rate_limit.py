@@ -0,0 +1,90 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts of `burst`.
+
+    Callers reserve a token up front (the balance may go negative) and sleep
+    until it is theirs, so waiting requests are released in arrival order at
+    the configured rate without a lock. `pause` stops all requests until a
+    deadline, e.g. after the API answered 429 with a Retry-After; pauses are
+    capped at `max_pause` seconds so one long Retry-After can't stall every
+    caller (retries give up on those instead).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_pause: Optional[float] = None,
+    ):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.max_pause = max_pause
+        self._clock = clock
+        self.tokens = self.burst
+        self.updated = clock()
+        self.paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    async def acquire(self) -> float:
+        """Wait for a token. Returns the time spent waiting."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        if self.max_pause is not None:
+            seconds = min(seconds, self.max_pause)
+        self.paused_until = max(self.paused_until, self._clock() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay in seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# One bucket per store, shared by every client talking to it
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def get_store_bucket(store: str) -> Optional[TokenBucket]:
+    """The token bucket for a store login, or None when rate limiting is off."""
+    bucket = _buckets.get(store)
+    if bucket is None:
+        rate = settings.jumpseller_rate_limits.get(store, settings.jumpseller_rate_limit)
+        if not rate or rate <= 0:
+            return None
+        burst = settings.jumpseller_rate_limit_burst or None
+        bucket = _buckets[store] = TokenBucket(rate, burst, max_pause=settings.jumpseller_retry_max_delay)
+    return bucket
@@ -0,0 +1,188 @@
+import sys
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.orders import STATUS_OTHER, STATUS_PENDING, STATUS_REVENUE, get_order_total
+from app.core.timestamps import decode_dates, parse_order_date
+
+
+class OrderStatus(str, Enum):
+    """Normalized Jumpseller order status."""
+
+    PENDING = "pending"
+    PAID = "paid"
+    SHIPPED = "shipped"
+    DELIVERED = "delivered"
+    COMPLETED = "completed"
+    CANCELED = "canceled"
+    ABANDONED = "abandoned"
+    OTHER = "other"
+
+    @classmethod
+    def parse(cls, raw: Optional[str]) -> "OrderStatus":
+        key = raw.strip().lower() if isinstance(raw, str) else ''
+        return _STATUS_BY_KEY.get(key, cls.OTHER)
+
+    @property
+    def code(self) -> int:
+        """The STATUS_* code (app.core.orders) for this status."""
+        return _STATUS_CODES.get(self, STATUS_OTHER)
+
+
+_STATUS_BY_KEY = {status.value: status for status in OrderStatus}
+_STATUS_BY_KEY["cancelled"] = OrderStatus.CANCELED
+_STATUS_CODES = {
+    OrderStatus.PENDING: STATUS_PENDING,
+    OrderStatus.PAID: STATUS_REVENUE,
+    OrderStatus.SHIPPED: STATUS_REVENUE,
+    OrderStatus.DELIVERED: STATUS_REVENUE,
+    OrderStatus.COMPLETED: STATUS_REVENUE,
+}
+
+
+def _intern(value: Any) -> str:
+    # Statuses repeat across thousands of records; share one string per value
+    return sys.intern(value) if isinstance(value, str) else ''
+
+
+class OrderRecord:
+    """
+    A Jumpseller order decoded once: timestamps parsed, status normalized and
+    the total resolved through get_order_total's fallback chain. Holds only
+    what the dashboard and the order store read, in slots instead of a dict.
+    """
+
+    __slots__ = (
+        "id", "status", "status_text", "created_at", "created_at_raw",
+        "updated_at", "total", "customer_name", "items_count",
+    )
+
+    def __init__(
+        self,
+        id: Any,
+        status: OrderStatus,
+        status_text: str,
+        created_at: Optional[datetime],
+        created_at_raw: str,
+        updated_at: Optional[datetime],
+        total: float,
+        customer_name: str,
+        items_count: int,
+    ):
+        self.id = id
+        self.status = status
+        # Status as Jumpseller spelled it, for display
+        self.status_text = status_text
+        self.created_at = created_at
+        self.created_at_raw = created_at_raw
+        self.updated_at = updated_at
+        self.total = total
+        self.customer_name = customer_name
+        self.items_count = items_count
+
+    @classmethod
+    def from_api(cls, order: Dict[str, Any]) -> "OrderRecord":
+        """Decode one raw order."""
+        return cls._decode(order, parse_order_date(order.get('created_at') or order.get('date')))
+
+    @classmethod
+    def _decode(cls, order: Dict[str, Any], created_at: Optional[datetime]) -> "OrderRecord":
+        raw_date = order.get('created_at') or order.get('date')
+        status_text = _intern(order.get('status'))
+        customer = order.get('customer') or {}
+        return cls(
+            id=order.get('id'),
+            status=OrderStatus.parse(status_text),
+            status_text=status_text,
+            created_at=created_at,
+            created_at_raw=raw_date if isinstance(raw_date, str) else '',
+            updated_at=parse_order_date(order.get('updated_at')) if order.get('updated_at') else None,
+            total=get_order_total(order),
+            customer_name=customer.get('name', 'Unknown') if isinstance(customer, dict) else 'Unknown',
+            items_count=len(order.get('line_items') or []),
+        )
+
+    def __repr__(self) -> str:
+        return f"OrderRecord(id={self.id!r}, status={self.status.value}, total={self.total}, created_at={self.created_at})"
+
+
+def decode_orders(orders: Iterable[Dict[str, Any]]) -> Tuple[List[OrderRecord], int]:
+    """
+    Decode a page of raw orders into records. Returns (records, unparsed
+    dates). Dates are parsed for the whole page at once (with NumPy when
+    available), as in OrderColumns.
+    """
+    orders = [order for order in orders if isinstance(order, dict)]
+    dates, unparsed = decode_dates([order.get('created_at') or order.get('date') for order in orders])
+    if not isinstance(dates, list):
+        # datetime64[s] -> datetime, NaT -> None
+        dates = dates.tolist()
+    return [OrderRecord._decode(order, created_at) for order, created_at in zip(orders, dates)], unparsed
+
+
+class ProductRecord:
+    """A Jumpseller product reduced to the fields the catalog index and dashboard read."""
+
+    __slots__ = (
+        "id", "name", "sku", "status", "price", "stock",
+        "stock_unlimited", "stock_notification", "category_ids",
+    )
+
+    def __init__(
+        self,
+        id: Any,
+        name: str = '',
+        sku: Optional[str] = None,
+        status: str = '',
+        price: float = 0.0,
+        stock: int = 0,
+        stock_unlimited: bool = False,
+        stock_notification: bool = False,
+        category_ids: Tuple[Any, ...] = (),
+    ):
+        self.id = id
+        self.name = name
+        self.sku = sku
+        self.status = status
+        self.price = price
+        self.stock = stock
+        self.stock_unlimited = stock_unlimited
+        self.stock_notification = stock_notification
+        self.category_ids = category_ids
+
+    @property
+    def active(self) -> bool:
+        return self.status == 'active'
+
+    @classmethod
+    def from_api(cls, product: Dict[str, Any]) -> "ProductRecord":
+        try:
+            stock = int(product.get('stock') or 0)
+        except (TypeError, ValueError):
+            stock = 0
+        try:
+            price = float(product.get('price') or 0)
+        except (TypeError, ValueError):
+            price = 0.0
+        return cls(
+            id=product.get('id'),
+            name=product.get('name') or '',
+            sku=product.get('sku'),
+            status=_intern(product.get('status')),
+            price=price,
+            stock=stock,
+            stock_unlimited=bool(product.get('stock_unlimited')),
+            stock_notification=bool(product.get('stock_notification')),
+            category_ids=tuple(
+                category.get('id') if isinstance(category, dict) else category
+                for category in product.get('categories') or []
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"ProductRecord(id={self.id!r}, status={self.status!r}, stock={self.stock})"
+
+
+def decode_products(products: Iterable[Dict[str, Any]]) -> List[ProductRecord]:
+    return [ProductRecord.from_api(product) for product in products if isinstance(product, dict)]
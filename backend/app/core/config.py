@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import os
 
@@ -20,6 +20,23 @@ class Settings(BaseSettings):
     # Google Cloud Pub/Sub settings
     gcp_project_id: str = ""
     gcp_pubsub_topic: str = ""
+    # Publisher batching: a batch is sent when any limit is reached (latency in seconds)
+    pubsub_batch_max_messages: int = 100
+    pubsub_batch_max_bytes: int = 1_000_000
+    pubsub_batch_max_latency: float = 0.01
+
+    # Where registration messages go: 'pubsub', 'memory' (in-process queue) or
+    # 'sqlite' (appended to a local file); the last two need no GCP credentials
+    message_bus_backend: str = "pubsub"
+    message_bus_sqlite_path: str = "./message_bus.db"
+
+    # Vendor registrations are written to a local outbox table and published
+    # by a background worker; failed sends are retried with exponential backoff
+    outbox_enabled: bool = True
+    outbox_batch_size: int = 50
+    outbox_poll_interval: float = 5.0
+    outbox_retry_base_delay: float = 1.0
+    outbox_retry_max_delay: float = 300.0
 
     """Application settings with Jumpseller API configuration."""
 
@@ -29,8 +46,85 @@ class Settings(BaseSettings):
     jumpseller_api_base_url: str = "https://api.jumpseller.com/v1"
     jumpseller_api_timeout: int = 30
 
+    # Shared HTTP connection pool for the Jumpseller client
+    jumpseller_connect_timeout: float = 5.0
+    jumpseller_max_connections: int = 20
+    jumpseller_max_keepalive_connections: int = 10
+    jumpseller_keepalive_expiry: float = 30.0
+    # HTTP/2 needs the optional 'h2' package (pip install "httpx[http2]")
+    jumpseller_http2: bool = False
+    # Share one upstream response between concurrent identical GETs
+    jumpseller_coalesce_gets: bool = True
+    # Shared secret used to sign Jumpseller webhooks (requests are rejected while empty)
+    jumpseller_webhook_secret: str = ""
+    # Client-side token bucket per store, to stay under the Jumpseller API quota
+    # (requests/second, 0 disables; JUMPSELLER_RATE_LIMITS is a JSON object of
+    # per-store-login overrides)
+    jumpseller_rate_limit: float = 4.0
+    jumpseller_rate_limit_burst: int = 8
+    jumpseller_rate_limits: Dict[str, float] = {}
+    # GETs are retried on 429, 5xx and network errors with jittered exponential
+    # backoff (seconds); a longer Retry-After than the max delay is not waited for
+    jumpseller_max_retries: int = 3
+    jumpseller_retry_base_delay: float = 0.5
+    jumpseller_retry_max_delay: float = 10.0
+    # Circuit breaker: after this many consecutive failures (timeouts, network
+    # errors, 5xx) an endpoint is skipped for reset_timeout seconds, then probed
+    jumpseller_circuit_enabled: bool = True
+    jumpseller_circuit_failure_threshold: int = 5
+    jumpseller_circuit_reset_timeout: float = 30.0
+    # Pagination for full order/product scans (200 is the most Jumpseller allows per page)
+    jumpseller_page_size: int = 200
+    jumpseller_prefetch_pages: int = 2
+
+    # Store timezone: sales chart days, weeks and months follow its midnight
+    store_timezone: str = "Europe/Lisbon"
+
+    # Dashboard payload cache (seconds); stale entries are served while refreshing
+    dashboard_cache_enabled: bool = True
+    dashboard_cache_ttl: float = 30.0
+    dashboard_cache_stale_ttl: float = 300.0
+    dashboard_cache_max_entries: int = 128
+
+    # Time budget per dashboard section in seconds (0 disables); sections that miss
+    # it are sent as placeholders. DASHBOARD_SECTION_TIMEOUTS overrides it per
+    # section ('orders_summary', 'recent_orders', 'sales_chart', 'products',
+    # 'store_info') as a JSON object
+    dashboard_section_timeout: float = 10.0
+    dashboard_section_timeouts: Dict[str, float] = {}
+    # Most order pages a dashboard request may read from the API (0 disables the
+    # cap); longer windows are reported as degraded, so large stores should
+    # enable the order store for weekly/monthly charts
+    dashboard_max_scan_pages: int = 25
+
+    # Local order mirror: when enabled the dashboard reads orders from the database,
+    # kept current by a background delta sync (interval in seconds). Delta syncs
+    # only re-read orders created within the lookback, so every full sync
+    # interval (seconds, 0 disables) all orders are re-read to pick up late
+    # changes to older ones
+    order_store_enabled: bool = False
+    order_store_sync_interval: float = 60.0
+    order_store_sync_lookback_days: int = 30
+    order_store_full_sync_interval: float = 86400.0
+
+    # In-memory product catalog index: answers the products card and low-stock
+    # queries without scanning the API, reloaded in full every interval (seconds)
+    product_index_enabled: bool = True
+    product_index_refresh_interval: float = 300.0
+    product_low_stock_threshold: int = 5
+
     # Sentry Telemetry
     sentry_dsn: Optional[str] = None
+    # Environment reported to Sentry (falls back to ENVIRONMENT, then 'development');
+    # it also picks the default trace sampling rates in app.core.telemetry
+    sentry_environment: Optional[str] = None
+    # Trace sampling overrides (0.0-1.0). Route rates are a JSON object keyed by
+    # path prefix, e.g. {"/api/vendor/dashboard": 0.05}; the longest prefix wins
+    sentry_traces_default_rate: Optional[float] = None
+    sentry_traces_error_rate: Optional[float] = None
+    sentry_traces_route_rates: Dict[str, float] = {}
+    # Responses with at least this status count as errors for sampling
+    sentry_traces_error_status: int = 500
     
     # --- CORREÇÃO ADICIONADA ---
     # Database URL (usa um ficheiro sqlite local como fallback)
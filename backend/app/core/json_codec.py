@@ -0,0 +1,61 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec installed
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+
+def _default(obj: Any) -> Any:
+    """Types the encoders don't handle natively, converted as jsonable_encoder would."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "item"):
+        # NumPy scalars from the columnar aggregation
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode to compact UTF-8 JSON with orjson or msgspec, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    if msgspec is not None:
+        return msgspec.json.encode(obj, enc_hook=_default)
+    # NaN/Infinity aren't valid JSON; refuse them as Starlette's JSONResponse does
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON with orjson or msgspec, else the stdlib. Raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
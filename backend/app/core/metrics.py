@@ -0,0 +1,218 @@
+import logging
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from a cached lookup to an upstream timeout
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """Fixed-bucket histogram: one bisect and three additions per observation."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        # Per-bucket (not cumulative) counts; the last slot is +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricFamily:
+    """A named metric and its children, one per combination of label values."""
+
+    def __init__(self, name: str, documentation: str, kind: str, labelnames: Sequence[str] = (), factory=None):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[LabelValues, object] = {}
+
+    def labels(self, *values: str):
+        """Child metric for these label values (created on first use)."""
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, self._factory())
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            if isinstance(child, Histogram):
+                cumulative = 0
+                bounds = list(child.bounds) + [math.inf]
+                for bound, count in zip(bounds, list(child.counts)):
+                    cumulative += count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+                labels = _format_labels(self.labelnames, values)
+                lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+                lines.append(f"{self.name}_count{labels} {child.count}")
+            else:
+                lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}")
+        return lines
+
+
+# A collector returns (name, help, type, [(label dict, value), ...]) tuples at scrape time
+Sample = Tuple[Dict[str, str], float]
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+
+
+class MetricsRegistry:
+    """
+    In-process metrics rendered in the Prometheus text format.
+
+    Updates are plain attribute increments with no locking: they happen on
+    the event loop thread, so they are cheap enough to leave on in
+    production. Values that already live elsewhere (cache and outbox stats)
+    are read by collectors when /api/metrics is scraped.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Collector] = []
+
+    def _register(self, name, documentation, kind, labelnames, factory) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = MetricFamily(name, documentation, kind, labelnames, factory)
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(name, documentation, "counter", labelnames, Counter)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(name, documentation, "gauge", labelnames, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily:
+        bounds = tuple(sorted(buckets))
+        return self._register(name, documentation, "histogram", labelnames, lambda: Histogram(bounds))
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.extend(family.render())
+        for collector in self._collectors:
+            try:
+                collected = list(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+                continue
+            for name, documentation, kind, samples in collected:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class track_time:
+    """
+    Context manager observing the elapsed time into a histogram child, and
+    optionally counting the block as in flight on a gauge child.
+    """
+
+    __slots__ = ("histogram", "in_flight", "started")
+
+    def __init__(self, histogram: Histogram, in_flight: Optional[Gauge] = None):
+        self.histogram = histogram
+        self.in_flight = in_flight
+        self.started = 0.0
+
+    def __enter__(self) -> "track_time":
+        if self.in_flight is not None:
+            self.in_flight.inc()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.started)
+        if self.in_flight is not None:
+            self.in_flight.dec()
+
+
+class InFlightMiddleware:
+    """Pure ASGI middleware counting HTTP requests in flight and their duration."""
+
+    def __init__(self, app, registry: "MetricsRegistry"):
+        self.app = app
+        self.in_flight = registry.gauge("http_requests_in_flight", "HTTP requests being served").labels()
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "HTTP request duration by method", ["method"]
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_time(self.duration.labels(scope.get("method", "")), self.in_flight):
+            await self.app(scope, receive, send)
+
+
+# Process-wide registry served at /api/metrics
+metrics = MetricsRegistry()
@@ -0,0 +1,50 @@
+from typing import Any, Dict, Optional
+
+# Order statuses that count towards revenue and sales
+REVENUE_STATUSES = {'completed', 'shipped', 'delivered', 'paid'}
+
+# Compact status codes used by the columnar aggregation path and order records
+STATUS_OTHER = 0
+STATUS_PENDING = 1
+STATUS_REVENUE = 2
+
+
+def get_order_total(order: Dict[str, Any]) -> float:
+    """Resolve an order total from the first usable field, falling back to line items."""
+    for key in ('total', 'total_price', 'grand_total', 'amount'):
+        val = order.get(key)
+        if val is not None:
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                # non-numeric or unexpected type
+                pass
+    totals = order.get('totals') or {}
+    for key in ('total', 'grand_total', 'amount'):
+        val = totals.get(key)
+        if val is not None:
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                # totals field may be malformed or non-numeric
+                pass
+    total = 0.0
+    for li in order.get('line_items', []) or []:
+        try:
+            price = float(li.get('price', 0) or 0)
+            qty = int(li.get('quantity', 1) or 1)
+            total += price * qty
+        except (TypeError, ValueError):
+            # skip malformed line item
+            continue
+    return total
+
+
+def status_code(status: Optional[str]) -> int:
+    """Map a raw Jumpseller status to one of the STATUS_* codes."""
+    key = (status or '').strip().lower()
+    if key == 'pending':
+        return STATUS_PENDING
+    if key in REVENUE_STATUSES:
+        return STATUS_REVENUE
+    return STATUS_OTHER
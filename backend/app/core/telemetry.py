@@ -0,0 +1,152 @@
+import logging
+import os
+import random
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Trace sampling defaults per environment; Settings values override them
+TRACE_SAMPLING_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "production": {
+        "default": 0.05,
+        "error": 0.5,
+        "routes": {"/api/vendor/register": 1.0, "/api/vendor/dashboard": 0.01, "/api/health": 0.0},
+    },
+    "staging": {
+        "default": 0.2,
+        "error": 1.0,
+        "routes": {"/api/vendor/register": 1.0, "/api/vendor/dashboard": 0.1, "/api/health": 0.0},
+    },
+    "development": {
+        "default": 1.0,
+        "error": 1.0,
+        "routes": {"/api/health": 0.0},
+    },
+}
+
+_sentry_initialized = False
+
+
+def get_environment() -> str:
+    return settings.sentry_environment or os.getenv("ENVIRONMENT", "development")
+
+
+class TraceSamplingPolicy:
+    """
+    Decides which requests are traced.
+
+    Each request is sampled at the rate of the longest matching path prefix
+    in `route_rates` (or `default_rate`). Errors can be kept at a higher
+    `error_rate`, but the status is only known once the request is done:
+    such routes are sampled at the error rate up front, and successful
+    transactions are then thinned back down to the route rate before they
+    are sent.
+    """
+
+    def __init__(
+        self,
+        default_rate: float,
+        error_rate: float,
+        route_rates: Dict[str, float],
+        error_status: int = 500,
+        rand: Callable[[], float] = random.random,
+    ):
+        self.default_rate = default_rate
+        self.error_rate = error_rate
+        self.error_status = error_status
+        # Longest prefix first, so the first match is the most specific one
+        self.route_rates = sorted(route_rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._rand = rand
+
+    @classmethod
+    def from_settings(cls, environment: Optional[str] = None) -> "TraceSamplingPolicy":
+        defaults = TRACE_SAMPLING_DEFAULTS.get(environment or get_environment(), TRACE_SAMPLING_DEFAULTS["production"])
+        default_rate = settings.sentry_traces_default_rate
+        error_rate = settings.sentry_traces_error_rate
+        return cls(
+            default_rate=defaults["default"] if default_rate is None else default_rate,
+            error_rate=defaults["error"] if error_rate is None else error_rate,
+            route_rates={**defaults["routes"], **settings.sentry_traces_route_rates},
+            error_status=settings.sentry_traces_error_status,
+        )
+
+    def rate_for_path(self, path: Optional[str]) -> float:
+        if path:
+            for prefix, rate in self.route_rates:
+                if path.startswith(prefix):
+                    return rate
+        return self.default_rate
+
+    def _head_rate(self, route_rate: float) -> float:
+        # Routes turned off entirely (e.g. health checks) stay off for errors too
+        return max(route_rate, self.error_rate) if route_rate > 0 else 0.0
+
+    def traces_sampler(self, sampling_context: Dict[str, Any]) -> float:
+        """Sentry `traces_sampler`: the probability of tracing this transaction."""
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            # Keep distributed traces whole
+            return float(parent_sampled)
+        scope = sampling_context.get("asgi_scope") or {}
+        path = scope.get("path") or (sampling_context.get("transaction_context") or {}).get("name")
+        return self._head_rate(self.rate_for_path(path))
+
+    def before_send_transaction(self, event: Dict[str, Any], hint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Drop the extra successful transactions sampled only in case they failed."""
+        if self._is_error(event):
+            return event
+        route_rate = self.rate_for_path(self._event_path(event))
+        head_rate = self._head_rate(route_rate)
+        if head_rate <= route_rate or self._rand() < route_rate / head_rate:
+            return event
+        return None
+
+    def _is_error(self, event: Dict[str, Any]) -> bool:
+        status = (event.get("tags") or {}).get("http.status_code")
+        if status is not None:
+            try:
+                return int(status) >= self.error_status
+            except ValueError:
+                pass
+        trace_status = ((event.get("contexts") or {}).get("trace") or {}).get("status")
+        return trace_status in ("internal_error", "unknown_error")
+
+    @staticmethod
+    def _event_path(event: Dict[str, Any]) -> Optional[str]:
+        url = (event.get("request") or {}).get("url")
+        if url:
+            return urlparse(url).path
+        return event.get("transaction")
+
+
+def init_sentry() -> bool:
+    """
+    Initialize Sentry once, if a DSN is configured. Called when app.main is
+    imported, before the app is built, so the FastAPI integration instruments
+    every route; sentry_sdk itself is only imported when a DSN is set, so
+    this stays cheap otherwise. Returns True when Sentry is active.
+    """
+    global _sentry_initialized
+    if _sentry_initialized:
+        return True
+    if not settings.sentry_dsn:
+        return False
+
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+
+    environment = get_environment()
+    policy = TraceSamplingPolicy.from_settings(environment)
+    sentry_sdk.init(
+        dsn=settings.sentry_dsn,
+        integrations=[FastApiIntegration()],
+        environment=environment,
+        traces_sampler=policy.traces_sampler,
+        before_send_transaction=policy.before_send_transaction,
+    )
+    _sentry_initialized = True
+    logger.info(f"Sentry telemetry initialized for backend ({environment}, default trace rate {policy.default_rate}).")
+    return True
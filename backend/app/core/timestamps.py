@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple
+
+# NumPy module once resolved (None when not installed); _UNRESOLVED until first use
+_UNRESOLVED = object()
+_numpy: Any = _UNRESOLVED
+
+# Jumpseller's usual shape: 'YYYY-MM-DD HH:MM:SS UTC'
+_FIXED_LENGTHS = (19, 23)
+
+
+def load_numpy() -> Any:
+    """
+    NumPy, imported on first use so it stays off the app's import path,
+    or None when it isn't installed.
+    """
+    global _numpy
+    if _numpy is _UNRESOLVED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised only without numpy installed
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def is_fixed_layout(value: str) -> bool:
+    """True when `value` has the fixed 'YYYY-MM-DD HH:MM:SS[ UTC]' layout."""
+    return (
+        len(value) in _FIXED_LENGTHS
+        and value[4] == '-' and value[7] == '-' and value[10] == ' '
+        and value[13] == ':' and value[16] == ':'
+        and (len(value) == 19 or value[19:] == ' UTC')
+    )
+
+
+def _parse_fixed(value: str) -> Optional[datetime]:
+    """Slice a fixed-layout timestamp without going through strptime."""
+    try:
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19])
+        )
+    except ValueError:
+        return None
+
+
+def _parse_general(value: str) -> Optional[datetime]:
+    """Slow path: strptime on the Jumpseller layout, then ISO 8601."""
+    try:
+        return datetime.strptime(value.replace(' UTC', '').strip(), '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@lru_cache(maxsize=16384)
+def parse_order_date(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a Jumpseller timestamp ('2025-11-03 14:20:00 UTC' or ISO 8601)
+    into a naive UTC datetime. Returns None when the value can't be parsed.
+    Results are memoized, so repeated values cost a dict lookup.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    if is_fixed_layout(date_str):
+        parsed = _parse_fixed(date_str)
+        if parsed is not None:
+            return parsed
+    return _parse_general(date_str)
+
+
+@lru_cache(maxsize=16384)
+def _parse_iso_first(value: str) -> Optional[datetime]:
+    """Memoized parser for batches detected as ISO 8601: skips the strptime attempt."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return parse_order_date(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class TimestampBatchParser:
+    """
+    Parser for one batch of timestamps (e.g. a page of orders).
+
+    The format is detected from the first value. Batches in the fixed
+    Jumpseller layout go through the slicing parser; anything else tries
+    fromisoformat first instead of failing through strptime on every row.
+    Empty values are counted as `missing` and unparseable ones as `failed`
+    so callers can report them instead of silently dropping rows.
+    """
+
+    __slots__ = ("parsed", "missing", "failed", "_parse")
+
+    def __init__(self):
+        self.parsed = 0
+        self.missing = 0
+        self.failed = 0
+        self._parse = None
+
+    def __call__(self, value: Optional[str]) -> Optional[datetime]:
+        if not value or not isinstance(value, str):
+            self.missing += 1
+            return None
+        if self._parse is None:
+            self._parse = parse_order_date if is_fixed_layout(value) else _parse_iso_first
+
+        result = self._parse(value)
+        if result is None:
+            self.failed += 1
+        else:
+            self.parsed += 1
+        return result
+
+
+def decode_dates(raw_dates: Sequence[Optional[str]]) -> Tuple[Any, int]:
+    """
+    Decode a batch of raw order dates. Returns (dates, unparsed count).
+
+    When every present value has the fixed Jumpseller layout, NumPy parses the
+    whole batch in C; otherwise (or if that fails) each value goes through
+    TimestampBatchParser so bad values are counted rather than fatal.
+    """
+    np = load_numpy()
+    if np is not None:
+        present = [value for value in raw_dates if value]
+        if present and all(isinstance(value, str) and is_fixed_layout(value) for value in present):
+            try:
+                return np.array(
+                    [value[:19] if value else "NaT" for value in raw_dates], dtype="datetime64[s]"
+                ), 0
+            except ValueError:
+                # e.g. an out-of-range month; parse row by row to find and count it
+                pass
+    parse_date = TimestampBatchParser()
+    return [parse_date(value) for value in raw_dates], parse_date.failed
@@ -1,4 +1,4 @@
-from sqlmodel import create_engine, Session
+from sqlmodel import SQLModel, create_engine, Session
 import logging
 
 from app.core.config import settings
@@ -8,18 +8,39 @@ logger = logging.getLogger(__name__)
 # Use the centralized pydantic settings (which reads .env via Settings.Config)
 DATABASE_URL = settings.database_url
 
-# Create engine and log the resolved URL with password hidden for safety
-engine = create_engine(DATABASE_URL, echo=False)
-try:
-    # SQLAlchemy URL object supports rendering with hidden password
-    masked = engine.url.render_as_string(hide_password=True)
-except Exception:
-    masked = str(DATABASE_URL)
+_engine = None
 
-logger.info(f"Using database URL: {masked}")
+
+def get_engine():
+    """Return the shared engine, creating it on first use rather than at import."""
+    global _engine
+    if _engine is None:
+        # Create engine and log the resolved URL with password hidden for safety
+        _engine = create_engine(DATABASE_URL, echo=False)
+        try:
+            # SQLAlchemy URL object supports rendering with hidden password
+            masked = _engine.url.render_as_string(hide_password=True)
+        except Exception:
+            masked = str(DATABASE_URL)
+
+        logger.info(f"Using database URL: {masked}")
+    return _engine
+
+
+def __getattr__(name):
+    # Keeps `from app.db import engine` working without an import-time engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session():
     """Dependency to get database session."""
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
+
+
+def init_db():
+    """Create any missing tables for the SQLModel models."""
+    import app.models  # noqa: F401  (register table models on the metadata)
+    SQLModel.metadata.create_all(get_engine())
@@ -5,35 +5,72 @@ from fastapi.middleware.cors import CORSMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware 
 from app.api.routes import router as jumpseller_router
 from app.core.config import settings
+from app.core.metrics import InFlightMiddleware, metrics
+from app.core.telemetry import init_sentry
 from app.api.vendors import router as vendors_router
+from app.api.webhooks import router as webhooks_router
+from app.clients.jumpseller_client import jumpseller_client
+from app.clients.message_bus import close_message_bus
+from app.db import init_db
+from app.services.order_store import order_store
+from app.services.outbox import registration_outbox
+from app.services.product_index import product_index
+import asyncio
 import pathlib
+from contextlib import asynccontextmanager
 import logging
-import sentry_sdk
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# --- Sentry Initialization ---
-if settings.sentry_dsn:
-    sentry_sdk.init(
-        dsn=settings.sentry_dsn,
-        integrations=[FastApiIntegration()],
-        environment=os.getenv("ENVIRONMENT", "development"),
-        traces_sample_rate=1.0, 
-    )
-    logger.info("Sentry telemetry initialized for backend.")
-# -----------------------------
+# Sentry goes first so FastApiIntegration sees the app and its routes
+# (sentry_sdk is only imported when SENTRY_DSN is set)
+init_sentry()
 
-app = FastAPI(title=settings.app_name, debug=settings.debug)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Heavy clients (database engine, Pub/Sub) are set up here or on first
+    # use, not at import, to keep cold starts short
+
+    # Open the shared Jumpseller connection pool once per process
+    await jumpseller_client.startup()
+
+    # Keep the local order mirror in sync (first run backfills)
+    sync_task = None
+    if settings.order_store_enabled:
+        init_db()
+        sync_task = asyncio.create_task(order_store.run(settings.order_store_sync_interval))
+
+    # Publish queued vendor registrations, including any left from a previous run
+    outbox_task = None
+    if settings.outbox_enabled:
+        outbox_task = asyncio.create_task(registration_outbox.run(settings.outbox_poll_interval))
+
+    # Load the product catalog index and reconcile it periodically
+    index_task = None
+    if settings.product_index_enabled:
+        index_task = asyncio.create_task(product_index.run(settings.product_index_refresh_interval))
+
+    yield
+
+    for task in (sync_task, outbox_task, index_task):
+        if task is not None:
+            task.cancel()
+    await jumpseller_client.aclose()
+    await close_message_bus()
+
+
+app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
 
 
 # Isto permite ao Backend saber que está atrás de uma Gateway e confiar nos headers
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["*"])
 # -----------------------------------------------
 
+# Count requests in flight and their duration for /api/metrics
+app.add_middleware(InFlightMiddleware, registry=metrics)
+
 # Configure CORS for frontend integration - allow all origins since we're behind a gateway
 app.add_middleware(
     CORSMiddleware,
@@ -49,6 +86,9 @@ app.include_router(jumpseller_router)
 # Include Vendor registration routes
 app.include_router(vendors_router)
 
+# Include Jumpseller webhook receiver
+app.include_router(webhooks_router)
+
 # Path to frontend build output (frontend/dist)
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 FRONTEND_DIST = ROOT / "frontend" / "dist"
@@ -1,3 +1,5 @@
 from .vendor import VendorAnswer
+from .order import StoredOrder, OrderSyncState, DailySales
+from .outbox import OutboxMessage
 
-__all__ = ["VendorRequest", "VendorAnswer"]
+__all__ = ["VendorRequest", "VendorAnswer", "StoredOrder", "OrderSyncState", "DailySales", "OutboxMessage"]
@@ -0,0 +1,40 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+
+class StoredOrder(SQLModel, table=True):
+    """Local mirror of a Jumpseller order, reduced to the fields the dashboard reads."""
+    __tablename__ = "orders"
+
+    id: int = Field(primary_key=True)
+    status: str = ""
+    # Lower-cased, stripped status used for filtering
+    status_key: str = Field(default="", index=True)
+    created_at: Optional[datetime] = Field(default=None, index=True)
+    # Original created_at string, shown as-is in the recent orders list
+    created_at_raw: str = ""
+    updated_at: Optional[datetime] = None
+    total: float = 0.0
+    customer_name: str = "Unknown"
+    items_count: int = 0
+
+
+class OrderSyncState(SQLModel, table=True):
+    """Watermark of the last successful order sync."""
+    __tablename__ = "order_sync_state"
+
+    name: str = Field(primary_key=True)
+    watermark: datetime
+    last_synced_at: datetime
+
+
+class DailySales(SQLModel, table=True):
+    """Per-day order totals and counts by status, keyed by the store-local day (settings.store_timezone)."""
+    __tablename__ = "daily_sales"
+
+    # Date the order was created on in the store's timezone, not in UTC
+    day: date = Field(primary_key=True)
+    status_key: str = Field(primary_key=True)
+    total: float = 0.0
+    order_count: int = 0
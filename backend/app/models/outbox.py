@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+
+class OutboxMessage(SQLModel, table=True):
+    """A message waiting to be published to Pub/Sub (deleted once sent)."""
+    __tablename__ = "outbox"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str = Field(index=True)
+    payload: str
+    created_at: datetime
+    attempts: int = 0
+    next_attempt_at: datetime = Field(index=True)
+    last_error: Optional[str] = None
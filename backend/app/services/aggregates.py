@@ -0,0 +1,187 @@
+from typing import Dict, Any, List, Iterable, Optional
+from datetime import date, datetime, timedelta, tzinfo
+import logging
+
+from app.core.orders import REVENUE_STATUSES, STATUS_PENDING, STATUS_REVENUE, get_order_total
+from app.core.timestamps import parse_order_date
+from app.services.bucketing import SeriesBuckets
+
+logger = logging.getLogger(__name__)
+
+
+class OrdersSummary:
+    """
+    Running totals for the orders stats card.
+
+    Like the other aggregates in this module it is fed batches of orders with
+    add() as they stream in, and only keeps counters, never the orders.
+    """
+
+    def __init__(self, now: Optional[datetime] = None):
+        self.now = now or datetime.utcnow()
+        self.window_30d_start = self.now - timedelta(days=30)
+        self.window_24h_start = self.now - timedelta(days=1)
+        self.orders_seen = 0
+        self.new_orders = 0
+        self.monthly_revenue = 0.0
+        # Orders with a date that couldn't be parsed (left out of the windows)
+        self.unparsed_dates = 0
+
+    def add(self, orders: Iterable[Dict[str, Any]]) -> None:
+        for order in orders:
+            self.orders_seen += 1
+            status = (order.get('status') or '').strip().lower()
+            raw_date = order.get('created_at') or order.get('date')
+            order_date = parse_order_date(raw_date)
+            if order_date is None:
+                if raw_date:
+                    self.unparsed_dates += 1
+                continue
+
+            if status == 'pending' and self.window_24h_start <= order_date <= self.now:
+                self.new_orders += 1
+
+            if status in REVENUE_STATUSES and self.window_30d_start <= order_date <= self.now:
+                self.monthly_revenue += get_order_total(order)
+
+    def add_columns(self, columns: Any) -> None:
+        """Add a decoded OrderColumns batch using its vectorized window queries."""
+        self.orders_seen += len(columns)
+        self.unparsed_dates += columns.unparsed_dates
+        self.new_orders += columns.count_in_window(STATUS_PENDING, self.window_24h_start, self.now)
+        self.monthly_revenue += columns.sum_in_window(STATUS_REVENUE, self.window_30d_start, self.now)
+
+    def result(self, total_orders: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "new_orders": self.new_orders,
+            "total_orders": total_orders if total_orders is not None else self.orders_seen,
+            "monthly_revenue": self.monthly_revenue,
+            "currency": "EUR"
+        }
+
+
+def recent_order_row(
+    order_id: Any, customer: Any, total: float, status: Any, date: Any, items_count: int
+) -> Dict[str, Any]:
+    """One entry of the dashboard's recent orders list; empty fields get their display defaults."""
+    return {
+        "id": order_id,
+        "customer": customer if isinstance(customer, str) and customer else "Unknown",
+        "total": total,
+        "status": status if isinstance(status, str) and status else "pending",
+        "date": date if isinstance(date, str) else "",
+        "items_count": items_count,
+    }
+
+
+def recent_order_entry(order: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a raw Jumpseller order for the recent orders list, whatever shape its fields have."""
+    customer = order.get("customer")
+    if isinstance(customer, dict):
+        customer = customer.get("name")
+    line_items = order.get("line_items")
+    return recent_order_row(
+        order.get("id"),
+        customer,
+        get_order_total(order),
+        order.get("status"),
+        order.get("created_at") or order.get("date"),
+        len(line_items) if isinstance(line_items, list) else 0,
+    )
+
+
+class RecentOrders:
+    """Keeps the first `limit` orders of a newest-first stream, formatted for display."""
+
+    def __init__(self, limit: int = 5):
+        self.limit = limit
+        self.orders: List[Dict[str, Any]] = []
+
+    def add(self, orders: Iterable[Dict[str, Any]]) -> None:
+        for order in orders:
+            if len(self.orders) >= self.limit:
+                return
+            if isinstance(order, dict):
+                self.orders.append(recent_order_entry(order))
+
+    def result(self) -> List[Dict[str, Any]]:
+        return self.orders
+
+
+class SalesChart:
+    """
+    Dense sales series: every bucket of the period is present, zero-filled,
+    with day/week/month boundaries taken in the store timezone.
+    """
+
+    def __init__(
+        self,
+        period: str = "daily",
+        now: Optional[datetime] = None,
+        tz: Optional[tzinfo] = None,
+        buckets: Optional[SeriesBuckets] = None
+    ):
+        self.period = period
+        self.now = now or datetime.utcnow()
+        self.series = buckets or SeriesBuckets.for_period(period, self.now, tz)
+        # First instant (naive UTC) covered by the series
+        self.start_date = self.series.start_utc
+        self.sales = [0.0] * len(self.series)
+
+    def add(self, orders: Iterable[Dict[str, Any]]) -> None:
+        for order in orders:
+            status = (order.get('status') or '').strip().lower()
+            if status not in REVENUE_STATUSES:
+                continue
+
+            order_date = parse_order_date(order.get('created_at') or order.get('date'))
+            if order_date is not None:
+                self.add_point(order_date, get_order_total(order))
+
+    def add_columns(self, columns: Any) -> None:
+        """Add a decoded OrderColumns batch using its vectorized bucketing."""
+        for index, total in enumerate(columns.bucket_sums(self.series)):
+            if total:
+                self.sales[index] += total
+
+    def add_point(self, order_date: datetime, total: float) -> None:
+        """Add one sale at a naive UTC time; ignored outside the series."""
+        index = self.series.index(order_date)
+        if index is not None:
+            self.sales[index] += total
+
+    def add_local_day(self, day: date, total: float) -> None:
+        """Add a whole local day of sales (e.g. a daily rollup row)."""
+        index = self.series.index_of_local_day(day)
+        if index is not None:
+            self.sales[index] += total
+
+    def result(self) -> List[Dict[str, Any]]:
+        return [
+            {"date": label, "sales": round(amount, 2)}
+            for label, amount in zip(self.series.labels, self.sales)
+        ]
+
+
+class ProductsSummary:
+    """Running counts for the products stats card."""
+
+    def __init__(self):
+        self.total_products = 0
+        self.active_products = 0
+        self.low_stock_alerts = 0
+
+    def add(self, products: Iterable[Dict[str, Any]]) -> None:
+        for p in products:
+            self.total_products += 1
+            if p.get('status') == 'active':
+                self.active_products += 1
+            if bool(p.get('stock_notification')):
+                self.low_stock_alerts += 1
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "total_products": self.total_products,
+            "active_products": self.active_products,
+            "low_stock_alerts": self.low_stock_alerts
+        }
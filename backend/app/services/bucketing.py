@@ -0,0 +1,152 @@
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import List, Optional
+import logging
+
+from app.core.config import settings
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # pragma: no cover - Python < 3.9
+    ZoneInfo = None
+    ZoneInfoNotFoundError = Exception
+
+logger = logging.getLogger(__name__)
+
+# Bucket units accepted for custom sales series
+UNITS = ("hour", "day", "week", "month")
+
+# Fixed dashboard periods: (unit, number of buckets ending at the current one)
+PERIOD_BUCKETS = {"daily": ("day", 30), "weekly": ("week", 12), "monthly": ("month", 12)}
+
+
+def normalize_period(period: Optional[str]) -> str:
+    """A dashboard period name from PERIOD_BUCKETS; anything else means 'daily'."""
+    key = period.strip().lower() if isinstance(period, str) else ''
+    return key if key in PERIOD_BUCKETS else "daily"
+
+# Guard against accidentally huge series (e.g. hourly buckets over years)
+MAX_BUCKETS = 5000
+
+
+def get_timezone(name: Optional[str] = None) -> tzinfo:
+    """Resolve a timezone name (default: the store timezone), falling back to UTC."""
+    name = name or settings.store_timezone
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    logger.warning(f"Unknown timezone '{name}', bucketing in UTC")
+    return timezone.utc
+
+
+def to_local(ts_utc: datetime, tz: tzinfo) -> datetime:
+    """Naive UTC -> naive local wall time."""
+    return ts_utc.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
+
+
+def to_utc(ts_local: datetime, tz: tzinfo) -> datetime:
+    """Naive local wall time -> naive UTC."""
+    return ts_local.replace(tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def floor_to_unit(ts: datetime, unit: str) -> datetime:
+    """Start of the hour, day, ISO week (Monday) or month containing `ts`."""
+    if unit == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    day = datetime.combine(ts.date(), time())
+    if unit == "week":
+        return day - timedelta(days=day.weekday())
+    if unit == "month":
+        return day.replace(day=1)
+    return day
+
+
+def add_units(ts: datetime, unit: str, count: int) -> datetime:
+    if unit == "hour":
+        return ts + timedelta(hours=count)
+    if unit == "week":
+        return ts + timedelta(weeks=count)
+    if unit == "month":
+        month = ts.month - 1 + count
+        return ts.replace(year=ts.year + month // 12, month=month % 12 + 1)
+    return ts + timedelta(days=count)
+
+
+def bucket_label(ts: datetime, unit: str) -> str:
+    """Label for a bucket starting at local time `ts`."""
+    if unit == "hour":
+        return ts.strftime('%Y-%m-%d %H:00')
+    if unit == "week":
+        year, week, _ = ts.isocalendar()
+        return f"{year}-W{week:02d}"
+    if unit == "month":
+        return ts.strftime('%Y-%m')
+    return ts.strftime('%Y-%m-%d')
+
+
+class SeriesBuckets:
+    """
+    Contiguous buckets of `width` units between two local times in `tz`.
+
+    Bucket boundaries are computed in local wall time (so days follow the
+    store's midnight, including DST changes) and kept as naive UTC edges, so
+    order timestamps can be placed with a binary search, or with a single
+    np.searchsorted over a whole batch.
+    """
+
+    def __init__(self, start: datetime, end: datetime, unit: str = "day", width: int = 1, tz: Optional[tzinfo] = None):
+        if unit not in UNITS:
+            raise ValueError(f"Unknown bucket unit '{unit}', expected one of {', '.join(UNITS)}")
+        if width < 1:
+            raise ValueError("Bucket width must be at least 1")
+        if end < start:
+            raise ValueError("Series end must not be before its start")
+
+        self.unit = unit
+        self.width = width
+        self.tz = tz or timezone.utc
+
+        starts: List[datetime] = []
+        current = floor_to_unit(start, unit)
+        while current <= end:
+            starts.append(current)
+            if len(starts) > MAX_BUCKETS:
+                raise ValueError(f"Series would have more than {MAX_BUCKETS} buckets")
+            current = add_units(current, unit, width)
+
+        self.local_starts = starts
+        self.labels = [bucket_label(ts, unit) for ts in starts]
+        # len(labels) + 1 edges: bucket i covers [edges[i], edges[i + 1])
+        self.edges = [to_utc(ts, self.tz) for ts in starts] + [to_utc(current, self.tz)]
+
+    @classmethod
+    def for_period(cls, period: str, now: Optional[datetime] = None, tz: Optional[tzinfo] = None) -> "SeriesBuckets":
+        """Buckets for a dashboard period, ending with the bucket that contains `now` (UTC)."""
+        tz = tz or get_timezone()
+        unit, count = PERIOD_BUCKETS.get(period, PERIOD_BUCKETS["daily"])
+        now_local = to_local(now or datetime.utcnow(), tz)
+        start = add_units(floor_to_unit(now_local, unit), unit, -(count - 1))
+        return cls(start, now_local, unit=unit, tz=tz)
+
+    @property
+    def start_utc(self) -> datetime:
+        return self.edges[0]
+
+    @property
+    def end_utc(self) -> datetime:
+        return self.edges[-1]
+
+    def index(self, ts_utc: datetime) -> Optional[int]:
+        """Bucket index for a naive UTC timestamp, or None when outside the series."""
+        if ts_utc < self.edges[0] or ts_utc >= self.edges[-1]:
+            return None
+        return bisect_right(self.edges, ts_utc) - 1
+
+    def index_of_local_day(self, day: date) -> Optional[int]:
+        """Bucket index for a whole local day (only exact for day-aligned units)."""
+        return self.index(to_utc(datetime.combine(day, time()), self.tz))
+
+    def __len__(self) -> int:
+        return len(self.labels)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# (value, stored_at) as saved by a cache backend
+CacheEntry = Tuple[Any, float]
+
+
+class InMemoryCacheBackend:
+    """
+    Size-bounded LRU store kept in process memory.
+
+    Any object exposing the same get/set/delete/clear methods can be passed to
+    TTLCache as a backend (e.g. a Redis-backed store shared between workers);
+    keys() is optional and only needed for in-place updates.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def keys(self) -> List[Hashable]:
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTLCache:
+    """
+    TTL cache with stale-while-revalidate semantics.
+
+    - Entries younger than `ttl` are served directly (hit).
+    - Entries older than `ttl` but within `ttl + stale_ttl` are served as-is
+      while a single background task refreshes them (stale hit).
+    - Anything older, or missing, is loaded inline (miss). Concurrent misses
+      for the same key share one load.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        backend: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self._clock = clock
+        self._loads: Dict[Hashable, "asyncio.Task"] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, calling `loader` when it must be (re)built."""
+        entry = self.backend.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = self._clock() - stored_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._start_load(key, loader, background=True)
+                return value
+
+        self.misses += 1
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every key when none is given."""
+        if key is None:
+            self.backend.clear()
+        else:
+            self.backend.delete(key)
+
+    def update_all(self, update: Callable[[Hashable, Any], Any]) -> None:
+        """
+        Replace every cached value with update(key, value), keeping its age.
+        Returning None drops the entry. Backends that can't list their keys
+        are cleared instead.
+        """
+        if not hasattr(self.backend, "keys"):
+            self.backend.clear()
+            return
+        for key in self.backend.keys():
+            entry = self.backend.get(key)
+            if entry is None:
+                continue
+            value, stored_at = entry
+            updated = update(key, value)
+            if updated is None:
+                self.backend.delete(key)
+            else:
+                self.backend.set(key, (updated, stored_at))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters used to tune TTL and size."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refresh_errors": self.refresh_errors,
+            "evictions": getattr(self.backend, "evictions", 0),
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
+
+    def _start_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]], background: bool = False
+    ) -> "asyncio.Task":
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._loads[key] = task
+            task.add_done_callback(lambda _: self._loads.pop(key, None))
+            if background:
+                task.add_done_callback(self._on_refresh_done)
+        return task
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        self.backend.set(key, (value, self._clock()))
+        return value
+
+    def _on_refresh_done(self, task: "asyncio.Task") -> None:
+        # Keep serving the stale entry; the next stale hit will retry
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_errors += 1
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+# Dashboard payloads, keyed by chart period
+dashboard_cache = TTLCache(
+    ttl=settings.dashboard_cache_ttl,
+    stale_ttl=settings.dashboard_cache_stale_ttl,
+    backend=InMemoryCacheBackend(max_entries=settings.dashboard_cache_max_entries),
+)
+
+
+def _collect_dashboard_cache():
+    stats = dashboard_cache.stats()
+    yield "dashboard_cache_lookups_total", "Dashboard cache lookups by result", "counter", [
+        ({"result": "hit"}, stats["hits"]),
+        ({"result": "stale_hit"}, stats["stale_hits"]),
+        ({"result": "miss"}, stats["misses"]),
+    ]
+    yield "dashboard_cache_hit_ratio", "Share of lookups served from the cache", "gauge", [({}, stats["hit_ratio"])]
+    yield "dashboard_cache_evictions_total", "Entries evicted to respect the size limit", "counter", [({}, stats["evictions"])]
+    yield "dashboard_cache_refresh_errors_total", "Failed background refreshes", "counter", [({}, stats["refresh_errors"])]
+
+
+metrics.add_collector(_collect_dashboard_cache)
@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import logging
+
+from app.core.orders import STATUS_REVENUE, get_order_total, status_code
+from app.core.timestamps import decode_dates, load_numpy
+
+logger = logging.getLogger(__name__)
+
+
+class OrderColumns:
+    """
+    A batch of orders decoded once into parallel typed columns:
+    created_at (datetime64[s], NaT when unparseable), status code and total.
+
+    Window counts, revenue sums and chart buckets are then computed with
+    vectorized NumPy operations (imported on the first batch). Without NumPy
+    the same columns are kept as lists and the methods fall back to plain loops.
+    """
+
+    __slots__ = ("created_at", "status", "total", "size", "unparsed_dates")
+
+    def __init__(
+        self,
+        created_at: Sequence[Optional[datetime]],
+        status: List[int],
+        total: List[float],
+        unparsed_dates: int = 0
+    ):
+        self.size = len(status)
+        # Rows whose date was present but couldn't be parsed
+        self.unparsed_dates = unparsed_dates
+        np = load_numpy()
+        if np is not None:
+            self.created_at = np.asarray(created_at, dtype="datetime64[s]")
+            self.status = np.array(status, dtype=np.int8)
+            self.total = np.array(total, dtype=np.float64)
+        else:
+            self.created_at = created_at
+            self.status = status
+            self.total = total
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[Dict[str, Any]]) -> "OrderColumns":
+        """Decode raw order dicts in a single pass."""
+        status: List[int] = []
+        total: List[float] = []
+        raw_dates: List[Optional[str]] = []
+        codes: Dict[Any, int] = {}
+        for order in orders:
+            raw_status = order.get('status')
+            code = codes.get(raw_status)
+            if code is None:
+                code = codes[raw_status] = status_code(raw_status)
+            status.append(code)
+            raw_dates.append(order.get('created_at') or order.get('date'))
+            # Only revenue orders ever contribute their total
+            total.append(get_order_total(order) if code == STATUS_REVENUE else 0.0)
+        created_at, unparsed_dates = decode_dates(raw_dates)
+        return cls(created_at, status, total, unparsed_dates=unparsed_dates)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _window_mask(self, np: Any, code: int, start: datetime, end: Optional[datetime] = None):
+        mask = (self.status == code) & (self.created_at >= np.datetime64(start, "s"))
+        if end is not None:
+            mask &= self.created_at <= np.datetime64(end, "s")
+        return mask
+
+    def _window_rows(self, code: int, start: datetime, end: Optional[datetime] = None):
+        for ts, row_code, total in zip(self.created_at, self.status, self.total):
+            if row_code == code and ts is not None and ts >= start and (end is None or ts <= end):
+                yield ts, total
+
+    def count_in_window(self, code: int, start: datetime, end: Optional[datetime] = None) -> int:
+        """Orders with status `code` created within [start, end]."""
+        np = load_numpy()
+        if np is None:
+            return sum(1 for _ in self._window_rows(code, start, end))
+        return int(self._window_mask(np, code, start, end).sum())
+
+    def sum_in_window(self, code: int, start: datetime, end: Optional[datetime] = None) -> float:
+        """Total of orders with status `code` created within [start, end]."""
+        np = load_numpy()
+        if np is None:
+            return sum(total for _, total in self._window_rows(code, start, end))
+        return float(self.total[self._window_mask(np, code, start, end)].sum())
+
+    def bucket_sums(self, series: Any) -> List[float]:
+        """Revenue per bucket of a SeriesBuckets, in one pass over the batch."""
+        np = load_numpy()
+        if np is None:
+            sums = [0.0] * len(series)
+            for ts, total in self._window_rows(STATUS_REVENUE, series.start_utc):
+                index = series.index(ts)
+                if index is not None:
+                    sums[index] += total
+            return sums
+
+        edges = np.array(series.edges, dtype="datetime64[s]")
+        mask = self._window_mask(np, STATUS_REVENUE, series.start_utc) & (self.created_at < edges[-1])
+        if not mask.any():
+            return [0.0] * len(series)
+        indexes = np.searchsorted(edges, self.created_at[mask], side="right") - 1
+        return np.bincount(indexes, weights=self.total[mask], minlength=len(series)).tolist()
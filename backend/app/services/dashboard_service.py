@@ -1,35 +1,207 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, Awaitable, List, Tuple
+from app.clients.circuit_breaker import CircuitOpenError
 from app.clients.jumpseller_client import jumpseller_client
+from app.clients.records import ProductRecord
+from app.core.config import settings
+from app.core.metrics import metrics, track_time
+from app.services.aggregates import OrdersSummary, RecentOrders, SalesChart, ProductsSummary
+from app.services.bucketing import SeriesBuckets, get_timezone, normalize_period
+from app.services.columnar import OrderColumns
+from app.services.order_store import order_store
+from app.services.product_index import STOCK_LOW, STOCK_OUT, ProductIndex, product_index, stock_level
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+SECTION_DURATION = metrics.histogram(
+    "dashboard_section_duration_seconds", "Time to build each dashboard section", ["section"]
+)
+SECTION_FAILURES = metrics.counter(
+    "dashboard_section_failures_total", "Dashboard sections that failed and fell back", ["section"]
+)
+SECTION_TIMEOUTS = metrics.counter(
+    "dashboard_section_timeouts_total", "Dashboard sections that missed their time budget", ["section"]
+)
+
+# Shown in place of sections that failed or ran out of time
+ORDERS_PLACEHOLDER = {"new_orders": 0, "total_orders": 0, "monthly_revenue": 0, "currency": "EUR"}
+PRODUCTS_PLACEHOLDER = {"total_products": 0, "active_products": 0, "low_stock_alerts": 0}
+STORE_INFO_PLACEHOLDER = {"name": "Your Store", "currency": "EUR", "timezone": "UTC"}
+
+# Sections sent by the streaming dashboard, besides quick_actions
+STREAM_SECTIONS = ("store_info", "stats", "recent_orders", "sales_chart")
+
+# Payload entries left as placeholders when a section fails or misses its budget
+DEGRADED_SECTIONS = {
+    "orders_summary": "stats.orders",
+    "recent_orders": "recent_orders",
+    "sales_chart": "sales_chart",
+    "products": "stats.products",
+}
+
+
+class OrderScanLimitError(Exception):
+    """A dashboard window needs more order pages than dashboard_max_scan_pages."""
+
+
+async def _iter_window_pages(since: datetime) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Order pages back to `since` (see iter_order_pages), at most
+    dashboard_max_scan_pages of them. A longer window raises
+    OrderScanLimitError instead of paging through the store's history on
+    every cache miss; the order store serves those windows from its rollup.
+    """
+    limit = settings.dashboard_max_scan_pages
+    pages = jumpseller_client.iter_order_pages(since=since)
+    try:
+        scanned = 0
+        async for page in pages:
+            scanned += 1
+            if limit and scanned > limit:
+                raise OrderScanLimitError(
+                    f"Orders since {since:%Y-%m-%d} span more than {limit} pages; enable the order store for this window"
+                )
+            yield page
+    finally:
+        await pages.aclose()
+
 
 class DashboardService:
     """Service to aggregate dashboard data from Jumpseller API."""
+
+    RECENT_ORDERS_LIMIT = 5
+
+    def __init__(self):
+        # Last fully successful payload per period, served while Jumpseller is down
+        # (keyed by normalized period, so it holds at most one per PERIOD_BUCKETS entry)
+        self._last_good: Dict[str, Dict[str, Any]] = {}
     
     async def get_dashboard_data(self, period: str = "daily") -> Dict[str, Any]:
         """
         Get all dashboard data in a single call.
         Aggregates multiple API calls for efficient dashboard loading.
+        The orders summary, recent orders and sales chart are separate
+        sections: recent orders only need the first page, the summary only
+        the last 30 days, and the chart (the long scan) can't hold them back.
+        Each section has a time budget (dashboard_section_timeout); sections
+        that miss it are filled with placeholders and listed under
+        "degraded_sections". While a Jumpseller circuit is open, the last
+        good payload for the period is returned immediately with "stale": true.
+        Unknown periods are treated as daily.
         """
-        # Run multiple API calls concurrently
-        results = await asyncio.gather(
-            self._get_orders_summary(),
-            self._get_products_summary(),
-            self._get_recent_orders(),
-            self._get_store_info(),
-            self._get_sales_chart_data(period), # Pass period here
-            return_exceptions=True
-        )
-        
-        orders_summary, products_summary, recent_orders, store_info, sales_chart = results
-        
+        period = normalize_period(period)
+        last_good = self._last_good.get(period)
+        if last_good is not None and jumpseller_client.is_circuit_open(*self._upstream_endpoints()):
+            logger.warning("Jumpseller circuit open, serving the last good dashboard")
+            return {**last_good, "stale": True}
+
+        # Run the independent upstream calls concurrently
+        sections = self._section_coroutines(period)
+        with track_time(SECTION_DURATION.labels("total")):
+            values = await asyncio.gather(
+                *(self._run_section(name, coroutine) for name, coroutine in sections),
+                return_exceptions=True
+            )
+        return self._assemble(period, {name: value for (name, _), value in zip(sections, values)})
+
+    async def iter_dashboard_sections(self, period: str = "daily") -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield (section, data) pairs as soon as each one is ready: quick_actions,
+        then store_info, recent_orders, sales_chart and stats in whatever order
+        their upstream calls finish, and finally "done" with the timestamp,
+        stale flag and degraded sections. A section may be sent again before
+        "done" (e.g. replaced by the last good payload); the latest one wins.
+        """
+        period = normalize_period(period)
+        yield "quick_actions", self._get_quick_actions_data()
+
+        last_good = self._last_good.get(period)
+        if last_good is not None and jumpseller_client.is_circuit_open(*self._upstream_endpoints()):
+            for section in STREAM_SECTIONS:
+                yield section, last_good[section]
+            yield "done", {"timestamp": last_good["timestamp"], "stale": True, "degraded_sections": []}
+            return
+
+        tasks = {
+            asyncio.ensure_future(self._run_section(name, coroutine)): name
+            for name, coroutine in self._section_coroutines(period)
+        }
+        results: Dict[str, Any] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    results[name] = task.exception() or task.result()
+                    if name in ("store_info", "recent_orders", "sales_chart"):
+                        yield name, self._section_value(results, name)
+                    elif "orders_summary" in results and "products" in results:
+                        yield "stats", {
+                            "orders": self._section_value(results, "orders_summary"),
+                            "products": self._section_value(results, "products"),
+                        }
+        finally:
+            # The client went away: stop the upstream calls still running
+            for task in pending:
+                task.cancel()
+
+        try:
+            payload = self._assemble(period, results)
+        except Exception as e:
+            logger.error(f"Dashboard stream failed: {str(e)}")
+            yield "done", {"timestamp": datetime.now().isoformat(), "stale": False, "error": str(e)}
+            return
+        if payload["stale"]:
+            for section in STREAM_SECTIONS:
+                yield section, payload[section]
+        yield "done", {
+            "timestamp": payload["timestamp"],
+            "stale": payload["stale"],
+            "degraded_sections": payload["degraded_sections"]
+        }
+
+    def _section_coroutines(self, period: str) -> List[Tuple[str, Awaitable[Any]]]:
+        return [
+            ("orders_summary", self._get_orders_summary()),
+            ("recent_orders", self._get_recent_orders()),
+            ("sales_chart", self._get_sales_chart_data(period)),
+            ("products", self._get_products_summary()),
+            ("store_info", self._get_store_info()),
+        ]
+
+    @staticmethod
+    def _section_value(results: Dict[str, Any], name: str) -> Any:
+        """A section's result, or its placeholder when it failed or hasn't finished."""
+        value = results.get(name)
+        if value is not None and not isinstance(value, Exception):
+            return value
+        if name == "orders_summary":
+            return dict(ORDERS_PLACEHOLDER)
+        if name == "products":
+            return dict(PRODUCTS_PLACEHOLDER)
+        if name == "store_info":
+            return dict(STORE_INFO_PLACEHOLDER)
+        return []
+
+    def _assemble(self, period: str, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the dashboard payload from section results (values or exceptions)."""
+        last_good = self._last_good.get(period)
+        failures = [r for r in results.values() if isinstance(r, Exception)]
+        if last_good is not None and any(isinstance(f, CircuitOpenError) for f in failures):
+            # A circuit opened mid-request: better the last full payload than zeros
+            return {**last_good, "stale": True}
+
         # Check if any critical API calls failed
+        store_info = results.get("store_info")
         if isinstance(store_info, Exception):
             raise Exception(f"Failed to get store info: {store_info}")
+
+        degraded_sections = [
+            entry for name, entry in DEGRADED_SECTIONS.items() if isinstance(results.get(name), Exception)
+        ]
         
         # Build dashboard data
         dashboard_data = {
@@ -37,125 +209,187 @@ class DashboardService:
             "timestamp": datetime.now().isoformat(),
             "store_info": store_info,
             "stats": {
-                "orders": orders_summary if not isinstance(orders_summary, Exception) else {"new_orders": 0, "total_orders": 0, "monthly_revenue": 0, "currency": "EUR"},
-                "products": products_summary if not isinstance(products_summary, Exception) else {"total_products": 0, "active_products": 0, "low_stock_alerts": 0}
+                "orders": self._section_value(results, "orders_summary"),
+                "products": self._section_value(results, "products")
             },
-            "recent_orders": recent_orders if not isinstance(recent_orders, Exception) else [],
-            "sales_chart": sales_chart if not isinstance(sales_chart, Exception) else [],
-            "quick_actions": self._get_quick_actions_data()
+            "recent_orders": self._section_value(results, "recent_orders"),
+            "sales_chart": self._section_value(results, "sales_chart"),
+            "quick_actions": self._get_quick_actions_data(),
+            "stale": False,
+            "degraded_sections": degraded_sections
         }
+
+        if not failures:
+            self._last_good[period] = dashboard_data
         
         return dashboard_data
-    
+
+    @staticmethod
+    def _upstream_endpoints() -> Tuple[str, ...]:
+        """Jumpseller endpoints the dashboard depends on."""
+        endpoints: Tuple[str, ...] = ()
+        if not settings.order_store_enabled:
+            # Otherwise orders come from the local store
+            endpoints += ("orders", "orders/count")
+        if not (settings.product_index_enabled and product_index.is_ready):
+            endpoints += ("products",)
+        return endpoints
+
+    @staticmethod
+    async def _run_section(section: str, coroutine: Awaitable[Any]) -> Any:
+        """
+        Await one dashboard section within its time budget, recording its
+        duration and failures. Raises asyncio.TimeoutError past the budget.
+        """
+        budget = settings.dashboard_section_timeouts.get(section, settings.dashboard_section_timeout)
+        with track_time(SECTION_DURATION.labels(section)):
+            try:
+                if not budget or budget <= 0:
+                    return await coroutine
+                return await asyncio.wait_for(coroutine, timeout=budget)
+            except asyncio.TimeoutError:
+                SECTION_FAILURES.labels(section).inc()
+                SECTION_TIMEOUTS.labels(section).inc()
+                logger.warning(f"Dashboard section '{section}' missed its {budget}s budget, using a placeholder")
+                raise
+            except Exception:
+                SECTION_FAILURES.labels(section).inc()
+                raise
+
+    @staticmethod
+    async def _use_order_store() -> bool:
+        """True when orders should be read from the local store instead of the API."""
+        return settings.order_store_enabled and await asyncio.to_thread(order_store.is_ready)
+
     async def _get_orders_summary(self) -> Dict[str, Any]:
-        """Get orders summary for dashboard stats."""
+        """Orders stats card: the total count plus a scan of the last 30 days."""
         try:
-            all_orders = await jumpseller_client.get_orders(limit=100)
-            total_orders = len(all_orders)
-
-            now = datetime.utcnow()
-            window_30d_start = now - timedelta(days=30)
-            window_24h_start = now - timedelta(days=1)
-
-            def parse_order_date(date_str: str):
-                if not date_str: 
-                    return None
-                try:
-                    ds = date_str.replace(' UTC', '').strip()
-                    return datetime.strptime(ds, '%Y-%m-%d %H:%M:%S')
-                except Exception:
-                    try: 
-                        return datetime.fromisoformat(date_str)
-                    except Exception: 
-                        return None
-
-            def get_order_total(order: Dict[str, Any]) -> float:
-                for key in ('total', 'total_price', 'grand_total', 'amount'):
-                    val = order.get(key)
-                    if val is not None:
-                        try:
-                            return float(val)
-                        except (TypeError, ValueError):
-                            # non-numeric or unexpected type
-                            pass
-                totals = order.get('totals') or {}
-                for key in ('total', 'grand_total', 'amount'):
-                    val = totals.get(key)
-                    if val is not None:
-                        try:
-                            return float(val)
-                        except (TypeError, ValueError):
-                            # totals field may be malformed or non-numeric
-                            pass
-                total = 0.0
-                for li in order.get('line_items', []) or []:
-                    try:
-                        price = float(li.get('price', 0) or 0)
-                        qty = int(li.get('quantity', 1) or 1)
-                        total += price * qty
-                    except (TypeError, ValueError):
-                        # skip malformed line item
-                        continue
-                return total
-
-            new_orders_count = 0
-            revenue_status = {'completed', 'shipped', 'delivered', 'paid'}
-            current_month_revenue = 0.0
-
-            for order in all_orders:
-                status = (order.get('status') or '').strip().lower()
-                order_date = parse_order_date(order.get('created_at') or order.get('date') or '')
-
-                if status == 'pending' and order_date is not None:
-                    if window_24h_start <= order_date <= now:
-                        new_orders_count += 1
-
-                if status in revenue_status and order_date is not None:
-                    if window_30d_start <= order_date <= now:
-                        current_month_revenue += get_order_total(order)
-            
-            return {
-                "new_orders": new_orders_count,
-                "total_orders": total_orders,
-                "monthly_revenue": current_month_revenue,
-                "currency": "EUR"
-            }
+            if await self._use_order_store():
+                return await asyncio.to_thread(order_store.load_orders_summary)
+
+            summary = OrdersSummary()
+
+            async def fold_orders() -> None:
+                async for page in _iter_window_pages(summary.window_30d_start):
+                    summary.add_columns(OrderColumns.from_orders(page))
+
+            total_orders, folded = await asyncio.gather(
+                jumpseller_client.get_orders_count(),
+                fold_orders(),
+                return_exceptions=True
+            )
+            if isinstance(folded, Exception):
+                raise folded
+            if summary.unparsed_dates:
+                logger.warning(f"{summary.unparsed_dates} orders had unparseable dates and were left out of the dashboard windows")
+            if isinstance(total_orders, Exception):
+                logger.warning(f"Orders count failed, using streamed count: {total_orders}")
+                total_orders = None
+
+            return summary.result(total_orders)
         except Exception as e:
             logger.error(f"Orders summary failed: {str(e)}")
             raise
-    
-    async def _get_products_summary(self) -> Dict[str, Any]:
+
+    async def _get_recent_orders(self) -> List[Dict]:
         try:
-            products = await jumpseller_client.get_products(limit=50)
-            active_products = len([p for p in products if p.get('status') == 'active'])
-            low_stock = len([p for p in products if bool(p.get('stock_notification'))])
-            return {
-                "total_products": len(products),
-                "active_products": active_products,
-                "low_stock_alerts": low_stock
-            }
+            if await self._use_order_store():
+                return await asyncio.to_thread(order_store.load_recent_orders, self.RECENT_ORDERS_LIMIT)
+
+            recent = RecentOrders(self.RECENT_ORDERS_LIMIT)
+            # Same request as the scans' first page, so the concurrent GETs are coalesced
+            recent.add(await jumpseller_client.get_orders(limit=settings.jumpseller_page_size, page=1))
+            return recent.result()
         except Exception as e:
-            logger.error(f"Products summary failed: {str(e)}")
+            logger.error(f"Recent orders failed: {str(e)}")
+            raise
+
+    async def _get_sales_chart_data(self, period: str) -> List[Dict[str, Any]]:
+        """Sales per day/week/month for the period, zero-filled, in the store timezone."""
+        try:
+            if await self._use_order_store():
+                return await asyncio.to_thread(order_store.load_sales_chart, period)
+
+            chart = SalesChart(period)
+            async for page in _iter_window_pages(chart.start_date):
+                chart.add_columns(OrderColumns.from_orders(page))
+            return chart.result()
+        except Exception as e:
+            logger.error(f"Sales chart failed: {str(e)}")
             raise
     
-    async def _get_recent_orders(self) -> List[Dict]:
+    async def get_sales_series(
+        self, start: datetime, end: datetime, unit: str = "day", width: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Dense sales series between two local times (store timezone), in
+        buckets of `width` units. Raises ValueError for an invalid range.
+        """
+        buckets = SeriesBuckets(start, end, unit=unit, width=width, tz=get_timezone())
+        if settings.order_store_enabled and await asyncio.to_thread(order_store.is_ready):
+            series = await asyncio.to_thread(order_store.load_sales_series, buckets)
+        else:
+            chart = SalesChart(buckets=buckets)
+            async for page in _iter_window_pages(buckets.start_utc):
+                chart.add_columns(OrderColumns.from_orders(page))
+            series = chart.result()
+        return {
+            "timezone": settings.store_timezone,
+            "unit": unit,
+            "width": width,
+            "series": series
+        }
+
+    async def _get_products_summary(self) -> Dict[str, Any]:
+        if settings.product_index_enabled and product_index.is_ready:
+            return product_index.summary()
         try:
-            orders = await jumpseller_client.get_orders(limit=5)
-            formatted_orders = []
-            for order in orders:
-                formatted_orders.append({
-                    "id": order.get("id"),
-                    "customer": order.get("customer", {}).get("name", "Unknown"),
-                    "total": order.get("total", 0),
-                    "status": order.get("status", "pending"),
-                    "date": order.get("created_at", ""),
-                    "items_count": len(order.get("line_items", []))
-                })
-            return formatted_orders
+            summary = ProductsSummary()
+            products: List[Dict[str, Any]] = []
+            async for page in jumpseller_client.iter_product_pages():
+                summary.add(page)
+                if settings.product_index_enabled:
+                    products.extend(page)
+            if settings.product_index_enabled:
+                # The full scan is already done, so use it to warm the index
+                product_index.replace_all(products)
+            return summary.result()
         except Exception as e:
-            logger.error(f"Recent orders failed: {str(e)}")
+            logger.error(f"Products summary failed: {str(e)}")
             raise
     
+    async def get_low_stock_products(self, limit: int = 20) -> Dict[str, Any]:
+        """Products low on or out of stock, from the product index or (when disabled) a catalog scan."""
+        if settings.product_index_enabled:
+            index = product_index
+            if not index.is_ready:
+                await index.load()
+        else:
+            # Index only the low-stock products of this scan, so they are picked and sorted the same way
+            index = ProductIndex()
+            matches: List[ProductRecord] = []
+            async for records in jumpseller_client.iter_product_records():
+                matches.extend(
+                    record for record in records
+                    if record.stock_notification
+                    or stock_level(record, index.low_stock_threshold) in (STOCK_LOW, STOCK_OUT)
+                )
+            index.replace_all(matches)
+        products = index.low_stock(limit=limit)
+        return {
+            "threshold": index.low_stock_threshold,
+            "products": [
+                {
+                    "id": product.id,
+                    "name": product.name,
+                    "sku": product.sku,
+                    "stock": product.stock,
+                    "status": product.status,
+                }
+                for product in products
+            ],
+        }
+
     async def _get_store_info(self) -> Dict[str, Any]:
         try:
             store = await jumpseller_client.get_store_info()
@@ -168,82 +402,6 @@ class DashboardService:
             logger.error(f"Store info failed: {str(e)}")
             raise
     
-    async def _get_sales_chart_data(self, period: str) -> List[Dict[str, Any]]:
-        """
-        Get sales totals aggregated by period (daily, weekly, monthly).
-        """
-        try:
-            # 1. Determine Date Range
-            now = datetime.utcnow()
-            if period == 'monthly':
-                days_back = 365 # Last 12 months approx
-            elif period == 'weekly':
-                days_back = 90  # Last 12 weeks approx
-            else:
-                days_back = 30  # Last 30 days
-
-            start_date = now - timedelta(days=days_back)
-            
-            # 2. Fetch orders (fetch more for longer periods)
-            limit = 200 if period == 'monthly' else 100
-            orders = await jumpseller_client.get_orders(limit=limit)
-            
-            # 3. Initialize aggregation dictionary
-            chart_data = {}
-            
-            # Pre-fill keys to ensure continuous graph (optional but good for UX)
-            # For simplicity, we will just sort the available data points, 
-            # but filling gaps with 0 is ideal. We'll skip pre-fill for variable periods to keep code simple.
-
-            valid_status = {'completed', 'shipped', 'delivered', 'paid'}
-
-            for order in orders:
-                status = (order.get('status') or '').strip().lower()
-                
-                if status in valid_status:
-                    date_str = order.get('created_at') or order.get('date')
-                    if not date_str: 
-                        continue
-                        
-                    try:
-                        dt = date_str.replace(' UTC', '').strip()
-                        order_date = datetime.strptime(dt, '%Y-%m-%d %H:%M:%S')
-                    except (ValueError, TypeError):
-                        # unable to parse this date string
-                        continue
-
-                    # Filter out old orders
-                    if order_date < start_date:
-                        continue
-
-                    # Determine Key based on Period
-                    if period == 'monthly':
-                        date_key = order_date.strftime('%Y-%m') # 2025-11
-                    elif period == 'weekly':
-                        # ISO Week number
-                        year, week, _ = order_date.isocalendar()
-                        date_key = f"{year}-W{week:02d}"
-                    else:
-                        date_key = order_date.strftime('%Y-%m-%d')
-                    
-                    # Aggregate
-                    total = float(order.get('total', 0) or 0)
-                    chart_data[date_key] = chart_data.get(date_key, 0.0) + total
-
-            # 4. Convert to list and Sort
-            result = [{"date": key, "sales": round(amount, 2)} for key, amount in chart_data.items()]
-            result.sort(key=lambda x: x['date'])
-            
-            # If empty (no sales), return at least one empty point to prevent frontend errors
-            if not result:
-                return []
-                
-            return result
-
-        except Exception as e:
-            logger.error(f"Sales chart data failed: {str(e)}")
-            return []
-    
     def _get_quick_actions_data(self) -> List[Dict]:
         return [
             {
@@ -0,0 +1,303 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import func
+from sqlmodel import Session, delete, select
+
+from app.clients.jumpseller_client import jumpseller_client
+from app.clients.records import OrderRecord
+from app.core.config import settings
+from app.core.orders import REVENUE_STATUSES
+from app.db import get_engine
+from app.models.order import DailySales, OrderSyncState, StoredOrder
+from app.services.aggregates import OrdersSummary, SalesChart, recent_order_row
+from app.services.bucketing import SeriesBuckets, get_timezone, to_local
+
+logger = logging.getLogger(__name__)
+
+SYNC_STATE_NAME = "orders"
+
+
+def to_stored_order(order: Union[Dict[str, Any], OrderRecord]) -> Optional[StoredOrder]:
+    """Reduce a Jumpseller order (raw or already decoded) to the columns kept locally."""
+    record = order if isinstance(order, OrderRecord) else OrderRecord.from_api(order)
+    if record.id is None:
+        return None
+    return StoredOrder(
+        id=int(record.id),
+        status=record.status_text,
+        status_key=record.status_text.strip().lower(),
+        created_at=record.created_at,
+        created_at_raw=record.created_at_raw,
+        updated_at=record.updated_at,
+        total=record.total,
+        customer_name=record.customer_name,
+        items_count=record.items_count,
+    )
+
+
+def _touched_since(record: OrderRecord, since: datetime) -> bool:
+    """True if the order was created or updated at/after `since` (or has no usable dates)."""
+    if record.created_at is None and record.updated_at is None:
+        return True
+    return any(ts is not None and ts >= since for ts in (record.created_at, record.updated_at))
+
+
+class OrderStore:
+    """
+    Local order mirror used by the dashboard instead of live API scans.
+
+    The first sync backfills every order; later syncs only pull orders
+    created or updated since the last watermark (minus a lookback window, so
+    status changes on recent orders are picked up too). Changes to orders
+    older than the lookback (e.g. a late cancellation or refund) only arrive
+    through webhooks or the periodic full re-read (order_store_full_sync_interval).
+    """
+
+    def __init__(self, db_engine=None, tz=None):
+        # Defaults to the app engine, resolved on first use
+        self._engine = db_engine
+        # Rollup days are local days in the store timezone
+        self.tz = tz or get_timezone()
+        self._sync_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    @engine.setter
+    def engine(self, value):
+        self._engine = value
+
+    # --- Sync -----------------------------------------------------------
+
+    def get_watermark(self) -> Optional[datetime]:
+        with Session(self.engine) as session:
+            state = session.get(OrderSyncState, SYNC_STATE_NAME)
+            return state.watermark if state else None
+
+    def is_ready(self) -> bool:
+        """True once a backfill has completed."""
+        return self.get_watermark() is not None
+
+    def upsert(self, orders: Iterable[Union[Dict[str, Any], OrderRecord]]) -> int:
+        """
+        Insert or update a batch of orders (raw dicts or OrderRecords).
+        Returns how many were stored.
+        The daily sales rollup is adjusted in the same transaction.
+        """
+        count = 0
+        with Session(self.engine) as session:
+            for order in orders:
+                record = to_stored_order(order)
+                if record is None:
+                    continue
+                existing = session.get(StoredOrder, record.id)
+                if existing is not None:
+                    self._apply_to_rollup(session, existing, -1)
+                self._apply_to_rollup(session, record, 1)
+                session.merge(record)
+                count += 1
+            session.commit()
+        return count
+
+    def _apply_to_rollup(self, session: Session, order: StoredOrder, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one order from its day/status rollup row."""
+        if order.created_at is None:
+            return
+        key = (to_local(order.created_at, self.tz).date(), order.status_key)
+        row = session.get(DailySales, key)
+        if row is None:
+            row = DailySales(day=key[0], status_key=key[1])
+        row.total += sign * order.total
+        row.order_count += sign
+        session.add(row)
+
+    def rebuild_rollup(self) -> None:
+        """Recompute the daily sales rollup, e.g. after changing the store timezone."""
+        with Session(self.engine) as session:
+            session.exec(delete(DailySales))
+            rows = session.exec(
+                select(StoredOrder.created_at, StoredOrder.status_key, StoredOrder.total)
+                .where(StoredOrder.created_at.is_not(None))
+            )
+            totals: Dict[Tuple[Any, str], List[float]] = {}
+            for created_at, status_key, total in rows:
+                bucket = totals.setdefault((to_local(created_at, self.tz).date(), status_key), [0.0, 0])
+                bucket[0] += total
+                bucket[1] += 1
+            for (day, status_key), (total, order_count) in totals.items():
+                session.add(DailySales(day=day, status_key=status_key, total=total, order_count=order_count))
+            session.commit()
+
+    def _rollup_is_missing(self) -> bool:
+        with Session(self.engine) as session:
+            has_orders = session.exec(select(StoredOrder.id).limit(1)).first() is not None
+            has_rollup = session.exec(select(DailySales.day).limit(1)).first() is not None
+            return has_orders and not has_rollup
+
+    def _save_watermark(self, watermark: datetime) -> None:
+        with Session(self.engine) as session:
+            state = session.get(OrderSyncState, SYNC_STATE_NAME)
+            if state is None:
+                state = OrderSyncState(name=SYNC_STATE_NAME, watermark=watermark, last_synced_at=watermark)
+            state.watermark = watermark
+            state.last_synced_at = datetime.utcnow()
+            session.add(state)
+            session.commit()
+
+    async def sync(self, full: bool = False) -> int:
+        """
+        Pull new and updated orders into the local store.
+        Runs a full backfill when `full` is set or no watermark exists yet.
+        """
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+        async with self._sync_lock:
+            started = datetime.utcnow()
+            watermark = None if full else await asyncio.to_thread(self.get_watermark)
+            since = None
+            if watermark is not None:
+                since = watermark - timedelta(days=settings.order_store_sync_lookback_days)
+
+            stored = 0
+            async for records in jumpseller_client.iter_order_records(since=since):
+                if since is not None:
+                    records = [record for record in records if _touched_since(record, since)]
+                stored += await asyncio.to_thread(self.upsert, records)
+
+            # Orders changed while we were paging are re-read thanks to the lookback
+            await asyncio.to_thread(self._save_watermark, started)
+            logger.info(f"Order store {'backfill' if since is None else 'sync'} stored {stored} orders")
+            return stored
+
+    async def backfill(self) -> int:
+        """Load every order from Jumpseller into the local store."""
+        return await self.sync(full=True)
+
+    async def run(self, interval: float, full_interval: Optional[float] = None) -> None:
+        """
+        Keep the store current until cancelled: a delta sync every `interval`
+        seconds, and a full re-read of every order every `full_interval`
+        seconds (default order_store_full_sync_interval, 0 disables) to
+        reconcile changes to orders older than the lookback window.
+        """
+        if full_interval is None:
+            full_interval = settings.order_store_full_sync_interval
+        # Stores filled before the rollup existed need it built once
+        if await asyncio.to_thread(self._rollup_is_missing):
+            await asyncio.to_thread(self.rebuild_rollup)
+        loop = asyncio.get_running_loop()
+        # Not on startup: a restart shouldn't cost a full scan
+        last_full = loop.time()
+        while True:
+            full = bool(full_interval) and loop.time() - last_full >= full_interval
+            try:
+                await self.sync(full=full)
+                if full:
+                    last_full = loop.time()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Order store sync failed: {e}")
+            await asyncio.sleep(interval)
+
+    # --- Dashboard queries ----------------------------------------------
+
+    def load_order_sections(
+        self, period: str, recent_limit: int = 5, now: Optional[datetime] = None
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return (orders summary, recent orders, sales chart) from the local store."""
+        return (
+            self.load_orders_summary(now),
+            self.load_recent_orders(recent_limit),
+            self.load_sales_chart(period, now),
+        )
+
+    def load_orders_summary(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Orders stats card, counted in the database."""
+        summary = OrdersSummary(now)
+        with Session(self.engine) as session:
+            total_orders = session.exec(select(func.count()).select_from(StoredOrder)).one()
+            summary.new_orders = session.exec(
+                select(func.count()).select_from(StoredOrder).where(
+                    StoredOrder.status_key == 'pending',
+                    StoredOrder.created_at >= summary.window_24h_start,
+                    StoredOrder.created_at <= summary.now,
+                )
+            ).one()
+            summary.monthly_revenue = float(session.exec(
+                select(func.coalesce(func.sum(StoredOrder.total), 0.0)).where(
+                    StoredOrder.status_key.in_(REVENUE_STATUSES),
+                    StoredOrder.created_at >= summary.window_30d_start,
+                    StoredOrder.created_at <= summary.now,
+                )
+            ).one())
+        return summary.result(total_orders)
+
+    def load_recent_orders(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """The newest `limit` orders, formatted for the recent orders list."""
+        with Session(self.engine) as session:
+            latest = session.exec(
+                select(StoredOrder)
+                .order_by(StoredOrder.created_at.desc().nulls_last(), StoredOrder.id.desc())
+                .limit(limit)
+            ).all()
+            return [
+                recent_order_row(
+                    row.id, row.customer_name, row.total, row.status, row.created_at_raw, row.items_count
+                )
+                for row in latest
+            ]
+
+    def load_sales_chart(self, period: str, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Sales chart for a dashboard period, from the daily rollup."""
+        chart = SalesChart(period, now=now, tz=self.tz)
+        with Session(self.engine) as session:
+            self._fill_chart(session, chart)
+        return chart.result()
+
+    def load_sales_series(self, buckets: SeriesBuckets) -> List[Dict[str, Any]]:
+        """Sales for arbitrary buckets, read from the local store."""
+        chart = SalesChart(buckets=buckets)
+        with Session(self.engine) as session:
+            self._fill_chart(session, chart)
+        return chart.result()
+
+    def _fill_chart(self, session: Session, chart: SalesChart) -> None:
+        series = chart.series
+        if series.unit == "hour" or series.tz != self.tz:
+            # Buckets not aligned to rollup days: read the orders themselves
+            for created_at, total in session.exec(
+                select(StoredOrder.created_at, StoredOrder.total).where(
+                    StoredOrder.status_key.in_(REVENUE_STATUSES),
+                    StoredOrder.created_at >= series.start_utc,
+                    StoredOrder.created_at < series.end_utc,
+                )
+            ):
+                chart.add_point(created_at, total)
+            return
+
+        # Day, week and month buckets are whole local days: at most one
+        # rollup row per day and status, no order scan.
+        first_day = series.local_starts[0].date()
+        end_day = to_local(series.end_utc, self.tz).date()
+        for day, total in session.exec(
+            select(DailySales.day, func.sum(DailySales.total))
+            .where(
+                DailySales.status_key.in_(REVENUE_STATUSES),
+                DailySales.day >= first_day,
+                DailySales.day < end_day,
+                DailySales.order_count > 0,
+            )
+            .group_by(DailySales.day)
+        ):
+            chart.add_local_day(day, total)
+
+
+# Global store instance
+order_store = OrderStore()
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, delete, select
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import get_engine
+from app.models.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+VENDOR_REGISTRATION = "vendor_registration"
+
+
+async def _publish_vendor_registration(payload: Dict[str, Any]) -> Any:
+    # Imported on first send so the outbox can be used without Pub/Sub configured
+    from app.clients.pubsub_client import publish_vendor_registration_async
+    result = await publish_vendor_registration_async(payload)
+    if result is None:
+        raise RuntimeError("Pub/Sub not configured")
+    return result
+
+
+class RegistrationOutbox:
+    """
+    Durable queue of vendor registrations waiting to be published.
+
+    Requests only insert a row, so a slow or unavailable Pub/Sub no longer
+    fails the registration. A background worker publishes due rows in
+    batches and deletes them once Pub/Sub confirms; failed rows are retried
+    with jittered exponential backoff. Delivery is at-least-once: a crash
+    between publishing and deleting a row sends it again on restart.
+    """
+
+    def __init__(
+        self,
+        db_engine=None,
+        publish: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None,
+    ):
+        # Defaults to the app engine, resolved on first use
+        self._engine = db_engine
+        self._publish = publish or _publish_vendor_registration
+        self._table_ready = False
+        # enqueue runs in worker threads; only one of them may create the table
+        self._table_lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.published = 0
+        self.failed_attempts = 0
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    @engine.setter
+    def engine(self, value):
+        self._engine = value
+
+    def _ensure_table(self) -> None:
+        if self._table_ready:
+            return
+        with self._table_lock:
+            if not self._table_ready:
+                SQLModel.metadata.create_all(self.engine, tables=[OutboxMessage.__table__])
+                self._table_ready = True
+
+    # --- Producer -------------------------------------------------------
+
+    def enqueue(self, payload: Dict[str, Any], kind: str = VENDOR_REGISTRATION) -> int:
+        """Persist a message for publishing. Returns its outbox id."""
+        self._ensure_table()
+        now = datetime.utcnow()
+        message = OutboxMessage(kind=kind, payload=json.dumps(payload), created_at=now, next_attempt_at=now)
+        with Session(self.engine) as session:
+            session.add(message)
+            session.commit()
+            session.refresh(message)
+            return message.id
+
+    def notify(self) -> None:
+        """Wake the drain worker so a new message goes out without waiting for the next poll."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # --- Worker ---------------------------------------------------------
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before retry number `attempts`, capped and jittered (50-100%)."""
+        delay = min(settings.outbox_retry_max_delay, settings.outbox_retry_base_delay * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _load_due(self, limit: int) -> List[OutboxMessage]:
+        self._ensure_table()
+        with Session(self.engine) as session:
+            return session.exec(
+                select(OutboxMessage)
+                .where(OutboxMessage.next_attempt_at <= datetime.utcnow())
+                .order_by(OutboxMessage.id)
+                .limit(limit)
+            ).all()
+
+    def _record_results(self, sent: List[int], failed: List[Tuple[int, str]]) -> None:
+        with Session(self.engine) as session:
+            if sent:
+                session.exec(delete(OutboxMessage).where(OutboxMessage.id.in_(sent)))
+            now = datetime.utcnow()
+            for message_id, error in failed:
+                message = session.get(OutboxMessage, message_id)
+                if message is None:
+                    continue
+                message.attempts += 1
+                message.last_error = error[:500]
+                message.next_attempt_at = now + timedelta(seconds=self.retry_delay(message.attempts))
+                session.add(message)
+            session.commit()
+
+    async def drain_once(self, batch_size: Optional[int] = None) -> int:
+        """Publish one batch of due messages. Returns how many were attempted."""
+        messages = await asyncio.to_thread(self._load_due, batch_size or settings.outbox_batch_size)
+        if not messages:
+            return 0
+
+        # Sent concurrently so the publisher can batch them together
+        results = await asyncio.gather(
+            *(self._publish(json.loads(message.payload)) for message in messages),
+            return_exceptions=True
+        )
+        sent: List[int] = []
+        failed: List[Tuple[int, str]] = []
+        for message, result in zip(messages, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                failed.append((message.id, str(result) or type(result).__name__))
+            else:
+                sent.append(message.id)
+
+        await asyncio.to_thread(self._record_results, sent, failed)
+        self.published += len(sent)
+        self.failed_attempts += len(failed)
+        if failed:
+            logger.warning(f"Outbox: {len(failed)} of {len(messages)} messages failed, will retry ({failed[0][1]})")
+        return len(messages)
+
+    async def run(self, interval: float) -> None:
+        """Drain the outbox until cancelled, polling every `interval` seconds when idle."""
+        self._wakeup = asyncio.Event()
+        batch_size = settings.outbox_batch_size
+        while True:
+            self._wakeup.clear()
+            try:
+                drained = await self.drain_once(batch_size)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox drain failed: {e}")
+                drained = 0
+            if drained >= batch_size:
+                # More may be waiting, keep going
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    # --- Metrics --------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue depth, lag of the oldest pending message (seconds) and send
+        counters. With the outbox disabled the database isn't touched and
+        the counters are reported as zero with `disabled` set.
+        """
+        if not settings.outbox_enabled:
+            return {"queue_depth": 0, "lag_seconds": 0.0, "published": 0, "failed_attempts": 0, "disabled": True}
+        self._ensure_table()
+        with Session(self.engine) as session:
+            depth, oldest = session.exec(
+                select(func.count(OutboxMessage.id), func.min(OutboxMessage.created_at))
+            ).one()
+        return {
+            "queue_depth": depth,
+            "lag_seconds": (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0,
+            "published": self.published,
+            "failed_attempts": self.failed_attempts,
+        }
+
+
+# Global outbox instance
+registration_outbox = RegistrationOutbox()
+
+
+def _collect_outbox():
+    if not settings.outbox_enabled:
+        return
+    stats = registration_outbox.stats()
+    yield "outbox_queue_depth", "Registrations waiting to be published", "gauge", [({}, stats["queue_depth"])]
+    yield "outbox_lag_seconds", "Age of the oldest waiting registration", "gauge", [({}, stats["lag_seconds"])]
+    yield "outbox_published_total", "Registrations published by this process", "counter", [({}, stats["published"])]
+    yield "outbox_failed_attempts_total", "Failed publish attempts (retried later)", "counter", [({}, stats["failed_attempts"])]
+
+
+metrics.add_collector(_collect_outbox)
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Union
+
+from app.clients.jumpseller_client import jumpseller_client
+from app.clients.records import ProductRecord
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Stock levels used by the secondary index
+STOCK_OUT = "out"
+STOCK_LOW = "low"
+STOCK_OK = "ok"
+STOCK_UNLIMITED = "unlimited"
+
+
+def stock_level(product: ProductRecord, threshold: int) -> str:
+    if product.stock_unlimited:
+        return STOCK_UNLIMITED
+    if product.stock <= 0:
+        return STOCK_OUT
+    if product.stock_notification or product.stock <= threshold:
+        return STOCK_LOW
+    return STOCK_OK
+
+
+def _as_record(product: Union[Dict[str, Any], ProductRecord]) -> ProductRecord:
+    return product if isinstance(product, ProductRecord) else ProductRecord.from_api(product)
+
+
+class _IndexState:
+    """Products by id plus the secondary indexes, swapped as a whole on reload."""
+
+    __slots__ = ("products", "by_status", "by_category", "by_stock_level", "stock_alerts")
+
+    def __init__(self):
+        self.products: Dict[Hashable, ProductRecord] = {}
+        self.by_status: Dict[str, Set[Hashable]] = defaultdict(set)
+        self.by_category: Dict[Hashable, Set[Hashable]] = defaultdict(set)
+        self.by_stock_level: Dict[str, Set[Hashable]] = defaultdict(set)
+        # Products with Jumpseller's low stock notification on (the dashboard's alert count)
+        self.stock_alerts: Set[Hashable] = set()
+
+
+class ProductIndex:
+    """
+    In-memory catalog keyed by product id, with secondary indexes on status,
+    category and stock level. Products are held as compact ProductRecords.
+
+    It is loaded with a full paginated scan, then kept current one product
+    at a time (upsert/remove, e.g. from webhooks) and reconciled with a full
+    reload every product_index_refresh_interval seconds. Summary counts are
+    set sizes, so reading them doesn't touch the catalog.
+    """
+
+    def __init__(self, low_stock_threshold: Optional[int] = None):
+        self.low_stock_threshold = (
+            low_stock_threshold if low_stock_threshold is not None else settings.product_low_stock_threshold
+        )
+        self._state = _IndexState()
+        self._ready = False
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """True once a full load has completed."""
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._state.products)
+
+    # --- Updates --------------------------------------------------------
+
+    def _add(self, state: _IndexState, product: ProductRecord) -> None:
+        product_id = product.id
+        state.products[product_id] = product
+        state.by_status[product.status].add(product_id)
+        for category_id in product.category_ids:
+            state.by_category[category_id].add(product_id)
+        state.by_stock_level[stock_level(product, self.low_stock_threshold)].add(product_id)
+        if product.stock_notification:
+            state.stock_alerts.add(product_id)
+
+    def _discard(self, state: _IndexState, product_id: Hashable) -> Optional[ProductRecord]:
+        product = state.products.pop(product_id, None)
+        if product is None:
+            return None
+        state.by_status[product.status].discard(product_id)
+        for category_id in product.category_ids:
+            state.by_category[category_id].discard(product_id)
+        state.by_stock_level[stock_level(product, self.low_stock_threshold)].discard(product_id)
+        state.stock_alerts.discard(product_id)
+        return product
+
+    def upsert(self, product: Union[Dict[str, Any], ProductRecord]) -> Optional[ProductRecord]:
+        """Add or replace one product (raw or decoded). Returns the previous version, if any."""
+        record = _as_record(product)
+        if record.id is None:
+            return None
+        previous = self._discard(self._state, record.id)
+        self._add(self._state, record)
+        return previous
+
+    def remove(self, product_id: Hashable) -> Optional[ProductRecord]:
+        return self._discard(self._state, product_id)
+
+    def replace_all(self, products: Iterable[Union[Dict[str, Any], ProductRecord]]) -> int:
+        """Rebuild the index from a full catalog and swap it in."""
+        state = _IndexState()
+        for product in products:
+            record = _as_record(product)
+            if record.id is not None:
+                self._add(state, record)
+        self._state = state
+        self._ready = True
+        return len(state.products)
+
+    async def load(self) -> int:
+        """Load the whole catalog from Jumpseller, page by page."""
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            products: List[ProductRecord] = []
+            async for records in jumpseller_client.iter_product_records():
+                products.extend(records)
+            count = self.replace_all(products)
+            logger.info(f"Product index loaded {count} products")
+            return count
+
+    async def run(self, interval: float) -> None:
+        """Reload the catalog every `interval` seconds until cancelled."""
+        while True:
+            try:
+                await self.load()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Product index refresh failed: {e}")
+            await asyncio.sleep(interval)
+
+    # --- Queries --------------------------------------------------------
+
+    def get(self, product_id: Hashable) -> Optional[ProductRecord]:
+        return self._state.products.get(product_id)
+
+    def summary(self) -> Dict[str, Any]:
+        """Products stats card, in the same shape as aggregates.ProductsSummary."""
+        state = self._state
+        return {
+            "total_products": len(state.products),
+            "active_products": len(state.by_status.get('active', ())),
+            "low_stock_alerts": len(state.stock_alerts),
+        }
+
+    def with_status(self, status: str) -> List[ProductRecord]:
+        state = self._state
+        return [state.products[i] for i in state.by_status.get(status, ())]
+
+    def in_category(self, category_id: Hashable) -> List[ProductRecord]:
+        state = self._state
+        return [state.products[i] for i in state.by_category.get(category_id, ())]
+
+    def low_stock(self, limit: Optional[int] = None, include_out_of_stock: bool = True) -> List[ProductRecord]:
+        """Products that are low on (or out of) stock, lowest stock first."""
+        state = self._state
+        ids = set(state.by_stock_level.get(STOCK_LOW, ())) | state.stock_alerts
+        if include_out_of_stock:
+            ids |= state.by_stock_level.get(STOCK_OUT, set())
+        products = sorted((state.products[i] for i in ids), key=lambda p: (p.stock, str(p.id)))
+        return products[:limit] if limit else products
+
+
+# Global catalog index
+product_index = ProductIndex()
+
+
+def _collect_product_index():
+    state = product_index._state
+    yield "product_index_products", "Products in the catalog index by stock level", "gauge", [
+        ({"level": level}, len(ids)) for level, ids in list(state.by_stock_level.items())
+    ]
+
+
+metrics.add_collector(_collect_product_index)
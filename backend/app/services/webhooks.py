@@ -0,0 +1,235 @@
+import base64
+import copy
+import hashlib
+import hmac
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.clients.records import OrderRecord, ProductRecord
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.timestamps import parse_order_date
+from app.core.orders import STATUS_PENDING, STATUS_REVENUE
+from app.services.aggregates import recent_order_entry
+from app.services.bucketing import PERIOD_BUCKETS, bucket_label, floor_to_unit, get_timezone, to_local
+from app.services.cache import TTLCache, dashboard_cache
+from app.services.product_index import ProductIndex, product_index
+
+logger = logging.getLogger(__name__)
+
+ORDER_EVENTS = ("order_created", "order_updated", "order_paid", "order_shipped", "order_canceled")
+PRODUCT_EVENTS = ("product_created", "product_updated")
+
+# What one order contributes to the dashboard: (status code, total, created_at)
+OrderState = Tuple[int, float, Optional[datetime]]
+# What one product contributes: (active, low stock)
+ProductState = Tuple[bool, bool]
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Check a base64 HMAC-SHA256 of the raw request body against the shared secret."""
+    if not secret or not signature:
+        return False
+    expected = base64.b64encode(hmac.new(secret.encode(), body, hashlib.sha256).digest()).decode()
+    return hmac.compare_digest(expected, signature.strip())
+
+
+def event_fingerprint(event: str, body: bytes) -> str:
+    """Stand-in event id for deliveries without one: the same event and body dedupe."""
+    return hashlib.sha256(event.encode() + b"\0" + body).hexdigest()
+
+
+def _order_state(order: Dict[str, Any]) -> OrderState:
+    record = OrderRecord.from_api(order)
+    return record.status.code, record.total, record.created_at
+
+
+def _product_state(product: ProductRecord) -> ProductState:
+    return product.active, product.stock_notification
+
+
+def event_record(data: Dict[str, Any], key: str) -> Optional[Dict[str, Any]]:
+    """The order/product carried by a webhook body (wrapped under `key` or bare), if it is one."""
+    record = data.get(key, data)
+    if not isinstance(record, dict) or record.get("id") is None:
+        return None
+    return record
+
+
+class WebhookProcessor:
+    """
+    Applies Jumpseller webhook events to the cached dashboard payloads so
+    they stay fresh without re-reading the API.
+
+    Each event is applied as a delta between the record's previous and new
+    state, which makes redeliveries harmless: a repeated state contributes
+    nothing. Previous states come from earlier events (kept in a bounded
+    map, with totals resolved by get_order_total) and, for products, from
+    the loaded product index, which product events also keep current. A
+    "created" event with no previous state adds the record (absent -> new).
+    Only an update for a record whose previous state is unknown drops the
+    cached entries, to be rebuilt on the next request. A state is only
+    remembered once the cache has been updated, so a delivery that fails
+    part way is retried against the old state. Event ids already processed
+    are skipped.
+    """
+
+    def __init__(
+        self,
+        cache: TTLCache = dashboard_cache,
+        max_events: int = 10_000,
+        max_records: int = 50_000,
+        recent_orders_limit: int = 5,
+        index: Optional[ProductIndex] = product_index,
+    ):
+        self.cache = cache
+        self.index = index
+        self.max_events = max_events
+        self.max_records = max_records
+        self.recent_orders_limit = recent_orders_limit
+        self._seen_events: "OrderedDict[str, None]" = OrderedDict()
+        self._orders: "OrderedDict[Hashable, OrderState]" = OrderedDict()
+        self._products: "OrderedDict[Hashable, ProductState]" = OrderedDict()
+
+        self.processed = 0
+        self.duplicates = 0
+
+    def _remember(self, store: OrderedDict, key: Hashable, value: Any, limit: int) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def handle(self, event: str, event_id: str, data: Dict[str, Any], now: Optional[datetime] = None) -> str:
+        """Apply one event. Returns 'processed', 'duplicate' or 'ignored'."""
+        if event_id in self._seen_events:
+            self.duplicates += 1
+            return "duplicate"
+
+        if event in ORDER_EVENTS:
+            order = event_record(data, "order")
+            if order is None:
+                return "ignored"
+            self._apply_order(order, created=event == "order_created", now=now or datetime.utcnow())
+        elif event in PRODUCT_EVENTS:
+            product = event_record(data, "product")
+            if product is None:
+                return "ignored"
+            self._apply_product(product, created=event == "product_created")
+        else:
+            return "ignored"
+
+        self._remember(self._seen_events, event_id, None, self.max_events)
+        self.processed += 1
+        return "processed"
+
+    # --- Orders ---------------------------------------------------------
+
+    def _apply_order(self, order: Dict[str, Any], created: bool, now: datetime) -> None:
+        order_id = order["id"]
+        new = _order_state(order)
+        old = self._orders.get(order_id)
+
+        if old is None and not created:
+            # An update for an order we know nothing about: its old contribution is unknown
+            self.cache.invalidate()
+        else:
+            def update(period: Hashable, payload: Dict[str, Any]) -> Dict[str, Any]:
+                payload = copy.deepcopy(payload)
+                self._patch_order_stats(payload, old, new, now)
+                self._patch_chart(payload, period, old, -1)
+                self._patch_chart(payload, period, new, 1)
+                self._patch_recent_orders(payload, order)
+                return payload
+
+            self.cache.update_all(update)
+        self._remember(self._orders, order_id, new, self.max_records)
+
+    def _patch_order_stats(
+        self, payload: Dict[str, Any], old: Optional[OrderState], new: OrderState, now: datetime
+    ) -> None:
+        stats = payload["stats"]["orders"]
+        if old is None:
+            stats["total_orders"] += 1
+
+        def contribution(state: Optional[OrderState]) -> Tuple[int, float]:
+            if state is None or state[2] is None:
+                return 0, 0.0
+            code, total, created_at = state
+            pending = int(code == STATUS_PENDING and now - timedelta(days=1) <= created_at <= now)
+            revenue = total if code == STATUS_REVENUE and now - timedelta(days=30) <= created_at <= now else 0.0
+            return pending, revenue
+
+        old_pending, old_revenue = contribution(old)
+        new_pending, new_revenue = contribution(new)
+        stats["new_orders"] += new_pending - old_pending
+        stats["monthly_revenue"] += new_revenue - old_revenue
+
+    def _patch_chart(self, payload: Dict[str, Any], period: Hashable, state: Optional[OrderState], sign: int) -> None:
+        if state is None or state[0] != STATUS_REVENUE or state[2] is None:
+            return
+        unit, _ = PERIOD_BUCKETS.get(period, PERIOD_BUCKETS["daily"])
+        label = bucket_label(floor_to_unit(to_local(state[2], get_timezone()), unit), unit)
+        for point in payload.get("sales_chart") or []:
+            if point["date"] == label:
+                point["sales"] = round(point["sales"] + sign * state[1], 2)
+                return
+
+    def _patch_recent_orders(self, payload: Dict[str, Any], order: Dict[str, Any]) -> None:
+        recent = [entry for entry in payload.get("recent_orders") or [] if entry.get("id") != order["id"]]
+        recent.append(recent_order_entry(order))
+        # Newest first, as streamed from the API
+        recent.sort(key=lambda entry: parse_order_date(entry.get("date")) or datetime.min, reverse=True)
+        payload["recent_orders"] = recent[:self.recent_orders_limit]
+
+    # --- Products -------------------------------------------------------
+
+    def _apply_product(self, product: Dict[str, Any], created: bool) -> None:
+        record = ProductRecord.from_api(product)
+        product_id = record.id
+        new = _product_state(record)
+        old = self._products.get(product_id)
+        use_index = self.index is not None and settings.product_index_enabled
+        if old is None and use_index and self.index.is_ready:
+            previous = self.index.get(product_id)
+            if previous is not None:
+                old = _product_state(previous)
+
+        if old is None and not created:
+            # Previous state unknown, so the counts can't be adjusted
+            self.cache.invalidate()
+        else:
+            def update(period: Hashable, payload: Dict[str, Any]) -> Dict[str, Any]:
+                payload = copy.deepcopy(payload)
+                stats = payload["stats"]["products"]
+                if old is None:
+                    stats["total_products"] += 1
+                old_active, old_low = old if old is not None else (False, False)
+                stats["active_products"] += int(new[0]) - int(old_active)
+                stats["low_stock_alerts"] += int(new[1]) - int(old_low)
+                return payload
+
+            self.cache.update_all(update)
+        if use_index:
+            self.index.upsert(record)
+        self._remember(self._products, product_id, new, self.max_records)
+
+    def stats(self) -> Dict[str, int]:
+        return {"processed": self.processed, "duplicates": self.duplicates}
+
+
+# Global processor, applying events to the dashboard cache
+webhook_processor = WebhookProcessor()
+
+
+def _collect_webhooks():
+    stats = webhook_processor.stats()
+    yield "webhook_events_total", "Jumpseller webhook events by result", "counter", [
+        ({"result": "processed"}, stats["processed"]),
+        ({"result": "duplicate"}, stats["duplicates"]),
+    ]
+
+
+metrics.add_collector(_collect_webhooks)
@@ -0,0 +1,80 @@
+"""
+Compare the row-by-row dashboard aggregation loop with the columnar path.
+
+Usage (from backend/):
+    python benchmarks/bench_aggregation.py            # 10k, 100k and 1M orders
+    python benchmarks/bench_aggregation.py 10000 50000
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.timestamps import load_numpy  # noqa: E402
+from app.services.aggregates import OrdersSummary, SalesChart  # noqa: E402
+from app.services.columnar import OrderColumns  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+PAGE_SIZE = 200
+STATUSES = ["paid", "pending", "shipped", "canceled", "completed"]
+
+
+def make_orders(count, now):
+    orders = []
+    for i in range(count):
+        created = now - timedelta(minutes=i * 7 % (365 * 24 * 60))
+        orders.append({
+            "id": i,
+            "status": STATUSES[i % len(STATUSES)],
+            "created_at": created.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            "total": (i % 500) + 0.99,
+        })
+    return orders
+
+
+def run_loop(orders, now):
+    summary, chart = OrdersSummary(now), SalesChart("monthly", now)
+    for start in range(0, len(orders), PAGE_SIZE):
+        page = orders[start:start + PAGE_SIZE]
+        summary.add(page)
+        chart.add(page)
+    return summary.result(), chart.result()
+
+
+def run_columnar(orders, now, batch_size=PAGE_SIZE):
+    summary, chart = OrdersSummary(now), SalesChart("monthly", now)
+    for start in range(0, len(orders), batch_size):
+        columns = OrderColumns.from_orders(orders[start:start + batch_size])
+        summary.add_columns(columns)
+        chart.add_columns(columns)
+    return summary.result(), chart.result()
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def main(sizes):
+    now = datetime.utcnow()
+    print(f"numpy: {'yes' if load_numpy() is not None else 'no (list fallback)'}")
+    print(f"{'orders':>10} {'loop (s)':>10} {'columnar (s)':>13} {'speedup':>8} {'reduce only':>12}")
+    for size in sizes:
+        orders = make_orders(size, now)
+        loop_time = timed(run_loop, orders, now)
+        columnar_time = timed(run_columnar, orders, now)
+
+        # Aggregation cost once the batch is already decoded
+        columns = OrderColumns.from_orders(orders)
+        summary, chart = OrdersSummary(now), SalesChart("monthly", now)
+        reduce_time = timed(lambda: (summary.add_columns(columns), chart.add_columns(columns)))
+
+        print(f"{size:>10} {loop_time:>10.3f} {columnar_time:>13.3f} "
+              f"{loop_time / columnar_time:>7.1f}x {reduce_time:>11.4f}s")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
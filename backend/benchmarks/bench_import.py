@@ -0,0 +1,77 @@
+"""
+Import-time profile of the backend, from `python -X importtime`.
+
+Prints the cumulative import time of `app.main` and the slowest modules,
+and fails (exit code 1) if a module that should be loaded lazily is imported
+eagerly or if the total goes over --max-ms. Each run uses a fresh interpreter;
+the best of --runs is reported to reduce noise.
+
+Usage (from backend/):
+    python benchmarks/bench_import.py [--module app.main] [--top 15] [--runs 3] [--max-ms 0]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Heavy modules that must only be imported on first use / in the startup hook
+LAZY_MODULES = ("google.cloud.pubsub_v1", "sentry_sdk", "numpy")
+
+
+def profile(module):
+    """Return {module name: (self us, cumulative us)} for one cold import of `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+        # No DSN or credentials, as in a local run; lazy clients must stay unloaded
+        env={**os.environ, "SENTRY_DSN": ""},
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # header line
+        timings[fields[2].strip()] = (self_us, cumulative_us)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-ms", type=float, default=0, help="fail above this total (0: no limit)")
+    args = parser.parse_args()
+
+    runs = [profile(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda timings: timings[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.runs})")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    slowest = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.max_ms and total_ms > args.max_ms:
+        print(f"FAIL: {total_ms:.1f} ms is over the {args.max_ms:.1f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
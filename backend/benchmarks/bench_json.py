@@ -0,0 +1,94 @@
+"""
+JSON encode/decode throughput: FastAPI's default response path versus the
+app.core.json_codec backends (orjson, msgspec, stdlib) that are installed.
+
+Encoding uses a dashboard payload carrying N orders (what a large recent
+orders list or order route returns); decoding uses N orders in Jumpseller's
+list shape, as JumpsellerClient receives them.
+
+Usage (from backend/):
+    python benchmarks/bench_json.py            # 100, 1k and 10k orders
+    python benchmarks/bench_json.py 50000
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core import json_codec  # noqa: E402
+from app.services.aggregates import SalesChart  # noqa: E402
+from mock_jumpseller import MockJumpseller  # noqa: E402
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+
+def dashboard_payload(orders):
+    return {
+        "stats": {
+            "orders": {"new_orders": 12, "total_orders": len(orders), "monthly_revenue": 12345.67, "currency": "EUR"},
+            "products": {"total_products": 1000, "active_products": 900, "low_stock_alerts": 40},
+        },
+        "recent_orders": orders,
+        "sales_chart": SalesChart("daily").result(),
+        "stale": False,
+        "degraded_sections": [],
+    }
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def encoders():
+    yield "fastapi default", lambda payload: JSONResponse(jsonable_encoder(payload)).body
+    if json_codec.orjson is not None:
+        yield "orjson", lambda payload: json_codec.orjson.dumps(payload, default=json_codec._default)
+    if json_codec.msgspec is not None:
+        yield "msgspec", lambda payload: json_codec.msgspec.json.encode(payload, enc_hook=json_codec._default)
+    yield "stdlib compact", lambda payload: json.dumps(
+        payload, default=json_codec._default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def decoders():
+    yield "stdlib", json.loads
+    if json_codec.orjson is not None:
+        yield "orjson", json_codec.orjson.loads
+    if json_codec.msgspec is not None:
+        yield "msgspec", json_codec.msgspec.json.decode
+
+
+def main(sizes):
+    print(f"json_codec backend: {json_codec.BACKEND}")
+    for size in sizes:
+        mock = MockJumpseller(orders=size)
+        orders = [mock.order(position) for position in range(size)]
+        payload = dashboard_payload(orders)
+        body = json.dumps([{"order": order} for order in orders]).encode()
+        print(f"\n{size} orders ({len(body) / 1e6:.2f} MB upstream body)")
+
+        baseline = None
+        for name, encode in encoders():
+            seconds = best_of(lambda: encode(payload))
+            baseline = baseline or seconds
+            print(f"  encode {name:<16} {seconds * 1000:9.2f} ms  {baseline / seconds:5.1f}x")
+
+        baseline = None
+        for name, decode in decoders():
+            seconds = best_of(lambda: decode(body))
+            baseline = baseline or seconds
+            print(f"  decode {name:<16} {seconds * 1000:9.2f} ms  {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,162 @@
+"""
+Load test of the dashboard and registration endpoints against the local
+Jumpseller stand-in (benchmarks/mock_jumpseller.py), in-process.
+
+Each scenario sends --requests requests at a fixed --concurrency and reports
+throughput, p50/p95/p99 latency and upstream Jumpseller calls per request.
+The dashboard cache and the client rate limiter are off unless --cache or
+--rate-limit is given, so every dashboard request does its upstream work.
+With --max-p95-ms the run fails (exit code 1) if any scenario's p95 is over
+the limit.
+
+Usage (from backend/):
+    python benchmarks/bench_load.py [--scenario dashboard|register|all] [--orders 1000|100000|1000000]
+        [--products 1000] [--latency 0.05] [--jitter 0] [--error-rate 0] [--requests 200]
+        [--concurrency 16] [--period daily] [--cache] [--rate-limit] [--json] [--max-p95-ms 0]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+WORKDIR = tempfile.mkdtemp(prefix="bench_load_")
+# Must be set before the app (and its settings) are imported
+os.environ["MESSAGE_BUS_BACKEND"] = "memory"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'app.db')}"
+os.environ["SENTRY_DSN"] = ""
+
+import httpx  # noqa: E402
+
+from app.clients.jumpseller_client import jumpseller_client  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from mock_jumpseller import MockJumpseller  # noqa: E402
+
+PAYLOAD = {
+    "name": "Bench Vendor",
+    "owner_name": "Bench Owner",
+    "email": "bench@example.com",
+    "questions": [{"question_id": "1", "question_text": "Q1", "answer": "A valid answer"}],
+}
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def send(client, scenario, period):
+    if scenario == "dashboard":
+        return client.get("/api/vendor/dashboard", params={"period": period})
+    return client.post("/api/vendor/register", json=PAYLOAD)
+
+
+async def run_scenario(client, mock, scenario, total, concurrency, period):
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+    calls_before = mock.total_calls()
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await send(client, scenario, period)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    # The registration endpoint prints every payload; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": scenario,
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "upstream_per_request": round((mock.total_calls() - calls_before) / total, 2),
+    }
+
+
+async def run(args):
+    mock = MockJumpseller(
+        orders=args.orders, products=args.products,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+    )
+    mock.install(jumpseller_client)
+    if not args.rate_limit:
+        jumpseller_client.rate_limiter = None
+    settings.dashboard_cache_enabled = args.cache
+
+    scenarios = ("dashboard", "register") if args.scenario == "all" else (args.scenario,)
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for scenario in scenarios:
+                results.append(
+                    await run_scenario(client, mock, scenario, args.requests, args.concurrency, args.period)
+                )
+    finally:
+        await jumpseller_client.aclose()
+    return results, mock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=("dashboard", "register", "all"), default="all")
+    parser.add_argument("--orders", type=int, default=1_000)
+    parser.add_argument("--products", type=int, default=1_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="mock upstream latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--period", default="daily")
+    parser.add_argument("--cache", action="store_true", help="keep the dashboard cache on")
+    parser.add_argument("--rate-limit", action="store_true", help="keep the client rate limiter on")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per scenario")
+    parser.add_argument("--max-p95-ms", type=float, default=0, help="fail if a scenario's p95 is over this")
+    args = parser.parse_args()
+
+    results, mock = asyncio.run(run(args))
+
+    if args.json:
+        for result in results:
+            print(json.dumps(result))
+    else:
+        print(f"Mock store: {args.orders} orders, {args.products} products, "
+              f"{args.latency * 1000:.0f}ms latency, {args.error_rate:.0%} errors")
+        print(f"{'scenario':<10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} {'upstream/req':>13}")
+        for r in results:
+            print(f"{r['scenario']:<10} {r['throughput']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                  f"{r['p99_ms']:>8.1f} {r['errors']:>7} {r['upstream_per_request']:>13.2f}")
+        print("Upstream calls: " + ", ".join(f"{name}={count}" for name, count in sorted(mock.calls.items())))
+
+    slow = [r for r in results if args.max_p95_ms and r["p95_ms"] > args.max_p95_ms]
+    for r in slow:
+        print(f"FAIL: {r['scenario']} p95 {r['p95_ms']}ms is over {args.max_p95_ms}ms")
+    sys.exit(1 if slow else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Vendor registration throughput without GCP: requests go through the ASGI app
+in-process and messages land on the in-memory (or SQLite) message bus.
+
+Usage (from backend/):
+    python benchmarks/bench_registration.py [requests] [concurrency] [memory|sqlite]
+"""
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+WORKDIR = tempfile.mkdtemp(prefix="bench_registration_")
+BACKEND = sys.argv[3] if len(sys.argv) > 3 else "memory"
+# Must be set before the app (and its settings) are imported
+os.environ["MESSAGE_BUS_BACKEND"] = BACKEND
+os.environ["MESSAGE_BUS_SQLITE_PATH"] = os.path.join(WORKDIR, "bus.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'app.db')}"
+
+import httpx  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.outbox import registration_outbox  # noqa: E402
+
+PAYLOAD = {
+    "name": "Bench Vendor",
+    "owner_name": "Bench Owner",
+    "email": "bench@example.com",
+    "questions": [{"question_id": "1", "question_text": "Q1", "answer": "A valid answer"}],
+}
+
+
+async def run(total, concurrency, outbox):
+    """Returns (request seconds, drain seconds or None)."""
+    settings.outbox_enabled = outbox
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for _ in remaining:
+                response = await client.post("/api/vendor/register", json=PAYLOAD)
+                assert response.status_code == 201, response.text
+
+        started = time.perf_counter()
+        # The endpoint prints every payload; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        request_time = time.perf_counter() - started
+
+    drain_time = None
+    if outbox:
+        started = time.perf_counter()
+        while await registration_outbox.drain_once():
+            pass
+        drain_time = time.perf_counter() - started
+    return request_time, drain_time
+
+
+def main(total, concurrency):
+    print(f"Message bus: {BACKEND}, {total} registrations, concurrency {concurrency}")
+    for outbox in (False, True):
+        request_time, drain_time = asyncio.run(run(total, concurrency, outbox))
+        label = "outbox" if outbox else "inline publish"
+        print(f"{label:<16} {request_time:7.3f}s  {total / request_time:8.1f} req/s")
+        if drain_time is not None:
+            print(f"{'outbox drain':<16} {drain_time:7.3f}s  {total / drain_time:8.1f} msg/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,53 @@
+"""
+Compare the original strptime-based order date parsing with app.core.timestamps.
+
+Usage (from backend/):
+    python benchmarks/bench_timestamps.py [count]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.timestamps import TimestampBatchParser, parse_order_date  # noqa: E402
+
+
+def strptime_parse(date_str):
+    if not date_str:
+        return None
+    try:
+        ds = date_str.replace(' UTC', '').strip()
+        return datetime.strptime(ds, '%Y-%m-%d %H:%M:%S')
+    except Exception:
+        try:
+            return datetime.fromisoformat(date_str)
+        except Exception:
+            return None
+
+
+def timed(label, fn, values):
+    started = time.perf_counter()
+    for value in values:
+        fn(value)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:8.3f}s  {len(values) / elapsed / 1e6:6.2f} M/s")
+
+
+def main(count):
+    now = datetime(2025, 1, 1)
+    unique = [(now - timedelta(seconds=i * 37)).strftime('%Y-%m-%d %H:%M:%S UTC') for i in range(count)]
+    print(f"{count} distinct Jumpseller timestamps")
+    timed("strptime (original)", strptime_parse, unique)
+    parse_order_date.cache_clear()
+    timed("parse_order_date (cold)", parse_order_date, unique)
+    # Same values seen again (e.g. re-reading an overlapping page window)
+    repeated = unique[:10_000] * (count // 10_000 or 1)
+    timed("parse_order_date (repeats)", parse_order_date, repeated)
+    parse_order_date.cache_clear()
+    timed("TimestampBatchParser", TimestampBatchParser(), unique)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
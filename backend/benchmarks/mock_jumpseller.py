@@ -0,0 +1,219 @@
+"""
+Local stand-in for the Jumpseller API, for load tests and benchmarks.
+
+Serves orders.json, orders/count.json, products.json, products/count.json
+and the single-record endpoints with Jumpseller's pagination (limit/page)
+and list shape. Records are computed from their position, so a 1M-order
+store costs no memory. Latency, jitter and the share of 500 responses are
+configurable, and every call is counted per endpoint.
+
+In-process (an httpx transport for JumpsellerClient):
+    mock = MockJumpseller(orders=100_000, latency=0.05)
+    mock.install(jumpseller_client)
+
+As a server (from backend/), then set JUMPSELLER_API_BASE_URL=http://127.0.0.1:8081/v1:
+    python benchmarks/mock_jumpseller.py [--orders 100000] [--products 1000] [--latency 0.05] [--port 8081]
+"""
+import argparse
+import asyncio
+import json
+import random
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+import httpx
+
+# Repeating status pattern: 60% paid, 20% pending, 10% shipped, 10% canceled
+STATUS_CYCLE = ("paid", "pending", "paid", "paid", "shipped", "paid", "pending", "paid", "canceled", "paid")
+STATUS_POSITIONS = {
+    status: [i for i, s in enumerate(STATUS_CYCLE) if s == status] for status in set(STATUS_CYCLE)
+}
+MAX_PAGE_SIZE = 200
+
+
+class MockJumpseller:
+    """ASGI app imitating the Jumpseller API over a synthetic store."""
+
+    def __init__(
+        self,
+        orders: int = 1_000,
+        products: int = 200,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        span_days: float = 365.0,
+        now: Optional[datetime] = None,
+        seed: int = 0,
+    ):
+        self.orders = orders
+        self.products = products
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.now = now or datetime.utcnow()
+        # Orders are spread evenly over span_days, newest first
+        self.spacing = timedelta(days=span_days) / max(orders, 1)
+        self.calls: Counter = Counter()
+        self._random = random.Random(seed)
+        # Encoded responses are reused so the mock spends little CPU in-process
+        self._render = lru_cache(maxsize=1024)(self._render_uncached)
+
+    # --- Synthetic records ----------------------------------------------
+
+    def order(self, position: int) -> Dict[str, Any]:
+        """The order at `position` in newest-first order."""
+        order_id = self.orders - position
+        items = 1 + position % 3
+        return {
+            "id": order_id,
+            "status": STATUS_CYCLE[position % len(STATUS_CYCLE)],
+            "total": round(10 + (order_id * 37) % 190 + (order_id % 100) / 100, 2),
+            "currency": "EUR",
+            "created_at": (self.now - self.spacing * position).strftime('%Y-%m-%d %H:%M:%S UTC'),
+            "customer": {"id": order_id % 5000, "name": f"Customer {order_id % 5000}"},
+            "line_items": [{"id": i, "product_id": (order_id + i) % max(self.products, 1) + 1, "qty": 1}
+                           for i in range(items)],
+        }
+
+    def product(self, position: int) -> Dict[str, Any]:
+        product_id = position + 1
+        stock = (product_id * 7) % 60
+        return {
+            "id": product_id,
+            "name": f"Product {product_id}",
+            "sku": f"SKU-{product_id:06d}",
+            "status": "not-available" if product_id % 10 == 0 else "active",
+            "price": float(5 + product_id % 95),
+            "stock": stock,
+            "stock_unlimited": False,
+            "stock_notification": stock < 5,
+            "categories": [{"id": product_id % 12 + 1, "name": f"Category {product_id % 12 + 1}"}],
+        }
+
+    def _status_count(self, status: Optional[str]) -> int:
+        if not status:
+            return self.orders
+        positions = STATUS_POSITIONS.get(status, [])
+        full, rest = divmod(self.orders, len(STATUS_CYCLE))
+        return full * len(positions) + sum(1 for p in positions if p < rest)
+
+    def _status_position(self, status: Optional[str], k: int) -> int:
+        """Position of the k-th order with this status (all orders if None)."""
+        if not status:
+            return k
+        positions = STATUS_POSITIONS[status]
+        cycles, index = divmod(k, len(positions))
+        return cycles * len(STATUS_CYCLE) + positions[index]
+
+    @staticmethod
+    def _page_bounds(query: Dict[str, List[str]]) -> Tuple[int, int]:
+        limit = min(int(query.get("limit", ["50"])[0]), MAX_PAGE_SIZE)
+        page = max(int(query.get("page", ["1"])[0]), 1)
+        return (page - 1) * limit, limit
+
+    # --- Routing --------------------------------------------------------
+
+    def route(self, method: str, endpoint: str, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        status = query.get("status", [None])[0]
+        parts = endpoint.split("/")
+
+        if method != "GET":
+            return 405, {"message": "Method not allowed"}
+        if endpoint == "orders":
+            if status and status not in STATUS_POSITIONS:
+                return 200, []
+            start, limit = self._page_bounds(query)
+            end = min(start + limit, self._status_count(status))
+            return 200, [{"order": self.order(self._status_position(status, k))} for k in range(start, end)]
+        if endpoint == "orders/count":
+            return 200, {"count": self._status_count(status)}
+        if endpoint == "products":
+            start, limit = self._page_bounds(query)
+            return 200, [{"product": self.product(p)} for p in range(start, min(start + limit, self.products))]
+        if endpoint == "products/count":
+            return 200, {"count": self.products}
+        if len(parts) == 2 and parts[1].isdigit():
+            record_id = int(parts[1])
+            if parts[0] == "orders" and 1 <= record_id <= self.orders:
+                return 200, {"order": self.order(self.orders - record_id)}
+            if parts[0] == "products" and 1 <= record_id <= self.products:
+                return 200, {"product": self.product(record_id - 1)}
+        return 404, {"message": "Not found"}
+
+    def _render_uncached(self, method: str, endpoint: str, query_string: str) -> Tuple[int, bytes]:
+        status, body = self.route(method, endpoint, parse_qs(query_string))
+        return status, json.dumps(body).encode()
+
+    @staticmethod
+    def endpoint(path: str) -> str:
+        """'/v1/orders/12.json' -> 'orders/12'."""
+        path = path.split("/v1/", 1)[-1].strip("/")
+        return path[:-len(".json")] if path.endswith(".json") else path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        endpoint = self.endpoint(scope["path"])
+        self.calls["/".join(":id" if part.isdigit() else part for part in endpoint.split("/"))] += 1
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            status, payload = 500, b'{"message": "Simulated upstream error"}'
+        else:
+            status, payload = self._render(scope["method"], endpoint, scope.get("query_string", b"").decode())
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    # --- Wiring ---------------------------------------------------------
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.ASGITransport(app=self)
+
+    def install(self, client) -> None:
+        """Point a JumpsellerClient at this mock (replacing its connection pool)."""
+        client.base_url = "http://jumpseller.mock/v1"
+        client._client = httpx.AsyncClient(transport=self.transport())
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--products", type=int, default=1_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of responses that are 500s")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    mock = MockJumpseller(
+        orders=args.orders, products=args.products,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+    )
+    uvicorn.run(mock, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Microbenchmarks for the dashboard aggregation hot paths (pytest-benchmark).
+
+Covers the orders summary and the sales chart for every period, both fed
+page by page through OrderColumns as in DashboardService's order sections,
+plus get_order_total's fallback chain and the list normalization used by
+get_orders/get_products. Orders come in three shapes: with 'total', with
+only 'line_items', and with malformed dates.
+
+pytest-benchmark comes with the dev requirements (the module is skipped
+without it). From backend/:
+    pip install -r requirements-dev.txt
+    # Run the benchmarks
+    python -m pytest tests/benchmarks --benchmark-only
+    # Record a baseline (saved under .benchmarks/)
+    python -m pytest tests/benchmarks --benchmark-only --benchmark-autosave
+    # Compare a change against the latest saved run
+    python -m pytest tests/benchmarks --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.clients.jumpseller_client import JumpsellerClient  # noqa: E402
+from app.core.orders import get_order_total  # noqa: E402
+from app.services.aggregates import OrdersSummary, SalesChart  # noqa: E402
+from app.services.bucketing import PERIOD_BUCKETS  # noqa: E402
+from app.services.columnar import OrderColumns  # noqa: E402
+
+NOW = datetime(2025, 6, 15, 12, 0, 0)
+PAGE_SIZE = 100
+SIZES = [1_000, 10_000]
+SHAPES = ["total", "line_items", "bad_dates"]
+STATUSES = ["paid", "pending", "shipped", "canceled", "completed"]
+
+
+def make_order(i, shape):
+    created = NOW - timedelta(minutes=i * 37 % (400 * 24 * 60))
+    order = {
+        "id": i,
+        "status": STATUSES[i % len(STATUSES)],
+        "created_at": created.strftime('%Y-%m-%d %H:%M:%S UTC'),
+    }
+    if shape == "line_items":
+        order["line_items"] = [
+            {"price": str(5 + i % 40), "quantity": 1 + j} for j in range(1 + i % 3)
+        ]
+    else:
+        order["total"] = (i % 500) + 0.99
+    if shape == "bad_dates" and i % 4 == 0:
+        order["created_at"] = ("not a date", "", None, "2025-13-45")[i % 16 // 4]
+    return order
+
+
+def make_pages(count, shape):
+    orders = [make_order(i, shape) for i in range(count)]
+    return [orders[start:start + PAGE_SIZE] for start in range(0, count, PAGE_SIZE)]
+
+
+def fold(pages, aggregate):
+    for page in pages:
+        aggregate.add_columns(OrderColumns.from_orders(page))
+    return aggregate.result()
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_orders_summary(benchmark, shape, size):
+    pages = make_pages(size, shape)
+
+    result = benchmark(lambda: fold(pages, OrdersSummary(NOW)))
+
+    assert result["total_orders"] == size
+    assert result["monthly_revenue"] > 0
+
+
+@pytest.mark.parametrize("period", sorted(PERIOD_BUCKETS))
+@pytest.mark.parametrize("shape", SHAPES)
+def test_sales_chart(benchmark, period, shape):
+    pages = make_pages(SIZES[-1], shape)
+
+    chart = benchmark(lambda: fold(pages, SalesChart(period, now=NOW)))
+
+    assert len(chart) == PERIOD_BUCKETS[period][1]
+    assert sum(point["sales"] for point in chart) > 0
+
+
+# One order per step of get_order_total's fallback chain
+TOTAL_SHAPES = {
+    "total": {"total": "19.99"},
+    "total_price": {"total": None, "total_price": 19.99},
+    "totals": {"totals": {"grand_total": "19.99"}},
+    "line_items": {"line_items": [{"price": "9.995", "quantity": 2}]},
+    "malformed": {"total": "n/a", "totals": {"total": "?"}, "line_items": [{"price": "x"}, {"price": 19.99}]},
+}
+
+
+@pytest.mark.parametrize("shape", sorted(TOTAL_SHAPES))
+def test_get_order_total(benchmark, shape):
+    orders = [dict(TOTAL_SHAPES[shape], id=i) for i in range(SIZES[-1])]
+
+    total = benchmark(lambda: sum(get_order_total(order) for order in orders))
+
+    assert total == pytest.approx(19.99 * len(orders))
+
+
+@pytest.mark.parametrize("form", ["wrapped_list", "collection_dict"])
+@pytest.mark.parametrize("collection,item", [("orders", "order"), ("products", "product")])
+def test_normalize_list(benchmark, form, collection, item):
+    records = [{"id": i, "status": "paid"} for i in range(PAGE_SIZE * 2)]
+    if form == "wrapped_list":
+        response = [{item: record} for record in records]
+    else:
+        response = {collection: records}
+
+    normalized = benchmark(JumpsellerClient._normalize_list, response, collection, item)
+
+    assert normalized == records
@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import pytest
+from datetime import datetime
+from app.services.aggregates import SalesChart
+from app.services.bucketing import SeriesBuckets, get_timezone, normalize_period
+
+LISBON = get_timezone("Europe/Lisbon")
+
+
+def test_period_series_is_dense_and_zero_filled():
+    chart = SalesChart("daily", now=datetime(2025, 1, 31, 12, 0), tz=LISBON)
+    chart.add([{"status": "paid", "total": 5, "created_at": "2025-01-15 10:00:00 UTC"}])
+    result = chart.result()
+    assert len(result) == 30
+    assert result[0]["date"] == "2025-01-02"
+    assert result[-1]["date"] == "2025-01-31"
+    assert [p["sales"] for p in result if p["sales"]] == [5.0]
+
+
+@pytest.mark.parametrize("period,first,last,count", [
+    ("weekly", "2024-W46", "2025-W05", 12),
+    ("monthly", "2024-02", "2025-01", 12),
+])
+def test_period_buckets(period, first, last, count):
+    series = SeriesBuckets.for_period(period, now=datetime(2025, 1, 31, 12, 0), tz=LISBON)
+    assert (series.labels[0], series.labels[-1], len(series)) == (first, last, count)
+
+
+def test_day_boundaries_follow_local_midnight_across_dst():
+    series = SeriesBuckets(datetime(2025, 3, 29), datetime(2025, 3, 31), tz=LISBON)
+    # Before the switch Lisbon is UTC+0, after it UTC+1
+    assert series.index(datetime(2025, 3, 29, 23, 30)) == 0
+    assert series.index(datetime(2025, 3, 30, 23, 30)) == 2
+    assert series.edges[2] == datetime(2025, 3, 30, 23, 0)
+
+
+def test_custom_width_and_range_validation():
+    series = SeriesBuckets(datetime(2025, 1, 1), datetime(2025, 1, 31), unit="day", width=7)
+    assert series.labels == ["2025-01-01", "2025-01-08", "2025-01-15", "2025-01-22", "2025-01-29"]
+    assert series.index(datetime(2025, 2, 4, 23, 59)) == 4
+    assert series.index(datetime(2025, 2, 5)) is None
+
+    with pytest.raises(ValueError):
+        SeriesBuckets(datetime(2025, 1, 2), datetime(2025, 1, 1))
+    with pytest.raises(ValueError):
+        SeriesBuckets(datetime(2025, 1, 1), datetime(2025, 1, 2), unit="fortnight")
+
+
+def test_normalize_period():
+    assert normalize_period("weekly") == "weekly"
+    assert normalize_period(" Monthly ") == "monthly"
+    assert normalize_period("yearly") == "daily"
+    assert normalize_period(None) == "daily"
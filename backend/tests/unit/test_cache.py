@@ -0,0 +1,78 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import asyncio
+import pytest
+from app.services.cache import TTLCache, InMemoryCacheBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_loader(values):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return values[len(calls) - 1]
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_hit_after_miss_within_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    loader, calls = make_loader(["a", "b"])
+
+    assert await cache.get_or_load("daily", loader) == "a"
+    clock.now = 5
+    assert await cache.get_or_load("daily", loader) == "a"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, stale_ttl=60, clock=clock)
+    loader, calls = make_loader(["a", "b"])
+
+    await cache.get_or_load("daily", loader)
+    clock.now = 20
+    assert await cache.get_or_load("daily", loader) == "a"
+    await asyncio.sleep(0.01)
+    assert await cache.get_or_load("daily", loader) == "b"
+    assert len(calls) == 2
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = TTLCache(ttl=10)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "a"
+
+    results = await asyncio.gather(*[cache.get_or_load("daily", loader) for _ in range(5)])
+    assert results == ["a"] * 5
+    assert len(calls) == 1
+
+
+def test_lru_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("daily", ("a", 0))
+    backend.set("weekly", ("b", 0))
+    backend.get("daily")
+    backend.set("monthly", ("c", 0))
+    assert backend.get("weekly") is None
+    assert backend.get("daily") is not None
+    assert backend.evictions == 1
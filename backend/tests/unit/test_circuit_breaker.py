@@ -0,0 +1,72 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import httpx
+import pytest
+from app.clients.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_opens_after_consecutive_failures_and_probes_once():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure("orders")
+    breaker.record_success("orders")
+    breaker.record_failure("orders")
+    assert breaker.state("orders") == CLOSED
+    breaker.record_failure("orders")
+    assert breaker.state("orders") == OPEN
+    # Other endpoints are unaffected
+    breaker.before_call("products")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("orders")
+
+    clock.now = 10
+    breaker.before_call("orders")
+    assert breaker.state("orders") == HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("orders")
+
+    breaker.record_failure("orders")
+    assert breaker.is_open("orders")
+    clock.now = 20
+    breaker.before_call("orders")
+    breaker.record_success("orders")
+    assert breaker.state("orders") == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_once_an_endpoint_circuit_opens(monkeypatch):
+    from app.clients.jumpseller_client import JumpsellerClient
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "jumpseller_max_retries", 0)
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    client = JumpsellerClient()
+    client._build_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.rate_limiter = None
+    client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await client.get_orders_count()
+    with pytest.raises(CircuitOpenError):
+        await client.get_orders_count()
+    await client.aclose()
+
+    assert len(calls) == 2
+    assert client.is_circuit_open("orders/count")
+    assert not client.is_circuit_open("products")
@@ -0,0 +1,76 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import pytest
+from datetime import datetime, timedelta
+from app.core import timestamps
+from app.services.aggregates import OrdersSummary, SalesChart
+from app.services.columnar import OrderColumns
+
+NOW = datetime(2025, 1, 10, 12, 0, 0)
+
+
+def make_orders():
+    statuses = ["paid", "Pending", "canceled", " Shipped ", None]
+    orders = []
+    for i in range(500):
+        created = NOW - timedelta(hours=i * 17)
+        order = {"id": i, "status": statuses[i % len(statuses)]}
+        if i % 7 == 0:
+            order["date"] = created.isoformat()
+        elif i % 11 == 0:
+            order["created_at"] = "not a date"
+        else:
+            order["created_at"] = created.strftime('%Y-%m-%d %H:%M:%S UTC')
+        if i % 3 == 0:
+            order["line_items"] = [{"price": "2.5", "quantity": 2}]
+        else:
+            order["total"] = i * 1.25
+        orders.append(order)
+    return orders
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("period", ["daily", "weekly", "monthly"])
+def test_columnar_matches_row_by_row_aggregation(monkeypatch, use_numpy, period):
+    if not use_numpy:
+        monkeypatch.setattr(timestamps, "_numpy", None)
+    elif timestamps.load_numpy() is None:
+        pytest.skip("numpy not installed")
+    orders = make_orders()
+
+    expected_summary, expected_chart = OrdersSummary(NOW), SalesChart(period, NOW)
+    expected_summary.add(orders)
+    expected_chart.add(orders)
+
+    summary, chart = OrdersSummary(NOW), SalesChart(period, NOW)
+    for start in range(0, len(orders), 100):
+        columns = OrderColumns.from_orders(orders[start:start + 100])
+        summary.add_columns(columns)
+        chart.add_columns(columns)
+
+    assert summary.result() == pytest.approx(expected_summary.result())
+    assert chart.result() == expected_chart.result()
+
+
+def test_bucket_sums_use_store_local_days():
+    from app.services.bucketing import SeriesBuckets, get_timezone
+    series = SeriesBuckets(datetime(2025, 7, 1), datetime(2025, 7, 3), tz=get_timezone("Europe/Lisbon"))
+    orders = [
+        # 23:30 UTC is 00:30 the next day in Lisbon (UTC+1 in summer)
+        {"status": "paid", "total": 1, "created_at": "2025-07-01 23:30:00 UTC"},
+        {"status": "paid", "total": 2, "created_at": "2025-07-03 12:00:00 UTC"},
+        {"status": "paid", "total": 4, "created_at": "2025-07-10 12:00:00 UTC"},
+    ]
+    assert OrderColumns.from_orders(orders).bucket_sums(series) == [0.0, 1.0, 2.0]
+
+
+def test_fixed_layout_batches_count_unparseable_dates():
+    orders = [
+        {"status": "paid", "total": 1, "created_at": "2025-01-09 10:00:00 UTC"},
+        {"status": "paid", "total": 2, "created_at": "2025-13-09 10:00:00 UTC"},
+        {"status": "paid", "total": 4},
+    ]
+    columns = OrderColumns.from_orders(orders)
+    assert columns.unparsed_dates == 1
+    assert columns.sum_in_window(2, datetime(2025, 1, 1), NOW) == 1.0
@@ -3,6 +3,8 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 import pytest
+from datetime import datetime, timedelta
+from app.core.config import settings
 from app.services.dashboard_service import DashboardService
 
 @pytest.mark.asyncio
@@ -11,10 +13,12 @@ async def test_get_dashboard_data_returns_dict(monkeypatch):
     class DummyService(DashboardService):
         async def _get_orders_summary(self):
             return {"new_orders": 1, "total_orders": 2, "monthly_revenue": 100, "currency": "EUR"}
-        async def _get_products_summary(self):
-            return {"total_products": 5, "active_products": 4, "low_stock_alerts": 0}
         async def _get_recent_orders(self):
             return []
+        async def _get_sales_chart_data(self, period):
+            return []
+        async def _get_products_summary(self):
+            return {"total_products": 5, "active_products": 4, "low_stock_alerts": 0}
         async def _get_store_info(self):
             return {"name": "Test Store", "currency": "EUR"}
 
@@ -25,3 +29,234 @@ async def test_get_dashboard_data_returns_dict(monkeypatch):
     assert "stats" in data
     assert "orders" in data["stats"]
     assert "products" in data["stats"]
+
+@pytest.mark.asyncio
+async def test_order_sections_only_scan_their_own_windows(monkeypatch):
+    from app.clients.jumpseller_client import jumpseller_client
+    now = datetime.utcnow()
+    # 250 paid orders, one per day, newest first, spread over several pages
+    orders = [
+        {"id": i, "status": "paid", "total": 10,
+         "created_at": (now - timedelta(days=i, hours=1)).strftime('%Y-%m-%d %H:%M:%S UTC')}
+        for i in range(250)
+    ]
+    pages = []
+
+    async def fake_get_orders(status=None, limit=None, page=None):
+        pages.append(page)
+        return orders[(page - 1) * limit:page * limit]
+
+    async def fake_get_orders_count(status=None):
+        return len(orders)
+
+    monkeypatch.setattr(jumpseller_client, "get_orders", fake_get_orders)
+    monkeypatch.setattr(jumpseller_client, "get_orders_count", fake_get_orders_count)
+    monkeypatch.setattr(settings, "jumpseller_page_size", 100)
+
+    class DummyService(DashboardService):
+        async def _get_products_summary(self):
+            return {"total_products": 0, "active_products": 0, "low_stock_alerts": 0}
+
+    data = await DummyService().get_dashboard_data("monthly")
+    # Three pages of 100, plus at most one speculative prefetch past the end
+    assert max(pages) <= 4
+    # Only the chart needs the pages past the first 30 days
+    assert pages.count(3) == 1
+    assert data["stats"]["orders"]["total_orders"] == 250
+    assert data["stats"]["orders"]["monthly_revenue"] == 300
+    assert len(data["recent_orders"]) == 5
+    # Orders older than 100 rows are now included in the 12-month chart
+    assert sum(point["sales"] for point in data["sales_chart"]) == 2500
+
+
+@pytest.mark.asyncio
+async def test_last_good_dashboard_is_served_while_circuit_is_open(monkeypatch):
+    from app.clients.circuit_breaker import CircuitOpenError
+    from app.clients.jumpseller_client import jumpseller_client
+
+    class FlakyService(DashboardService):
+        down = False
+
+        async def _get_orders_summary(self):
+            if self.down:
+                raise CircuitOpenError("Circuit open for 'orders'")
+            return {"new_orders": 1, "total_orders": 2, "monthly_revenue": 100, "currency": "EUR"}
+
+        async def _get_recent_orders(self):
+            return []
+
+        async def _get_sales_chart_data(self, period):
+            return []
+
+        async def _get_products_summary(self):
+            return {"total_products": 5, "active_products": 4, "low_stock_alerts": 0}
+
+        async def _get_store_info(self):
+            return {"name": "Test Store", "currency": "EUR"}
+
+    service = FlakyService()
+    fresh = await service.get_dashboard_data()
+    assert fresh["stale"] is False
+
+    # Circuit opens while the request is running
+    service.down = True
+    stale = await service.get_dashboard_data()
+    assert stale["stale"] is True
+    assert stale["stats"]["orders"]["total_orders"] == 2
+
+    # Already open: no upstream calls at all
+    monkeypatch.setattr(jumpseller_client, "is_circuit_open", lambda *endpoints: True)
+    for method in ("_get_orders_summary", "_get_recent_orders", "_get_sales_chart_data"):
+        monkeypatch.setattr(service, method, None)
+    assert (await service.get_dashboard_data())["stale"] is True
+
+    streamed = dict([section async for section in service.iter_dashboard_sections()])
+    assert streamed["quick_actions"] == fresh["quick_actions"]
+    assert streamed["stats"]["orders"]["total_orders"] == 2
+    assert streamed["done"]["stale"] is True
+
+
+class SlowProductsService(DashboardService):
+    async def _get_orders_summary(self):
+        return {"new_orders": 1, "total_orders": 2, "monthly_revenue": 100, "currency": "EUR"}
+
+    async def _get_recent_orders(self):
+        return [{"id": 1}]
+
+    async def _get_sales_chart_data(self, period):
+        return []
+
+    async def _get_products_summary(self):
+        import asyncio
+        await asyncio.sleep(0.2)
+        return {"total_products": 5, "active_products": 4, "low_stock_alerts": 0}
+
+    async def _get_store_info(self):
+        return {"name": "Test Store", "currency": "EUR"}
+
+
+@pytest.mark.asyncio
+async def test_sections_past_their_budget_get_placeholders(monkeypatch):
+    monkeypatch.setattr(settings, "dashboard_section_timeouts", {"products": 0.01})
+
+    data = await SlowProductsService().get_dashboard_data()
+    assert data["stats"]["orders"]["total_orders"] == 2
+    assert data["stats"]["products"]["total_products"] == 0
+    assert data["degraded_sections"] == ["stats.products"]
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_sections_as_they_resolve():
+    sections = [section async for section, _ in SlowProductsService().iter_dashboard_sections()]
+    assert sections[0] == "quick_actions"
+    # Orders and store info don't wait for the slow products call
+    assert sections.index("recent_orders") < sections.index("stats")
+    assert sections.index("store_info") < sections.index("stats")
+    assert sections[-1] == "done"
+
+
+class SlowChartService(SlowProductsService):
+    async def _get_products_summary(self):
+        return {"total_products": 5, "active_products": 4, "low_stock_alerts": 0}
+
+    async def _get_sales_chart_data(self, period):
+        import asyncio
+        await asyncio.sleep(0.2)
+        return [{"date": "2025-06", "sales": 10.0}]
+
+
+@pytest.mark.asyncio
+async def test_a_slow_chart_does_not_hold_back_the_other_order_sections(monkeypatch):
+    monkeypatch.setattr(settings, "dashboard_section_timeouts", {"sales_chart": 0.01})
+
+    data = await SlowChartService().get_dashboard_data("monthly")
+    assert data["stats"]["orders"]["total_orders"] == 2
+    assert data["recent_orders"] == [{"id": 1}]
+    assert data["sales_chart"] == []
+    assert data["degraded_sections"] == ["sales_chart"]
+
+    monkeypatch.setattr(settings, "dashboard_section_timeouts", {})
+    sections = [section async for section, _ in SlowChartService().iter_dashboard_sections("monthly")]
+    assert sections.index("recent_orders") < sections.index("sales_chart")
+    assert sections.index("stats") < sections.index("sales_chart")
+
+
+@pytest.mark.asyncio
+async def test_malformed_orders_only_affect_their_own_row(monkeypatch):
+    from app.clients.jumpseller_client import jumpseller_client
+    now = datetime.utcnow()
+    created = (now - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S UTC')
+    orders = [
+        {"id": 1, "status": "paid", "total": 10, "created_at": created, "customer": None, "line_items": None},
+        {"id": 2, "status": None, "created_at": created, "customer": "Walk-in",
+         "line_items": [{"price": "5", "quantity": 2}]},
+    ]
+
+    async def fake_get_orders(status=None, limit=None, page=None):
+        return orders if page == 1 else []
+
+    async def fake_get_orders_count(status=None):
+        return len(orders)
+
+    monkeypatch.setattr(jumpseller_client, "get_orders", fake_get_orders)
+    monkeypatch.setattr(jumpseller_client, "get_orders_count", fake_get_orders_count)
+
+    class DummyService(DashboardService):
+        async def _get_products_summary(self):
+            return {"total_products": 0, "active_products": 0, "low_stock_alerts": 0}
+
+        async def _get_store_info(self):
+            return {"name": "Test Store", "currency": "EUR"}
+
+    data = await DummyService().get_dashboard_data()
+    assert data["degraded_sections"] == []
+    assert data["stats"]["orders"]["monthly_revenue"] == 10
+    assert [(o["customer"], o["status"], o["total"], o["items_count"]) for o in data["recent_orders"]] == [
+        ("Unknown", "paid", 10.0, 0), ("Walk-in", "pending", 10.0, 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_path_scans_are_capped(monkeypatch):
+    from app.clients.jumpseller_client import jumpseller_client
+    now = datetime.utcnow()
+    orders = [
+        {"id": i, "status": "paid", "total": 10,
+         "created_at": (now - timedelta(days=i, hours=1)).strftime('%Y-%m-%d %H:%M:%S UTC')}
+        for i in range(250)
+    ]
+    pages = []
+
+    async def fake_get_orders(status=None, limit=None, page=None):
+        pages.append(page)
+        return orders[(page - 1) * limit:page * limit]
+
+    async def fake_get_orders_count(status=None):
+        return len(orders)
+
+    monkeypatch.setattr(jumpseller_client, "get_orders", fake_get_orders)
+    monkeypatch.setattr(jumpseller_client, "get_orders_count", fake_get_orders_count)
+    monkeypatch.setattr(settings, "jumpseller_page_size", 50)
+    monkeypatch.setattr(settings, "dashboard_max_scan_pages", 2)
+
+    class DummyService(DashboardService):
+        async def _get_products_summary(self):
+            return {"total_products": 0, "active_products": 0, "low_stock_alerts": 0}
+
+        async def _get_store_info(self):
+            return {"name": "Test Store", "currency": "EUR"}
+
+    data = await DummyService().get_dashboard_data("monthly")
+    # The 12-month chart would need five pages; the 30-day summary fits in one
+    assert data["degraded_sections"] == ["sales_chart"]
+    assert data["stats"]["orders"]["monthly_revenue"] == 300
+    assert max(pages) <= 4
+
+
+@pytest.mark.asyncio
+async def test_unknown_periods_share_the_daily_last_good_payload():
+    service = SlowChartService()
+    for period in ("daily", "hourly", "x" * 50, " Monthly "):
+        await service.get_dashboard_data(period)
+
+    assert sorted(service._last_good) == ["daily", "monthly"]
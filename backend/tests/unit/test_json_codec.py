@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from app.api.responses import FastJSONResponse
+from app.core import json_codec
+
+PAYLOAD = {
+    "stats": {"orders": {"monthly_revenue": np.float64(12.5), "new_orders": np.int64(3)}},
+    "recent_orders": [{"id": 1, "customer": "Zé", "total": Decimal("9.90"), "date": datetime(2025, 6, 15, 12, 30)}],
+    "sales_chart": [{"date": date(2025, 6, 15), "sales": 0.0}],
+    "sections": ("orders", "products"),
+}
+EXPECTED = {
+    "stats": {"orders": {"monthly_revenue": 12.5, "new_orders": 3}},
+    "recent_orders": [{"id": 1, "customer": "Zé", "total": 9.9, "date": "2025-06-15T12:30:00"}],
+    "sales_chart": [{"date": "2025-06-15", "sales": 0.0}],
+    "sections": ["orders", "products"],
+}
+
+
+def without_fast_libraries(monkeypatch):
+    monkeypatch.setattr(json_codec, "orjson", None)
+    monkeypatch.setattr(json_codec, "msgspec", None)
+
+
+def test_dumps_matches_the_stdlib_encoding():
+    assert json.loads(json_codec.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_stdlib_fallback(monkeypatch):
+    without_fast_libraries(monkeypatch)
+
+    encoded = json_codec.dumps(PAYLOAD)
+
+    assert json.loads(encoded) == EXPECTED
+    assert json_codec.loads(encoded) == EXPECTED
+    with pytest.raises(ValueError):
+        json_codec.loads(b"{not json")
+
+
+def test_stdlib_fallback_rejects_nan(monkeypatch):
+    without_fast_libraries(monkeypatch)
+
+    with pytest.raises(ValueError):
+        json_codec.dumps({"sales": float("nan")})
+
+
+def test_loads_rejects_invalid_json():
+    with pytest.raises(ValueError):
+        json_codec.loads(b"<html>")
+
+
+def test_response_renders_with_the_codec():
+    response = FastJSONResponse(PAYLOAD)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == EXPECTED
@@ -0,0 +1,161 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import asyncio
+import httpx
+import pytest
+from app.clients.jumpseller_client import JumpsellerClient
+
+
+def make_client(handler):
+    """Build a JumpsellerClient whose pool talks to an in-memory transport."""
+    client = JumpsellerClient()
+    client._build_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.rate_limiter = None
+    return client
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_is_reused_between_requests():
+    def handler(request):
+        return httpx.Response(200, json={"orders": [{"id": 1}]})
+
+    client = make_client(handler)
+    await client.startup()
+    pool = client._client
+
+    await client.get_orders(limit=5)
+    await client.get_orders(limit=5)
+    assert client._client is pool
+
+    await client.aclose()
+    assert client._client is None
+    assert pool.is_closed
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced():
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"orders": [{"id": 1}]})
+
+    client = make_client(handler)
+    results = await asyncio.gather(*[client.get_orders(limit=100) for _ in range(10)])
+    await client.get_orders(limit=5)
+    await client.aclose()
+
+    assert all(r == [{"id": 1}] for r in results)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_orders_walks_every_page_in_order():
+    orders = [{"id": i, "created_at": "2025-01-01 00:00:00 UTC"} for i in range(23)]
+
+    def handler(request):
+        limit = int(request.url.params["limit"])
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={"orders": orders[(page - 1) * limit:page * limit]})
+
+    client = make_client(handler)
+    streamed = [order["id"] async for order in client.iter_orders(page_size=5)]
+    await client.aclose()
+    assert streamed == list(range(23))
+
+
+@pytest.mark.asyncio
+async def test_iter_order_pages_stops_once_past_since():
+    from datetime import datetime
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        requested.append(page)
+        day = 30 - page * 10
+        created = f"2025-01-{max(day, 1):02d} 00:00:00 UTC"
+        return httpx.Response(200, json={"orders": [{"id": page, "created_at": created}] * 2})
+
+    client = make_client(handler)
+    pages = [p async for p in client.iter_order_pages(since=datetime(2025, 1, 15), page_size=2)]
+    await client.aclose()
+    assert [p[0]["id"] for p in pages] == [1, 2]
+    assert max(requested) <= 4
+
+
+@pytest.mark.asyncio
+async def test_iter_order_records_counts_unparsed_dates():
+    from app.clients.jumpseller_client import UNPARSED_DATES_TOTAL
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        orders = [{"id": 1, "status": "paid", "created_at": "2025-01-01 00:00:00 UTC"},
+                  {"id": 2, "status": "paid", "created_at": "yesterday"}]
+        return httpx.Response(200, json={"orders": orders if page == 1 else []})
+
+    client = make_client(handler)
+    before = UNPARSED_DATES_TOTAL.value
+    pages = [records async for records in client.iter_order_records(page_size=5)]
+    await client.aclose()
+
+    assert [[r.id for r in records] for records in pages] == [[1, 2]]
+    assert pages[0][1].created_at is None
+    assert UNPARSED_DATES_TOTAL.value - before == 1
+
+
+@pytest.mark.asyncio
+async def test_gets_are_retried_on_throttling_and_server_errors(monkeypatch):
+    from app.clients.rate_limit import TokenBucket
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "jumpseller_retry_base_delay", 0.001)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"count": 3}),
+    ]
+
+    client = make_client(lambda request: responses.pop(0))
+    client.rate_limiter = TokenBucket(rate=1000)
+    assert await client.get_orders_count() == 3
+    assert responses == []
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_and_writes_are_not_retried(monkeypatch):
+    from app.clients.jumpseller_client import JumpsellerAPIError
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "jumpseller_retry_base_delay", 0.001)
+    monkeypatch.setattr(settings, "jumpseller_max_retries", 2)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(500)
+
+    client = make_client(handler)
+    with pytest.raises(JumpsellerAPIError):
+        await client.get_orders_count()
+    with pytest.raises(JumpsellerAPIError):
+        await client.create_category({"name": "Shoes"})
+    await client.aclose()
+    assert calls == ["GET", "GET", "GET", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_is_not_waited_for():
+    from app.clients.jumpseller_client import JumpsellerAPIError
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    client = make_client(handler)
+    with pytest.raises(JumpsellerAPIError) as raised:
+        await client.get_orders_count()
+    await client.aclose()
+    assert raised.value.retry_after == 3600
+    assert len(calls) == 1
@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import json
+import pytest
+from app.clients import message_bus, pubsub_client
+from app.clients.message_bus import InMemoryMessageBus, SQLiteMessageBus, create_message_bus
+
+
+@pytest.mark.asyncio
+async def test_registration_goes_through_the_in_memory_bus(monkeypatch):
+    bus = InMemoryMessageBus()
+    monkeypatch.setattr(message_bus, "_message_bus", bus)
+
+    result = await pubsub_client.publish_vendor_registration_async({"name": "Test Vendor"})
+
+    assert result == {"alert_id": "1", "data_id": "2"}
+    assert bus.queue.get_nowait() == ("1", b"New seller registration!")
+    message_id, data = bus.queue.get_nowait()
+    assert json.loads(data) == {"name": "Test Vendor"}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bus_persists_messages(tmp_path):
+    path = str(tmp_path / "bus.db")
+    ids = await SQLiteMessageBus(path).publish([b"a", b"b"])
+    assert ids == ["1", "2"]
+
+    # A new instance (e.g. after a restart) sees the same messages
+    reopened = SQLiteMessageBus(path)
+    assert reopened.publish_blocking([b"c"]) == ["3"]
+    assert reopened.read(after_id=1) == [(2, b"b"), (3, b"c")]
+
+
+def test_create_message_bus_rejects_unknown_backend():
+    assert isinstance(create_message_bus("memory"), InMemoryMessageBus)
+    with pytest.raises(ValueError):
+        create_message_bus("kafka")
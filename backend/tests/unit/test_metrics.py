@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from app.core.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("request_seconds", "Latency", ["endpoint"], buckets=[0.1, 1.0])
+    child = latency.labels("orders")
+    for value in (0.05, 0.5, 0.5, 5.0):
+        child.observe(value)
+
+    text = registry.render()
+    assert '# TYPE request_seconds histogram' in text
+    assert 'request_seconds_bucket{endpoint="orders",le="0.1"} 1' in text
+    assert 'request_seconds_bucket{endpoint="orders",le="1.0"} 3' in text
+    assert 'request_seconds_bucket{endpoint="orders",le="+Inf"} 4' in text
+    assert 'request_seconds_count{endpoint="orders"} 4' in text
+
+
+def test_collectors_are_read_at_render_time():
+    registry = MetricsRegistry()
+    depth = {"value": 1}
+    registry.add_collector(lambda: [("queue_depth", "Depth", "gauge", [({}, depth["value"])])])
+    depth["value"] = 7
+    assert "queue_depth 7" in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_jumpseller_requests_are_timed_per_endpoint():
+    from app.clients.jumpseller_client import REQUEST_DURATION, REQUESTS_TOTAL, JumpsellerClient
+
+    client = JumpsellerClient()
+    client._build_client = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"order": {"id": 7}}))
+    )
+    client.rate_limiter = None
+    await client.get_order(7)
+    await client.aclose()
+
+    text = "\n".join(REQUEST_DURATION.render() + REQUESTS_TOTAL.render())
+    assert 'jumpseller_request_duration_seconds_count{method="GET",endpoint="orders/:id"}' in text
+    assert 'jumpseller_requests_total{method="GET",endpoint="orders/:id",status="200"}' in text
+
+
+def test_metrics_endpoint(monkeypatch):
+    from app.core.config import settings
+    from app.main import app
+    monkeypatch.setattr(settings, "outbox_enabled", False)
+
+    response = TestClient(app).get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_in_flight" in response.text
+    assert "dashboard_cache_hit_ratio" in response.text
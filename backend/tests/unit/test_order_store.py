@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+from app.models.order import StoredOrder, OrderSyncState  # noqa: F401
+from app.services.order_store import OrderStore
+
+
+def make_store():
+    # One shared in-memory connection, usable from the sync worker threads
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    return OrderStore(engine)
+
+
+def make_order(i, days_ago, status="paid", total=10):
+    created = (datetime.utcnow() - timedelta(days=days_ago, hours=1)).strftime('%Y-%m-%d %H:%M:%S UTC')
+    return {"id": i, "status": status, "total": total, "created_at": created,
+            "customer": {"name": f"C{i}"}, "line_items": [{}]}
+
+
+def test_upsert_replaces_existing_orders():
+    store = make_store()
+    store.upsert([make_order(1, 1, status="pending")])
+    store.upsert([make_order(1, 1, status="paid", total=25)])
+    summary, recent, _ = store.load_order_sections("daily")
+    assert summary["total_orders"] == 1
+    assert summary["monthly_revenue"] == 25
+    assert recent[0]["status"] == "paid"
+
+
+def test_load_order_sections_matches_streamed_aggregates():
+    from app.services.aggregates import SalesChart
+    store = make_store()
+    orders = [make_order(i, i) for i in range(40)] + [make_order(99, 0, status="pending")]
+    store.upsert(orders)
+    summary, recent, chart = store.load_order_sections("daily", recent_limit=3)
+    assert summary["total_orders"] == 41
+    assert summary["new_orders"] == 1
+    assert summary["monthly_revenue"] == 300
+    assert [o["id"] for o in recent] == [99, 0, 1]
+    expected = SalesChart("daily")
+    expected.add(orders)
+    assert chart == expected.result()
+
+
+@pytest.mark.asyncio
+async def test_sync_only_pulls_changes_after_backfill(monkeypatch):
+    from app.clients.jumpseller_client import jumpseller_client
+    orders = [make_order(i, i * 10) for i in range(10)]
+    seen_since = []
+
+    async def fake_iter_order_pages(status=None, since=None, page_size=None):
+        seen_since.append(since)
+        yield orders
+
+    monkeypatch.setattr(jumpseller_client, "iter_order_pages", fake_iter_order_pages)
+    store = make_store()
+    assert not store.is_ready()
+
+    assert await store.sync() == 10
+    assert store.is_ready()
+    # Delta sync only keeps orders inside the lookback window
+    assert await store.sync() == 3
+    assert seen_since[0] is None
+    assert seen_since[1] is not None
+
+
+def test_rollup_chart_matches_order_scan_for_every_period():
+    from app.services.aggregates import SalesChart
+    store = make_store()
+    orders = [make_order(i, i // 3, status="paid" if i % 4 else "pending", total=i + 0.5) for i in range(0, 1200, 2)]
+    store.upsert(orders)
+    # Status change moves the order out of revenue in the rollup
+    store.upsert([dict(orders[1], status="canceled")])
+    orders[1] = dict(orders[1], status="canceled")
+
+    for period in ("daily", "weekly", "monthly"):
+        _, _, chart = store.load_order_sections(period)
+        expected = SalesChart(period)
+        expected.add(orders)
+        assert chart == expected.result()
+
+    store.rebuild_rollup()
+    _, _, rebuilt = store.load_order_sections("monthly")
+    assert rebuilt == chart
+
+
+@pytest.mark.asyncio
+async def test_run_reconciles_with_periodic_full_syncs(monkeypatch):
+    import asyncio
+    store = make_store()
+    calls = []
+
+    async def fake_sync(full=False):
+        calls.append(full)
+        if len(calls) == 6:
+            raise asyncio.CancelledError
+        await asyncio.sleep(0.02)
+        return 0
+
+    monkeypatch.setattr(store, "sync", fake_sync)
+    with pytest.raises(asyncio.CancelledError):
+        await store.run(interval=0, full_interval=0.05)
+
+    # Delta syncs first (no full scan on startup), then a full one once the interval passed
+    assert calls[0] is False
+    assert True in calls
+    assert calls[calls.index(True) + 1] is False
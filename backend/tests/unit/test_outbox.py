@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import asyncio
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+from app.core.config import settings
+from app.services.outbox import RegistrationOutbox
+
+
+def make_outbox(publish):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return RegistrationOutbox(engine, publish=publish)
+
+
+@pytest.mark.asyncio
+async def test_drain_publishes_and_removes_messages():
+    sent = []
+
+    async def publish(payload):
+        sent.append(payload)
+        return {"alert_id": "1", "data_id": "2"}
+
+    outbox = make_outbox(publish)
+    outbox.enqueue({"name": "A"})
+    outbox.enqueue({"name": "B"})
+    assert outbox.stats()["queue_depth"] == 2
+
+    assert await outbox.drain_once() == 2
+    assert sent == [{"name": "A"}, {"name": "B"}]
+    stats = outbox.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["lag_seconds"] == 0.0
+    assert stats["published"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_messages_are_kept_and_backed_off():
+    async def publish(payload):
+        raise RuntimeError("Pub/Sub down")
+
+    outbox = make_outbox(publish)
+    outbox.enqueue({"name": "A"})
+
+    assert await outbox.drain_once() == 1
+    # Not due again until its backoff expires
+    assert await outbox.drain_once() == 0
+    stats = outbox.stats()
+    assert stats["queue_depth"] == 1
+    assert stats["failed_attempts"] == 1
+    assert stats["lag_seconds"] >= 0
+
+
+def test_stats_leave_the_schema_alone_when_disabled(monkeypatch):
+    from sqlalchemy import inspect
+    monkeypatch.setattr(settings, "outbox_enabled", False)
+    outbox = make_outbox(publish=None)
+
+    assert outbox.stats() == {
+        "queue_depth": 0, "lag_seconds": 0.0, "published": 0, "failed_attempts": 0, "disabled": True
+    }
+    assert not inspect(outbox.engine).get_table_names()
+
+
+def test_retry_delay_grows_and_is_capped(monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "outbox_retry_base_delay", 1.0)
+    monkeypatch.setattr(settings, "outbox_retry_max_delay", 10.0)
+    outbox = make_outbox(None)
+    assert 0.5 <= outbox.retry_delay(1) <= 1.0
+    assert 4.0 <= outbox.retry_delay(4) <= 8.0
+    assert 5.0 <= outbox.retry_delay(20) <= 10.0
+
+
+@pytest.mark.asyncio
+async def test_worker_wakes_up_on_notify():
+    published = asyncio.Event()
+
+    async def publish(payload):
+        published.set()
+        return {}
+
+    outbox = make_outbox(publish)
+    worker = asyncio.create_task(outbox.run(interval=60))
+    await asyncio.sleep(0.05)
+    outbox.enqueue({"name": "A"})
+    outbox.notify()
+    await asyncio.wait_for(published.wait(), timeout=2)
+    worker.cancel()
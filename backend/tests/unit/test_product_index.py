@@ -0,0 +1,129 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import pytest
+from app.clients.jumpseller_client import jumpseller_client
+from app.core.config import settings
+from app.services import dashboard_service as dashboard_module
+from app.services.cache import TTLCache
+from app.services.dashboard_service import DashboardService
+from app.services.product_index import ProductIndex
+from app.services.webhooks import WebhookProcessor
+
+
+def product(product_id, status="active", stock=50, alert=False, categories=(), unlimited=False):
+    return {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "status": status,
+        "stock": stock,
+        "stock_notification": alert,
+        "stock_unlimited": unlimited,
+        "categories": [{"id": c, "name": f"Category {c}"} for c in categories],
+    }
+
+
+def make_index():
+    index = ProductIndex(low_stock_threshold=5)
+    index.replace_all([
+        product(1, stock=100, categories=(10,)),
+        product(2, stock=3, alert=True, categories=(10, 20)),
+        product(3, status="disabled", stock=0, categories=(20,)),
+        product(4, stock=0, unlimited=True),
+    ])
+    return index
+
+
+def test_summary_and_secondary_indexes():
+    index = make_index()
+
+    assert index.is_ready
+    assert index.summary() == {"total_products": 4, "active_products": 3, "low_stock_alerts": 1}
+    assert {p.id for p in index.in_category(10)} == {1, 2}
+    assert [p.id for p in index.with_status("disabled")] == [3]
+    # Unlimited stock is never low; out of stock comes first
+    assert [p.id for p in index.low_stock()] == [3, 2]
+    assert [p.id for p in index.low_stock(include_out_of_stock=False)] == [2]
+
+
+def test_upsert_moves_product_between_indexes():
+    index = make_index()
+    source = product(2, status="disabled", stock=40, categories=(30,))
+
+    previous = index.upsert(source)
+    source["stock"] = 0  # the index holds its own decoded record
+
+    assert previous.stock == 3
+    assert index.summary() == {"total_products": 4, "active_products": 2, "low_stock_alerts": 0}
+    assert [p.id for p in index.in_category(10)] == [1]
+    assert [p.id for p in index.in_category(30)] == [2]
+    assert [p.id for p in index.low_stock()] == [3]
+
+    index.remove(3)
+    assert index.low_stock() == []
+    assert len(index) == 3
+
+
+@pytest.mark.asyncio
+async def test_load_reads_every_page(monkeypatch):
+    async def pages(page_size=None):
+        yield [product(1), product(2)]
+        yield [product(3, stock=1)]
+
+    monkeypatch.setattr(jumpseller_client, "iter_product_pages", pages)
+    index = ProductIndex(low_stock_threshold=5)
+
+    assert await index.load() == 3
+    assert [p.id for p in index.low_stock()] == [3]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reads_products_from_a_ready_index(monkeypatch):
+    async def no_pages(page_size=None):
+        raise AssertionError("the catalog should not be scanned")
+        yield []
+
+    monkeypatch.setattr(dashboard_module, "product_index", make_index())
+    monkeypatch.setattr(settings, "product_index_enabled", True)
+    monkeypatch.setattr(jumpseller_client, "iter_product_pages", no_pages)
+
+    summary = await DashboardService()._get_products_summary()
+    assert summary == {"total_products": 4, "active_products": 3, "low_stock_alerts": 1}
+    assert DashboardService._upstream_endpoints() == (
+        () if settings.order_store_enabled else ("orders", "orders/count")
+    )
+
+
+@pytest.mark.asyncio
+async def test_low_stock_scans_the_catalog_when_the_index_is_disabled(monkeypatch):
+    async def pages(page_size=None):
+        yield [product(1, stock=100), product(2, stock=3), product(3, stock=0)]
+        yield [product(4, stock=80, alert=True), product(5, stock=0, unlimited=True)]
+
+    unused = ProductIndex()
+    monkeypatch.setattr(dashboard_module, "product_index", unused)
+    monkeypatch.setattr(settings, "product_index_enabled", False)
+    monkeypatch.setattr(settings, "product_low_stock_threshold", 5)
+    monkeypatch.setattr(jumpseller_client, "iter_product_pages", pages)
+
+    result = await DashboardService().get_low_stock_products(limit=2)
+
+    assert result["threshold"] == 5
+    assert [p["id"] for p in result["products"]] == [3, 2]
+    assert not unused.is_ready
+
+
+def test_webhook_update_uses_index_for_previous_state():
+    cache = TTLCache(ttl=60)
+    stats = {"products": {"total_products": 4, "active_products": 3, "low_stock_alerts": 1}}
+    cache.backend.set("daily", ({"stats": stats}, cache._clock()))
+    index = make_index()
+    processor = WebhookProcessor(cache, index=index)
+
+    # Product 2 was never seen in an event, but the index knows its old state
+    processor.handle("product_updated", "evt-1", {"product": product(2, stock=40)})
+
+    assert cache.backend.get("daily")[0]["stats"]["products"] == {
+        "total_products": 4, "active_products": 3, "low_stock_alerts": 0
+    }
+    assert index.summary()["low_stock_alerts"] == 0
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+import pytest
+from app.clients import message_bus, pubsub_client
+
+
+class FakePublisher:
+    """Resolves publish futures from a background thread, like the real client."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.messages = []
+
+    def publish(self, topic, data):
+        self.messages.append(data)
+        future = Future()
+        message_id = str(len(self.messages))
+        threading.Timer(self.delay, future.set_result, args=(message_id,)).start()
+        return future
+
+
+@pytest.mark.asyncio
+async def test_async_publish_does_not_block_the_event_loop(monkeypatch):
+    fake = FakePublisher()
+    bus = message_bus.PubSubMessageBus()
+    bus._connected = True
+    bus.publisher = fake
+    bus.topic_path = "projects/p/topics/t"
+    monkeypatch.setattr(message_bus, "_message_bus", bus)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.ensure_future(ticker())
+    result = await pubsub_client.publish_vendor_registration_async({"name": "Test Vendor"})
+    task.cancel()
+
+    assert result == {"alert_id": "1", "data_id": "2"}
+    assert fake.messages[0] == b"New seller registration!"
+    # Both messages were queued before waiting, and the loop kept running
+    assert ticks > 3
+
+
+@pytest.mark.asyncio
+async def test_first_async_publish_connects_off_the_event_loop(monkeypatch):
+    bus = message_bus.PubSubMessageBus()
+
+    def slow_connect():
+        time.sleep(0.1)
+        bus._connected = True
+        bus.publisher = FakePublisher(delay=0)
+        bus.topic_path = "projects/p/topics/t"
+
+    monkeypatch.setattr(bus, "connect", slow_connect)
+    monkeypatch.setattr(message_bus, "_message_bus", bus)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.ensure_future(ticker())
+    result = await pubsub_client.publish_vendor_registration_async({"name": "Test Vendor"})
+    task.cancel()
+
+    assert result == {"alert_id": "1", "data_id": "2"}
+    assert ticks > 3
@@ -0,0 +1,47 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from app.clients.rate_limit import TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_a_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Queued callers are released one every 1 / rate seconds
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_pause_holds_every_request():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock)
+    bucket.pause(5)
+    assert bucket.reserve() == 5.0
+    clock.now = 5.0
+    assert bucket.reserve() == 0.0
+
+
+def test_pause_is_capped():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock, max_pause=10)
+    bucket.pause(3600)
+    assert bucket.reserve() == 10.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime
+
+from app.clients.records import OrderRecord, OrderStatus, ProductRecord, decode_orders
+from app.core.orders import STATUS_OTHER, STATUS_PENDING, STATUS_REVENUE
+
+ORDERS = [
+    {"id": 1, "status": "Paid", "created_at": "2025-06-15 10:00:00 UTC", "total": "20.5",
+     "customer": {"name": "Ana"}, "line_items": [{}, {}]},
+    {"id": 2, "status": "pending", "date": "2025-06-14 09:30:00 UTC",
+     "line_items": [{"price": "5", "quantity": 2}]},
+    {"id": 3, "status": "Cancelled", "created_at": "not a date", "totals": {"grand_total": 7}},
+    {"id": 4, "status": "refunded", "created_at": "2025-06-13 08:00:00 UTC", "total": 3},
+]
+
+
+def test_order_record_resolves_fields_once():
+    record = OrderRecord.from_api(ORDERS[1])
+
+    assert record.status is OrderStatus.PENDING
+    assert record.status.code == STATUS_PENDING
+    assert record.created_at == datetime(2025, 6, 14, 9, 30)
+    assert record.created_at_raw == "2025-06-14 09:30:00 UTC"
+    assert record.total == 10.0
+    assert record.customer_name == "Unknown"
+    assert record.items_count == 1
+    assert not hasattr(record, "__dict__")
+
+
+def test_status_normalization_keeps_the_original_text():
+    records, _ = decode_orders(ORDERS)
+
+    assert [r.status for r in records] == [
+        OrderStatus.PAID, OrderStatus.PENDING, OrderStatus.CANCELED, OrderStatus.OTHER
+    ]
+    assert records[0].status.code == STATUS_REVENUE
+    assert records[3].status.code == STATUS_OTHER
+    assert records[3].status_text == "refunded"
+
+
+def test_decode_orders_counts_unparsed_dates():
+    records, unparsed = decode_orders(ORDERS)
+
+    assert unparsed == 1
+    assert records[2].created_at is None
+    assert records[2].total == 7.0
+    assert records[0].created_at == datetime(2025, 6, 15, 10, 0)
+
+
+def test_product_record_tolerates_malformed_fields():
+    record = ProductRecord.from_api({
+        "id": 9, "status": "active", "stock": "n/a", "price": None,
+        "stock_notification": 1, "categories": [{"id": 3}, 4],
+    })
+
+    assert record.active
+    assert record.stock == 0
+    assert record.price == 0.0
+    assert record.stock_notification is True
+    assert record.category_ids == (3, 4)
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from app.core.config import settings
+from app.core.telemetry import TraceSamplingPolicy
+
+
+def make_policy(rand=lambda: 0.5):
+    routes = {"/api/vendor/register": 1.0, "/api/vendor/dashboard": 0.01, "/api/health": 0.0}
+    return TraceSamplingPolicy(default_rate=0.1, error_rate=0.5, route_rates=routes, rand=rand)
+
+
+def context(path, parent_sampled=None):
+    return {"asgi_scope": {"path": path}, "parent_sampled": parent_sampled}
+
+
+def transaction(path, status):
+    return {"request": {"url": f"http://backend{path}"}, "tags": {"http.status_code": str(status)}}
+
+
+def test_sampler_uses_the_longest_matching_route():
+    policy = make_policy()
+    assert policy.traces_sampler(context("/api/vendor/register")) == 1.0
+    assert policy.traces_sampler(context("/api/health")) == 0.0
+    assert policy.traces_sampler(context("/api/vendor/sales-chart")) == 0.5
+    # Dashboard requests are sampled at the error rate up front...
+    assert policy.traces_sampler(context("/api/vendor/dashboard")) == 0.5
+    # ...and an upstream decision is always kept
+    assert policy.traces_sampler(context("/api/health", parent_sampled=True)) == 1.0
+
+
+def test_successful_transactions_are_thinned_back_to_the_route_rate():
+    policy = make_policy(rand=lambda: 0.5)
+    assert policy.before_send_transaction(transaction("/api/vendor/dashboard", 200), {}) is None
+    assert policy.before_send_transaction(transaction("/api/vendor/dashboard", 503), {}) is not None
+    assert policy.before_send_transaction(transaction("/api/vendor/register", 201), {}) is not None
+
+    lucky = make_policy(rand=lambda: 0.001)
+    # 0.001 < 0.01 / 0.5: kept, so successes end up at 1% overall
+    assert lucky.before_send_transaction(transaction("/api/vendor/dashboard", 200), {}) is not None
+
+
+def test_environment_defaults_and_overrides(monkeypatch):
+    monkeypatch.setattr(settings, "sentry_traces_default_rate", None)
+    monkeypatch.setattr(settings, "sentry_traces_route_rates", {"/api/vendor/dashboard": 0.2})
+    development = TraceSamplingPolicy.from_settings("development")
+    production = TraceSamplingPolicy.from_settings("production")
+    assert development.rate_for_path("/api/vendor/sales-chart") == 1.0
+    assert production.rate_for_path("/api/vendor/sales-chart") == 0.05
+    assert production.rate_for_path("/api/vendor/dashboard") == 0.2
+    assert production.rate_for_path("/api/health") == 0.0
@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime
+from app.core.timestamps import TimestampBatchParser, parse_order_date
+
+
+def test_parse_order_date_handles_jumpseller_and_iso_formats():
+    assert parse_order_date("2025-11-03 14:20:05 UTC") == datetime(2025, 11, 3, 14, 20, 5)
+    assert parse_order_date("2025-11-03 14:20:05") == datetime(2025, 11, 3, 14, 20, 5)
+    assert parse_order_date("2025-11-03T14:20:05+01:00") == datetime(2025, 11, 3, 13, 20, 5)
+    assert parse_order_date("2025-11-03") == datetime(2025, 11, 3)
+    assert parse_order_date("2025-13-03 14:20:05 UTC") is None
+    assert parse_order_date("") is None
+    assert parse_order_date(None) is None
+
+
+def test_batch_parser_counts_missing_and_failed_values():
+    parse = TimestampBatchParser()
+    values = ["2025-11-03 14:20:05 UTC", "2025-11-03T10:00:00", "", None, "garbage"]
+    results = [parse(v) for v in values]
+    assert results[:2] == [datetime(2025, 11, 3, 14, 20, 5), datetime(2025, 11, 3, 10, 0)]
+    assert (parse.parsed, parse.missing, parse.failed) == (2, 2, 1)
+
+
+def test_batch_parser_detects_iso_batches():
+    parse = TimestampBatchParser()
+    assert parse("2025-11-03T14:20:05Z") == datetime(2025, 11, 3, 14, 20, 5)
+    # Later Jumpseller-shaped values in an ISO batch still parse
+    assert parse("2025-11-03 14:20:05 UTC") == datetime(2025, 11, 3, 14, 20, 5)
+    assert parse.failed == 0
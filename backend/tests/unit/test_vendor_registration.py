@@ -26,6 +26,13 @@ def test_register_vendor_success(monkeypatch):
         return MockResponse()
 
     monkeypatch.setattr("httpx.AsyncClient.post", mock_post)
+    # Keep the outbox in memory instead of the configured database
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import create_engine
+    from app.services.outbox import registration_outbox
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    monkeypatch.setattr(registration_outbox, "_engine", engine)
+    monkeypatch.setattr(registration_outbox, "_table_ready", False)
     payload = {
         "name": "Test Vendor",
         "owner_name": "Test Owner",
@@ -37,3 +44,25 @@ def test_register_vendor_success(monkeypatch):
     response = client.post("/api/vendor/register", json=payload)
     assert response.status_code in (200, 201)
     assert "message" in response.json()
+    assert registration_outbox.stats()["queue_depth"] == 1
+
+def test_dashboard_stream_is_newline_delimited_json(monkeypatch):
+    import json
+    from app.api import vendors
+
+    async def fake_sections(period):
+        yield "store_info", {"name": "Test Store"}
+        yield "done", {"stale": False}
+
+    monkeypatch.setattr(vendors.dashboard_service, "iter_dashboard_sections", fake_sections)
+    response = client.get("/api/vendor/dashboard/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"section": "store_info", "data": {"name": "Test Store"}},
+        {"section": "done", "data": {"stale": False}},
+    ]
+
+    sse = client.get("/api/vendor/dashboard/stream?format=sse")
+    assert sse.text.startswith("event: store_info\ndata: ")
@@ -0,0 +1,159 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.services.aggregates import SalesChart
+from app.services.cache import TTLCache
+from app.services.product_index import ProductIndex
+from app.services.webhooks import WebhookProcessor
+
+NOW = datetime(2025, 6, 15, 12, 0, 0)
+
+
+def make_payload():
+    return {
+        "stats": {
+            "orders": {"new_orders": 1, "total_orders": 10, "monthly_revenue": 100.0, "currency": "EUR"},
+            "products": {"total_products": 3, "active_products": 2, "low_stock_alerts": 0},
+        },
+        "recent_orders": [
+            {"id": 1, "customer": "A", "total": 20, "status": "pending",
+             "date": (NOW - timedelta(hours=2)).strftime('%Y-%m-%d %H:%M:%S UTC'), "items_count": 1},
+        ],
+        "sales_chart": SalesChart("daily", now=NOW).result(),
+    }
+
+
+def make_processor():
+    cache = TTLCache(ttl=60)
+    cache.backend.set("daily", (make_payload(), cache._clock()))
+    return WebhookProcessor(cache, index=ProductIndex()), cache
+
+
+def cached(cache):
+    return cache.backend.get("daily")[0]
+
+
+def order(order_id, status, total, hours_ago):
+    created = (NOW - timedelta(hours=hours_ago)).strftime('%Y-%m-%d %H:%M:%S UTC')
+    return {"order": {"id": order_id, "status": status, "total": total, "created_at": created,
+                      "customer": {"name": "B"}, "line_items": [{}]}}
+
+
+def rebuild(cache):
+    # What the next dashboard request would put back after an invalidation
+    cache.backend.set("daily", (make_payload(), cache._clock()))
+
+
+def test_new_paid_order_updates_stats_chart_and_recent_orders():
+    processor, cache = make_processor()
+    assert processor.handle("order_created", "evt-1", order(2, "paid", 50, 1), now=NOW) == "processed"
+
+    payload = cached(cache)
+    assert payload["stats"]["orders"]["total_orders"] == 11
+    assert payload["stats"]["orders"]["monthly_revenue"] == 150.0
+    assert sum(point["sales"] for point in payload["sales_chart"]) == 50
+    assert payload["recent_orders"][0]["id"] == 2
+
+    # Same event again, or redelivered under a new id: nothing changes
+    assert processor.handle("order_created", "evt-1", order(2, "paid", 50, 1), now=NOW) == "duplicate"
+    assert processor.handle("order_created", "evt-2", order(2, "paid", 50, 1), now=NOW) == "processed"
+    assert cached(cache)["stats"]["orders"] == payload["stats"]["orders"]
+
+
+def test_update_for_an_unknown_order_drops_the_cached_entry():
+    processor, cache = make_processor()
+    processor.handle("order_updated", "evt-1", order(99, "paid", 20, 200), now=NOW)
+    assert cache.backend.get("daily") is None
+
+
+def test_known_order_paid_updates_stats_chart_and_recent_orders():
+    processor, cache = make_processor()
+    processor.handle("order_created", "evt-1", order(2, "pending", 50, 1), now=NOW)
+    rebuild(cache)
+    assert processor.handle("order_paid", "evt-2", order(2, "paid", 50, 1), now=NOW) == "processed"
+
+    payload = cached(cache)
+    assert payload["stats"]["orders"]["total_orders"] == 10
+    assert payload["stats"]["orders"]["new_orders"] == 0
+    assert payload["stats"]["orders"]["monthly_revenue"] == 150.0
+    assert sum(point["sales"] for point in payload["sales_chart"]) == 50
+    assert payload["recent_orders"][0]["id"] == 2
+
+    # Same event again, or redelivered under a new id: nothing changes
+    assert processor.handle("order_paid", "evt-2", order(2, "paid", 50, 1), now=NOW) == "duplicate"
+    assert processor.handle("order_paid", "evt-3", order(2, "paid", 50, 1), now=NOW) == "processed"
+    assert cached(cache)["stats"]["orders"] == payload["stats"]["orders"]
+
+
+def test_remembered_state_uses_the_resolved_total():
+    processor, cache = make_processor()
+    paid = order(3, "paid", None, 1)
+    del paid["order"]["total"]
+    paid["order"]["line_items"] = [{"price": "15", "quantity": 2}]
+    processor.handle("order_paid", "evt-1", paid, now=NOW)
+    rebuild(cache)
+
+    canceled = order(3, "canceled", None, 1)
+    canceled["order"]["totals"] = {"grand_total": 30}
+    processor.handle("order_canceled", "evt-2", canceled, now=NOW)
+
+    assert cached(cache)["stats"]["orders"]["monthly_revenue"] == 70.0
+    assert sum(point["sales"] for point in cached(cache)["sales_chart"]) == -30
+
+
+def test_malformed_records_are_ignored():
+    processor, cache = make_processor()
+    for event, data in (("order_created", {"order": None}), ("order_updated", {"order": [1, 2]}),
+                        ("product_updated", {"product": "7"}), ("order_paid", {"order": {"status": "paid"}})):
+        assert processor.handle(event, None, data, now=NOW) == "ignored"
+    assert cached(cache) == make_payload()
+
+
+def test_recent_order_entry_tolerates_odd_shapes():
+    processor, cache = make_processor()
+    processor.handle("order_created", "evt-1", order(2, "pending", 50, 1), now=NOW)
+    rebuild(cache)
+    odd = order(2, "paid", 50, 1)
+    odd["order"].update(customer="Walk-in", line_items=None)
+    processor.handle("order_paid", "evt-2", odd, now=NOW)
+
+    entry = cached(cache)["recent_orders"][0]
+    assert (entry["id"], entry["customer"], entry["items_count"]) == (2, "Walk-in", 0)
+
+
+def test_product_events_adjust_counts():
+    processor, cache = make_processor()
+    product = {"product": {"id": 7, "status": "active", "stock_notification": False}}
+    processor.handle("product_created", "evt-1", product)
+    product["product"]["stock_notification"] = True
+    processor.handle("product_updated", "evt-2", product)
+
+    assert cached(cache)["stats"]["products"] == {"total_products": 4, "active_products": 3, "low_stock_alerts": 1}
+
+    # An update for a product neither seen nor indexed can't be applied as a delta
+    processor.handle("product_updated", "evt-3", {"product": {"id": 8, "status": "active"}})
+    assert cache.backend.get("daily") is None
+
+
+def test_endpoint_rejects_bad_signatures(monkeypatch):
+    from app.core.config import settings
+    from app.main import app
+    monkeypatch.setattr(settings, "jumpseller_webhook_secret", "s3cret")
+    client = TestClient(app)
+    body = json.dumps({"product": {"id": 1, "status": "active"}}).encode()
+    signature = base64.b64encode(hmac.new(b"s3cret", body, hashlib.sha256).digest()).decode()
+
+    bad = client.post("/api/webhooks/jumpseller", content=body,
+                      headers={"Jumpseller-Hmac-Sha256": "nope", "Jumpseller-Event": "product_created"})
+    assert bad.status_code == 401
+
+    good = client.post("/api/webhooks/jumpseller", content=body,
+                       headers={"Jumpseller-Hmac-Sha256": signature, "Jumpseller-Event": "product_created"})
+    assert good.status_code == 200
+    assert good.json()["status"] in ("processed", "duplicate")